@@ -6,8 +6,46 @@ bl_info = {
 
 import bpy
 import bmesh
+import os
+import gc
+import sys
 import math
+import json
+import shutil
+import tempfile
+import subprocess
+import socket
+import queue
+import threading
+import argparse
+import hashlib
+import hmac
+import secrets
+import time
+import numpy as np
+from collections import deque, namedtuple
+from mathutils import Matrix, Vector
+from mathutils.bvhtree import BVHTree
 
+# Steps available in the operation pipeline
+PIPELINE_STEP_ITEMS = [
+    ('CLEAN', "Clean Geometry", "Merge by distance, delete loose and dissolve degenerate geometry"),
+    ('REMOVE_DOUBLES', "Remove Doubles", "Merge vertices by distance"),
+    ('SSHARPEN', "SSharpen", "Detect sharp edges, add a weight bevel and auto smooth"),
+    ('UV', "Smart UV Unwrap", "Smart UV Project with the island margin"),
+    ('SMOOTH', "Shade Smooth", "Shade smooth, with auto smooth when enabled"),
+    ('BEVEL', "Bevel", "Add a bevel modifier"),
+    ('DECIMATE', "Decimate", "Add a decimate modifier with the decimate ratio"),
+]
+
+# One step of the operation pipeline
+class EasyOpsPipelineStep(bpy.types.PropertyGroup):
+    step: bpy.props.EnumProperty(
+        name="Step",
+        description="EasyOps operation run by this step",
+        items=PIPELINE_STEP_ITEMS,
+        default='CLEAN'
+    )
 
 # Custom Properties (can be modified by the user)
 class EasyUtilsProperties(bpy.types.PropertyGroup):
@@ -23,6 +61,34 @@ class EasyUtilsProperties(bpy.types.PropertyGroup):
         min=0.0,
         max=1.0
     )
+    use_parallel_uv: bpy.props.BoolProperty(
+        name="Parallel Unwrap",
+        description="Unwrap meshes in background Blender processes, one per core. Results are the same as unwrapping here",
+        default=False
+    )
+    uv_workers: bpy.props.IntProperty(
+        name="Workers",
+        description="Number of background processes for Parallel Unwrap (0 uses all cores)",
+        default=0,
+        min=0
+    )
+    texel_density: bpy.props.FloatProperty(
+        name="Texel Density (px/m)",
+        description="Pixels per meter every UV island is scaled to",
+        default=1024.0,
+        min=0.001
+    )
+    texture_size: bpy.props.IntProperty(
+        name="Texture Size",
+        description="Size in pixels of the square texture the density is measured on",
+        default=2048,
+        min=1
+    )
+    normalize_after_unwrap: bpy.props.BoolProperty(
+        name="Normalize After Unwrap",
+        description="Normalize the texel density right after Smart UV Unwrap",
+        default=False
+    )
     enable_auto_smooth: bpy.props.BoolProperty(
         name="Enable Auto Smooth",
         description="Enable or disable Auto Smooth after applying Shade Smooth",
@@ -35,6 +101,308 @@ class EasyUtilsProperties(bpy.types.PropertyGroup):
         min=0.0,
         max=180.0
     )
+    weighted_normal_mode: bpy.props.EnumProperty(
+        name="Weighting",
+        description="How the faces around a vertex are weighted when baking weighted normals",
+        items=[
+            ('FACE_AREA_ANGLE', "Area and Angle", "Weight by face area times corner angle"),
+            ('FACE_AREA', "Face Area", "Weight by face area, large faces dominate"),
+            ('CORNER_ANGLE', "Corner Angle", "Weight by the angle of the face corner at the vertex"),
+        ],
+        default='FACE_AREA_ANGLE'
+    )
+    multi_bevel_width: bpy.props.FloatProperty(
+        name="Width",
+        description="Bevel width for all selected objects",
+        default=0.02,
+        min=0.0,
+        subtype='DISTANCE',
+        update=lambda self, context: push_modifier_value(context, 'BEVEL', "width", self.multi_bevel_width)
+    )
+    multi_bevel_segments: bpy.props.IntProperty(
+        name="Segments",
+        description="Bevel segments for all selected objects",
+        default=3,
+        min=1,
+        max=100,
+        update=lambda self, context: push_modifier_value(context, 'BEVEL', "segments", self.multi_bevel_segments)
+    )
+    multi_bevel_profile: bpy.props.FloatProperty(
+        name="Profile",
+        description="Bevel profile for all selected objects",
+        default=0.7,
+        min=0.0,
+        max=1.0,
+        update=lambda self, context: push_modifier_value(context, 'BEVEL', "profile", self.multi_bevel_profile)
+    )
+    multi_decimate_ratio: bpy.props.FloatProperty(
+        name="Ratio",
+        description="Decimate ratio for all selected objects",
+        default=0.5,
+        min=0.0,
+        max=1.0,
+        update=lambda self, context: push_modifier_value(context, 'DECIMATE', "ratio", self.multi_decimate_ratio)
+    )
+    boolean_health_action: bpy.props.EnumProperty(
+        name="Input Check",
+        description="Check boolean targets and cutters for non-manifold geometry, flipped normals and overlaps before adding modifiers",
+        items=[
+            ('OFF', "Off", "Don't check the inputs"),
+            ('WARN', "Warn", "Report problems but add the modifiers anyway"),
+            ('FIX', "Fix", "Recalculate bad normals, report remaining problems and add the modifiers anyway"),
+            ('STRICT', "Fix and Skip", "Recalculate bad normals and skip inputs that are still unsafe"),
+        ],
+        default='FIX'
+    )
+    memory_budget_mb: bpy.props.IntProperty(
+        name="Memory Budget (MB)",
+        description="Estimated memory the evaluated output of Bevel, Boolean and Smart Apply may use (0 disables the check)",
+        default=4096,
+        min=0
+    )
+    memory_guard_action: bpy.props.EnumProperty(
+        name="Over Budget",
+        description="What to do with work that doesn't fit in the memory budget",
+        items=[
+            ('REFUSE', "Refuse", "Skip objects that don't fit in the budget"),
+            ('CHUNK', "Chunk", "Disable new modifiers that don't fit in the viewport, and run Smart Apply in chunks that fit"),
+        ],
+        default='CHUNK'
+    )
+    bulk_union_solver: bpy.props.EnumProperty(
+        name="Bulk Union Solver",
+        description="Boolean solver used by Bulk Union",
+        items=[
+            ('EXACT', "Exact", "Exact solver, handles overlapping geometry"),
+            ('FAST', "Fast", "Faster solver for simple inputs"),
+        ],
+        default='EXACT'
+    )
+    bulk_union_spatial: bpy.props.BoolProperty(
+        name="Spatial Pairing",
+        description="Pair neighbouring objects first (Z-order of their centers) so intermediate meshes stay small",
+        default=True
+    )
+    seam_weld_distance: bpy.props.FloatProperty(
+        name="Weld Distance",
+        description="Maximum distance between border vertices of different objects that are welded",
+        default=0.001,
+        min=0.0,
+        subtype='DISTANCE'
+    )
+    seam_weld_mode: bpy.props.EnumProperty(
+        name="Weld Mode",
+        description="How coincident border vertices of different objects are welded",
+        items=[
+            ('SNAP', "Snap", "Move coincident vertices to their average position and keep the objects separate"),
+            ('MERGE', "Merge", "Join touching objects and merge the coincident vertices (objects Cluster Join can join, with the same materials and visibility; others are snapped)"),
+        ],
+        default='SNAP'
+    )
+    cluster_cell_size: bpy.props.FloatProperty(
+        name="Cell Size",
+        description="Size of the grid cells Cluster Join groups objects by",
+        default=10.0,
+        min=0.001,
+        subtype='DISTANCE'
+    )
+    cluster_by_material: bpy.props.BoolProperty(
+        name="By Material",
+        description="Only join objects with the same materials. Otherwise objects with the same number of slots are joined and take the materials of the first",
+        default=True
+    )
+    cluster_by_collection: bpy.props.BoolProperty(
+        name="By Collection",
+        description="Only join objects of the same collection",
+        default=True
+    )
+    decimate_mode: bpy.props.EnumProperty(
+        name="Decimate Mode",
+        description="How Smart Decimate chooses the ratio of each object",
+        items=[
+            ('RATIO', "Ratio", "Use the same ratio for every object"),
+            ('BUDGET', "Budget", "Split a total triangle budget between objects"),
+            ('ERROR', "Max Error", "Decimate each object as far as possible while staying within a distance of the original"),
+        ],
+        default='RATIO'
+    )
+    decimate_ratio: bpy.props.FloatProperty(
+        name="Decimate Ratio",
+        description="Ratio used by Smart Decimate in Ratio mode",
+        default=0.5,
+        min=0.0,
+        max=1.0
+    )
+    triangle_budget: bpy.props.IntProperty(
+        name="Triangle Budget",
+        description="Total number of triangles for the selected/all mesh objects",
+        default=1000000,
+        min=1
+    )
+    budget_tolerance: bpy.props.FloatProperty(
+        name="Budget Tolerance",
+        description="Accepted relative difference between the result and the triangle budget",
+        default=0.05,
+        min=0.001,
+        max=0.5
+    )
+    screen_size_weight: bpy.props.FloatProperty(
+        name="Screen Size Weight",
+        description="How much larger on-screen objects keep more triangles (0 gives every object the same ratio)",
+        default=0.5,
+        min=0.0,
+        max=2.0
+    )
+    max_deviation: bpy.props.FloatProperty(
+        name="Max Deviation",
+        description="Largest allowed distance between the decimated and the original surface",
+        default=0.01,
+        min=0.0,
+        subtype='DISTANCE'
+    )
+    error_decimate_type: bpy.props.EnumProperty(
+        name="Search",
+        description="Decimate setting searched in Max Error mode",
+        items=[
+            ('COLLAPSE', "Ratio", "Search the lowest collapse ratio"),
+            ('DISSOLVE', "Planar Angle", "Search the highest planar dissolve angle"),
+        ],
+        default='COLLAPSE'
+    )
+    search_precision: bpy.props.FloatProperty(
+        name="Search Precision",
+        description="Stop searching once the remaining interval is smaller than this fraction of the full range",
+        default=0.02,
+        min=0.001,
+        max=0.5
+    )
+    lod_mode: bpy.props.EnumProperty(
+        name="LOD Mode",
+        description="How the LOD levels are interpreted",
+        items=[
+            ('RATIO', "Ratios", "Each level is a ratio of the source triangle count"),
+            ('TRIANGLES', "Triangles", "Each level is a triangle count"),
+        ],
+        default='RATIO'
+    )
+    lod_levels: bpy.props.StringProperty(
+        name="LOD Levels",
+        description="Comma separated ratios or triangle counts, one per LOD starting with LOD0",
+        default="1.0, 0.5, 0.25, 0.125"
+    )
+    use_geometry_cache: bpy.props.BoolProperty(
+        name="Use Geometry Cache",
+        description="Reuse evaluated geometry stored on disk for Smart Apply and Freeze, across sessions and files",
+        default=False
+    )
+    geometry_cache_size: bpy.props.IntProperty(
+        name="Cache Size (MB)",
+        description="Maximum disk size of the geometry cache, least recently used entries are removed first",
+        default=2048,
+        min=16
+    )
+    pipeline_steps: bpy.props.CollectionProperty(type=EasyOpsPipelineStep)
+    pipeline_step_index: bpy.props.IntProperty(
+        name="Active Step",
+        default=0
+    )
+    pipeline_preset_name: bpy.props.StringProperty(
+        name="Preset Name",
+        description="Name used when saving the pipeline as a preset",
+        default="Standard Prep"
+    )
+    use_streaming: bpy.props.BoolProperty(
+        name="Streaming Mode",
+        description="Process targets in bounded batches and free temporary data between batches",
+        default=False
+    )
+    stream_batch_size: bpy.props.IntProperty(
+        name="Batch Size",
+        description="Maximum number of objects processed per batch in streaming mode",
+        default=256,
+        min=1
+    )
+    use_chunked_processing: bpy.props.BoolProperty(
+        name="Chunk Giant Meshes",
+        description="Run Clean Geometry and Remove Doubles on very large meshes in spatial chunks, in parallel background processes",
+        default=False
+    )
+    chunk_min_vertices: bpy.props.IntProperty(
+        name="Min Vertices",
+        description="Only meshes with at least this many vertices are processed in chunks",
+        default=2000000,
+        min=1
+    )
+    chunk_grid: bpy.props.IntProperty(
+        name="Grid",
+        description="Number of chunks along each axis of the mesh bounds",
+        default=4,
+        min=1,
+        max=16
+    )
+    chunk_overlap: bpy.props.FloatProperty(
+        name="Overlap",
+        description="Width of the band of neighbouring faces every chunk also processes, as a fraction of the chunk size",
+        default=0.05,
+        min=0.0,
+        max=0.5
+    )
+    chunk_workers: bpy.props.IntProperty(
+        name="Workers",
+        description="Number of background Blender processes for chunks (0 = one per CPU core)",
+        default=0,
+        min=0
+    )
+    use_journal: bpy.props.BoolProperty(
+        name="Job Journal",
+        description="Record completed objects with a content hash and the parameters, so interrupted batches can be resumed",
+        default=False
+    )
+    resume_from_journal: bpy.props.BoolProperty(
+        name="Resume",
+        description="Skip objects the journal lists as done, as long as their content and the parameters haven't changed",
+        default=True
+    )
+    journal_path: bpy.props.StringProperty(
+        name="Journal",
+        description="Journal file. Empty uses a file next to the .blend file",
+        default="",
+        subtype='FILE_PATH'
+    )
+    journal_flush_interval: bpy.props.FloatProperty(
+        name="Flush Interval (s)",
+        description="How often completed entries are written to disk",
+        default=5.0,
+        min=0.0
+    )
+    stream_memory_limit: bpy.props.IntProperty(
+        name="Memory Limit (MB)",
+        description="Batches shrink while the process uses more memory than this (0 disables the limit)",
+        default=0,
+        min=0
+    )
+    profiler_live: bpy.props.BoolProperty(
+        name="Live Update",
+        description="Refresh profiled objects whenever their evaluated geometry changes",
+        default=True
+    )
+    profiler_sort: bpy.props.EnumProperty(
+        name="Sort By",
+        description="Order of the profiler hot-list",
+        items=[
+            ('FACES', "Faces", "Sort by evaluated face count"),
+            ('TIME', "Time", "Sort by total modifier evaluation time"),
+            ('GROWTH', "Growth", "Sort by evaluated/original face count ratio"),
+        ],
+        default='FACES'
+    )
+    profiler_rows: bpy.props.IntProperty(
+        name="Rows",
+        description="Number of objects shown in the profiler hot-list",
+        default=10,
+        min=1,
+        max=100
+    )
 
 # Panel in a Custom "Easy Utils" and "EasyOps" Tab
 class EasyUtilsPanel(bpy.types.Panel):
@@ -52,17 +420,50 @@ class EasyUtilsPanel(bpy.types.Panel):
         layout.operator("object.easy_auto_rename", text="Auto Rename")
         layout.separator()  # Adds a visual separator between buttons   
         layout.operator("object.easy_ssharpen", text="SSharpen")
+        row = layout.row(align=True)
+        row.prop(props, "weighted_normal_mode", text="")
+        row.operator("object.easy_weighted_normals", text="Weighted Normals")
         # Quick actions buttons
         layout.label(text="Quick Actions:")
         layout.prop(props, "island_margin")  # Add island margin setting for Smart UV Unwrap
+        layout.prop(props, "use_parallel_uv")
+        if props.use_parallel_uv:
+            layout.prop(props, "uv_workers")
         layout.operator("object.easy_smart_uv_unwrap", text="Smart UV Unwrap")
+        row = layout.row(align=True)
+        row.prop(props, "texel_density")
+        row.prop(props, "texture_size")
+        layout.prop(props, "normalize_after_unwrap")
+        layout.operator("object.easy_normalize_texel_density", text="Normalize Texel Density")
 
         # Shade Smooth and Auto Smooth Options
-        layout.prop(props, "enable_auto_smooth")  # Checkbox for Auto Smooth
+        # Blender 4.1+ bakes the sharp edges since auto smooth no longer exists
+        auto_smooth_text = "Bake Sharp Edges by Angle" if bpy.app.version >= (4, 1, 0) else "Enable Auto Smooth"
+        layout.prop(props, "enable_auto_smooth", text=auto_smooth_text)  # Checkbox for Auto Smooth
         layout.prop(props, "auto_smooth_angle")  # Angle input for Auto Smooth
         layout.operator("object.easy_shade_smooth", text="Shade Smooth")
         layout.operator("object.easy_remove_doubles", text="Remove Doubles (Merge by Distance)")
 
+        layout.separator()
+        layout.prop(props, "use_streaming")
+        if props.use_streaming:
+            layout.prop(props, "stream_batch_size")
+            layout.prop(props, "stream_memory_limit")
+        layout.prop(props, "use_chunked_processing")
+        if props.use_chunked_processing:
+            layout.prop(props, "chunk_min_vertices")
+            row = layout.row(align=True)
+            row.prop(props, "chunk_grid")
+            row.prop(props, "chunk_overlap")
+            layout.prop(props, "chunk_workers")
+        layout.prop(props, "use_journal")
+        if props.use_journal:
+            layout.prop(props, "resume_from_journal")
+            layout.prop(props, "journal_path")
+            row = layout.row(align=True)
+            row.prop(props, "journal_flush_interval")
+            row.operator("object.easy_clear_journal", text="", icon='TRASH')
+
 # New EasyOps Panel
 class EasyOpsPanel(bpy.types.Panel):
     bl_label = "EasyOps"
@@ -73,41 +474,69 @@ class EasyOpsPanel(bpy.types.Panel):
 
     def draw(self, context):
         layout = self.layout
-        obj = context.object
+        props = context.scene.easy_utils_props
 
         layout.label(text="Bevel & Boolean Operations")
+        row = layout.row(align=True)
+        row.prop(props, "memory_budget_mb")
+        row.prop(props, "memory_guard_action", text="")
+        faces, size = get_output_estimate(context)
+        row = layout.row()
+        row.alert = bool(props.memory_budget_mb) and size > props.memory_budget_mb * 1024 * 1024
+        row.label(text=f"Estimated output: {faces:,} faces, {format_memory(size)}")
         layout.operator("object.easy_bevel", text="Bevel")
+        layout.prop(props, "boolean_health_action")
         layout.operator("object.easy_boolean_difference", text="Boolean Difference")
         layout.operator("object.easy_boolean_union", text="Boolean Union")
         layout.operator("object.easy_boolean_intersect", text="Boolean Intersect")
+        row = layout.row(align=True)
+        row.prop(props, "bulk_union_solver", text="")
+        row.prop(props, "bulk_union_spatial", text="", icon='GRID')
+        row.operator("object.easy_boolean_union_bulk", text="Bulk Union")
+        row = layout.row(align=True)
+        row.prop(props, "cluster_cell_size")
+        row.prop(props, "cluster_by_material", text="", icon='MATERIAL')
+        row.prop(props, "cluster_by_collection", text="", icon='OUTLINER_COLLECTION')
+        row = layout.row(align=True)
+        row.operator("object.easy_cluster_join", text="Cluster Join")
+        row.operator("object.easy_cluster_split", text="Split Clusters")
+        row = layout.row(align=True)
+        row.prop(props, "seam_weld_distance")
+        row.prop(props, "seam_weld_mode", text="")
+        layout.operator("object.easy_weld_seams", text="Weld Seams")
         layout.separator()
         
         layout.label(text="Modifiers and Cleanup")
+        layout.prop(props, "decimate_mode")
+        if props.decimate_mode == 'BUDGET':
+            layout.prop(props, "triangle_budget")
+            layout.prop(props, "budget_tolerance")
+            layout.prop(props, "screen_size_weight")
+        elif props.decimate_mode == 'ERROR':
+            layout.prop(props, "max_deviation")
+            layout.prop(props, "error_decimate_type")
+            layout.prop(props, "search_precision")
+        else:
+            layout.prop(props, "decimate_ratio")
         layout.operator("object.easy_smart_decimate", text="Smart Decimate")
+        layout.prop(props, "lod_mode")
+        layout.prop(props, "lod_levels")
+        layout.operator("object.easy_generate_lods", text="Generate LODs")
         layout.operator("object.easy_sharpen_edges", text="Flat Shading")
         layout.operator("object.easy_clean_geometry", text="Clean Geometry")
         layout.operator("object.easy_smart_apply", text="Smart Apply")
+        row = layout.row(align=True)
+        row.operator("object.easy_freeze", text="Freeze")
+        row.operator("object.easy_unfreeze", text="Unfreeze")
+        layout.prop(props, "use_geometry_cache")
+        if props.use_geometry_cache:
+            row = layout.row(align=True)
+            row.prop(props, "geometry_cache_size")
+            row.operator("object.easy_clear_geometry_cache", text="", icon='TRASH')
+        layout.operator("object.easy_revert_batch", text="Revert Last Batch", icon='LOOP_BACK')
         
         # Modifier adjustment section
-        if obj and obj.type == 'MESH':
-            layout.separator()
-            layout.label(text="Modifier Controls")
-
-            # Check for existing bevel modifier
-            for modifier in obj.modifiers:
-                if modifier.type == 'BEVEL':
-                    box = layout.box()
-                    box.label(text="Bevel Modifier")
-                    box.prop(modifier, "width")
-                    box.prop(modifier, "segments")
-                    box.prop(modifier, "profile")
-
-            # Check for existing decimate modifier
-            for modifier in obj.modifiers:
-                if modifier.type == 'DECIMATE':
-                    box = layout.box()
-                    box.label(text="Decimate Modifier")
-                    box.prop(modifier, "ratio")
+        draw_modifier_controls(layout, context)
 
 # Utility function to get all mesh objects if none are selected
 def get_target_objects(context):
@@ -117,6 +546,256 @@ def get_target_objects(context):
         return [obj for obj in context.scene.objects if obj.type == 'MESH']
     return selected_objects
 
+# Session caches are plain dicts used as LRU caches: dicts keep insertion order, so a hit moves
+# the entry to the end and the oldest entries are dropped first
+def cache_get(cache, key, default=None):
+    if key not in cache:
+        return default
+    value = cache.pop(key)
+    cache[key] = value
+    return value
+
+def cache_put(cache, key, value, limit):
+    cache.pop(key, None)
+    cache[key] = value
+    while len(cache) > limit:
+        del cache[next(iter(cache))]
+
+# Drop the entries of a cache keyed by object name whose object no longer exists
+def prune_object_cache(cache):
+    for name in [name for name in cache if name not in bpy.data.objects]:
+        del cache[name]
+
+# --- Streaming ---
+
+# Memory counters of the Blender process on Windows, or None
+def get_windows_memory_counters():
+    import ctypes
+    from ctypes import wintypes
+
+    class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+        _fields_ = [
+            ("cb", wintypes.DWORD),
+            ("PageFaultCount", wintypes.DWORD),
+            ("PeakWorkingSetSize", ctypes.c_size_t),
+            ("WorkingSetSize", ctypes.c_size_t),
+            ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+            ("PagefileUsage", ctypes.c_size_t),
+            ("PeakPagefileUsage", ctypes.c_size_t),
+        ]
+
+    counters = PROCESS_MEMORY_COUNTERS()
+    counters.cb = ctypes.sizeof(counters)
+    process = ctypes.windll.kernel32.GetCurrentProcess()
+    if ctypes.windll.psapi.GetProcessMemoryInfo(process, ctypes.byref(counters), counters.cb):
+        return counters
+    return None
+
+# A "Vm..." line of /proc/self/status in bytes, or None
+def read_proc_status(field):
+    try:
+        with open("/proc/self/status", 'r') as status:
+            for line in status:
+                if line.startswith(field + ":"):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+# Current resident memory of the Blender process in bytes, or None when it can't be read.
+# Used for the memory limit, so it must go down again when memory is freed.
+def get_memory_usage():
+    if sys.platform.startswith("linux"):
+        return read_proc_status("VmRSS")
+    if sys.platform == "win32":
+        counters = get_windows_memory_counters()
+        return counters.WorkingSetSize if counters else None
+    # Other platforms only expose the lifetime peak, which can't tell freed memory apart
+    return None
+
+# Highest resident memory the Blender process reached so far in bytes, or None
+def get_memory_peak():
+    if sys.platform.startswith("linux"):
+        return read_proc_status("VmHWM")
+    if sys.platform == "win32":
+        counters = get_windows_memory_counters()
+        return counters.PeakWorkingSetSize if counters else None
+    try:
+        import resource
+    except ImportError:
+        return None
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+def format_memory(size):
+    if size is None:
+        return "unknown"
+    return f"{size / (1024 * 1024):,.0f} MB"
+
+# Meshes without users, by pointer. Taken when a run starts, so the orphans the user already had
+# (e.g. meshes kept around for later) are told apart from the ones the run left behind.
+def get_orphan_meshes():
+    return {mesh.as_pointer() for mesh in bpy.data.meshes if mesh.users == 0}
+
+# Remove the meshes a run left without users (temporary and replaced meshes), then run the garbage collector
+def purge_orphan_meshes(kept):
+    for mesh in [mesh for mesh in bpy.data.meshes if mesh.users == 0 and mesh.as_pointer() not in kept]:
+        bpy.data.meshes.remove(mesh)
+    gc.collect()
+
+def new_stream_stats():
+    return {"peak": get_memory_peak(), "batches": 0, "orphans": get_orphan_meshes()}
+
+# Yield the objects in bounded batches when streaming is enabled, freeing temporary data in between.
+# When the memory limit is exceeded the batch size is halved, and it grows back once there is room again.
+def stream_batches(objects, props, stats):
+    if not props.use_streaming:
+        stats["batches"] += 1
+        yield objects
+        return
+
+    limit = props.stream_memory_limit * 1024 * 1024
+    size = props.stream_batch_size
+    index = 0
+    while index < len(objects):
+        batch = objects[index:index + size]
+        index += len(batch)
+        stats["batches"] += 1
+        yield batch
+
+        purge_orphan_meshes(stats["orphans"])
+        stats["peak"] = get_memory_peak()
+        usage = get_memory_usage()
+        if usage is None:
+            continue
+        if limit and usage > limit:
+            size = max(1, size // 2)
+        elif limit and usage < limit // 2:
+            size = min(props.stream_batch_size, size * 2)
+
+# Summary appended to operator reports when streaming
+def stream_report(props, stats):
+    report = ""
+    if props.use_streaming:
+        stats["peak"] = get_memory_peak()
+        report += f" ({stats['batches']} batches, peak memory {format_memory(stats['peak'])})"
+    if "journal" in stats:
+        report += f" ({stats['journal']['skipped']} already done)"
+    return report
+
+# --- Job Journal ---
+# Completed objects (or files, for the worker service) are appended to a JSON lines journal
+# with a hash of their content after the operation and the operation parameters. A resumed run
+# skips entries whose content and parameters still match, so interrupted batches continue where
+# they stopped.
+
+def get_journal_path(props):
+    if props.journal_path:
+        return bpy.path.abspath(props.journal_path)
+    if bpy.data.filepath:
+        return os.path.splitext(bpy.data.filepath)[0] + ".easyops_journal.jsonl"
+    return os.path.join(bpy.utils.resource_path('USER'), "easyops_journal.jsonl")
+
+# Read the completed entries when resuming. Lines are buffered and written on every flush.
+def open_journal(path, resume, flush_interval=5.0):
+    entries = {}
+    if resume and os.path.exists(path):
+        with open(path, 'r') as journal_file:
+            for line in journal_file:
+                try:
+                    entry = json.loads(line)
+                # A crash can leave a partially written last line
+                except ValueError:
+                    continue
+                entries[(entry["operation"], entry["key"])] = (entry["hash"], entry["params"])
+    return {"path": path, "entries": entries, "pending": [], "interval": flush_interval,
+            "flushed": time.monotonic(), "skipped": 0}
+
+def get_params_signature(params):
+    return json.dumps(params, sort_keys=True, default=str)
+
+def is_journaled(journal, operation, key, content_hash, params):
+    return journal["entries"].get((operation, key)) == (content_hash, get_params_signature(params))
+
+def record_journal(journal, operation, key, content_hash, params):
+    signature = get_params_signature(params)
+    journal["entries"][(operation, key)] = (content_hash, signature)
+    journal["pending"].append(json.dumps({"operation": operation, "key": key, "hash": content_hash,
+                                          "params": signature, "time": time.time()}))
+    if time.monotonic() - journal["flushed"] >= journal["interval"]:
+        flush_journal(journal)
+
+# Append the buffered lines and make sure they are on disk
+def flush_journal(journal):
+    if journal["pending"]:
+        os.makedirs(os.path.dirname(journal["path"]) or ".", exist_ok=True)
+        with open(journal["path"], 'a') as journal_file:
+            journal_file.write("\n".join(journal["pending"]) + "\n")
+            journal_file.flush()
+            os.fsync(journal_file.fileno())
+        journal["pending"] = []
+    journal["flushed"] = time.monotonic()
+
+# Journal key and content hash of a batch item: an object (mesh and modifier stack) or a
+# (mesh, owner) pair of the mesh level operations
+def get_journal_state(item):
+    hasher = hashlib.sha1()
+    if isinstance(item, tuple):
+        hash_mesh(item[0], hasher)
+        return f"mesh:{item[0].name}", hasher.hexdigest()
+    hash_mesh(item.data, hasher)
+    for modifier in item.modifiers:
+        hasher.update(repr(get_modifier_signature(modifier)).encode())
+    return f"object:{item.name}", hasher.hexdigest()
+
+def hash_file(path):
+    hasher = hashlib.sha1()
+    with open(path, 'rb') as source:
+        for block in iter(lambda: source.read(1024 * 1024), b""):
+            hasher.update(block)
+    return hasher.hexdigest()
+
+# Skip the items completed by an earlier run, then record every batch once it is done
+def journal_batches(items, journal, operation, params, stream=None):
+    pending = []
+    for item in items:
+        if is_journaled(journal, operation, *get_journal_state(item), params):
+            journal["skipped"] += 1
+        else:
+            pending.append(item)
+
+    for batch in (stream(pending) if stream else [pending]):
+        yield batch
+        for item in batch:
+            record_journal(journal, operation, *get_journal_state(item), params)
+    flush_journal(journal)
+
+# Batch stream of an operator: streaming batches, wrapped by the journal when it is enabled
+def get_operator_stream(props, stats, operation, params):
+    def stream(objects):
+        return stream_batches(objects, props, stats)
+    if not props.use_journal:
+        return stream
+    journal = open_journal(get_journal_path(props), props.resume_from_journal, props.journal_flush_interval)
+    stats["journal"] = journal
+    return lambda objects: journal_batches(objects, journal, operation, params, stream)
+
+class OBJECT_OT_easy_clear_journal(bpy.types.Operator):
+    bl_label = "Clear Journal"
+    bl_idname = "object.easy_clear_journal"
+    bl_description = "Deletes the job journal, so the next run processes everything again."
+
+    def execute(self, context):
+        path = get_journal_path(context.scene.easy_utils_props)
+        if os.path.exists(path):
+            os.remove(path)
+        self.report({'INFO'}, "Job journal cleared.")
+        return {'FINISHED'}
+
 # Operator to Apply Shade Smooth to All Meshes
 class OBJECT_OT_easy_shade_smooth(bpy.types.Operator):
     bl_label = "Shade Smooth"
@@ -125,25 +804,247 @@ class OBJECT_OT_easy_shade_smooth(bpy.types.Operator):
 
     def execute(self, context):
         props = context.scene.easy_utils_props
-        target_objects = get_target_objects(context)
-        
-        for obj in target_objects:
-            if obj.type == 'MESH':
-                obj.select_set(True)
-                bpy.context.view_layer.objects.active = obj
-                
-                # Apply Shade Smooth
-                bpy.ops.object.shade_smooth()
-
-                # Optionally enable Auto Smooth and set the Auto Smooth Angle
-                if props.enable_auto_smooth:
-                    obj.data.use_auto_smooth = True
-                    # Convert the Auto Smooth Angle to radians
-                    obj.data.auto_smooth_angle = math.radians(props.auto_smooth_angle)
-
-                obj.select_set(False)
-
-        self.report({'INFO'}, "Shade Smooth applied to selected/all mesh objects.")
+        if context.mode != 'OBJECT':
+            bpy.ops.object.mode_set(mode='OBJECT')
+
+        batch = begin_undo_batch("Shade Smooth")
+        stats = new_stream_stats()
+        auto_smooth = {"auto_smooth": props.enable_auto_smooth, "angle": props.auto_smooth_angle}
+        # Optionally enables Auto Smooth (baked sharp edges on Blender 4.1+)
+        shade_smooth(get_target_objects(context), props.enable_auto_smooth, props.auto_smooth_angle, batch,
+                     get_operator_stream(props, stats, "Shade Smooth", auto_smooth))
+
+        self.report({'INFO'}, f"Shade Smooth applied to selected/all mesh objects.{stream_report(props, stats)}")
+        return {'FINISHED'}
+
+# --- Parallel Smart UV ---
+
+# Unwrap one object on its own, with all of its faces selected
+def smart_uv_unwrap_single(context, obj, island_margin):
+    for other in context.selected_objects:
+        other.select_set(False)
+    obj.select_set(True)
+    context.view_layer.objects.active = obj
+    bpy.ops.object.mode_set(mode='EDIT')
+    bpy.ops.mesh.select_all(action='SELECT')
+    bpy.ops.uv.smart_project(island_margin=island_margin)
+    bpy.ops.object.mode_set(mode='OBJECT')
+
+def write_uvs(mesh, uv):
+    uv_layer = mesh.uv_layers.active or mesh.uv_layers.new(name="UVMap")
+    uv_layer.data.foreach_set("uv", uv)
+    mesh.update()
+
+# Spread item indices over the workers by weight, heaviest first, so shards take about as long
+def split_shards(weights, worker_count):
+    shards = [[] for _ in range(worker_count)]
+    loads = [0] * worker_count
+    order = sorted(range(len(weights)), key=lambda index: (-weights[index], index))
+    for index in order:
+        lightest = loads.index(min(loads))
+        shards[lightest].append(index)
+        loads[lightest] += weights[index]
+    return [shard for shard in shards if shard]
+
+# Run items (dicts of arrays) through background Blender processes that run this file in the
+# given worker mode. Results are handed to `collect(index, path)` as soon as a worker writes
+# them, while the other workers are still running. Returns the indices without a result.
+def run_background_jobs(mode, items, weights, settings, worker_count, collect):
+    job_dir = tempfile.mkdtemp(prefix="easyops_job_")
+    processes = []
+    pending = set(range(len(items)))
+    try:
+        for index, arrays in enumerate(items):
+            np.savez(os.path.join(job_dir, f"item_{index}.npz"), **arrays)
+
+        for shard, indices in enumerate(split_shards(weights, worker_count)):
+            with open(os.path.join(job_dir, f"shard_{shard}.json"), 'w') as f:
+                json.dump({"items": indices, **settings}, f)
+            processes.append(subprocess.Popen(
+                [bpy.app.binary_path, "-b", "--factory-startup", "--python", os.path.abspath(__file__),
+                 "--", mode, job_dir, str(shard)],
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL))
+
+        while pending:
+            running = any(process.poll() is None for process in processes)
+            for index in sorted(pending):
+                path = os.path.join(job_dir, f"result_{index}.npz")
+                if os.path.exists(path):
+                    collect(index, path)
+                    pending.discard(index)
+            if not running:
+                break
+            time.sleep(0.05)
+    finally:
+        for process in processes:
+            if process.poll() is None:
+                process.kill()
+        shutil.rmtree(job_dir, ignore_errors=True)
+    return sorted(pending)
+
+# Write a worker result so the main process never sees a partial file
+def write_background_result(job_dir, index, arrays):
+    path = os.path.join(job_dir, f"result_{index}.npz")
+    with open(path + ".part", 'wb') as f:
+        np.savez(f, **arrays)
+    os.replace(path + ".part", path)
+
+# Unwrap the objects in background Blender processes. Each worker writes the UV loop array of
+# an object as soon as it is done, so results are applied while the other workers are still running.
+# Returns the objects that couldn't be unwrapped by a worker.
+def smart_uv_unwrap_parallel(objects, island_margin, worker_count):
+    items = []
+    for obj in objects:
+        arrays = read_mesh_arrays(obj.data)
+        arrays["matrix"] = np.array(obj.matrix_world, dtype=np.float32)
+        items.append(arrays)
+
+    def collect(index, path):
+        with np.load(path) as data:
+            write_uvs(objects[index].data, data["uv"])
+
+    missing = run_background_jobs("--easyops-uv-worker", items, [len(obj.data.loops) for obj in objects],
+                                  {"island_margin": island_margin}, worker_count, collect)
+    return [objects[index] for index in missing]
+
+# Entry point of a background worker: rebuild each mesh of the shard, unwrap it exactly like
+# smart_uv_unwrap_single and write its UVs back to the job directory
+def run_uv_worker(job_dir, shard):
+    with open(os.path.join(job_dir, f"shard_{shard}.json")) as f:
+        job = json.load(f)
+    bpy.ops.object.select_all(action='DESELECT')
+
+    for index in job["items"]:
+        with np.load(os.path.join(job_dir, f"item_{index}.npz")) as data:
+            arrays = {name: data[name] for name in data.files}
+        mesh = bpy.data.meshes.new(f"EasyOpsUV{index}")
+        write_mesh_arrays(mesh, arrays)
+        obj = bpy.data.objects.new(mesh.name, mesh)
+        obj.matrix_world = Matrix(arrays["matrix"].tolist())
+        bpy.context.scene.collection.objects.link(obj)
+        smart_uv_unwrap_single(bpy.context, obj, job["island_margin"])
+
+        uv = np.empty(len(mesh.loops) * 2, dtype=np.float32)
+        mesh.uv_layers.active.data.foreach_get("uv", uv)
+        write_background_result(job_dir, index, {"uv": uv})
+        bpy.data.objects.remove(obj)
+        bpy.data.meshes.remove(mesh)
+
+# --- Texel Density ---
+
+# Index of the loop that follows every loop around its polygon
+def get_next_loops(loop_starts, loop_totals):
+    loop_polygons = np.repeat(np.arange(len(loop_starts)), loop_totals)
+    next_loops = np.arange(len(loop_polygons)) + 1
+    wraps = next_loops == (loop_starts + loop_totals)[loop_polygons]
+    next_loops[wraps] = loop_starts[loop_polygons[wraps]]
+    return next_loops
+
+# Connected component label of every element given pairs of linked elements,
+# by min-label propagation with pointer jumping. Labels are compacted to 0..n-1.
+def label_components(count, first, second):
+    labels = np.arange(count)
+    while len(first):
+        low = np.minimum(labels[first], labels[second])
+        updated = labels.copy()
+        np.minimum.at(updated, first, low)
+        np.minimum.at(updated, second, low)
+        updated = updated[updated]
+        if np.array_equal(updated, labels):
+            break
+        labels = updated
+    return np.unique(labels, return_inverse=True)[1]
+
+# UV island of every face: faces are in the same island when they share an edge
+# and their UVs match at both ends of it
+def get_uv_islands(mesh, uv, loop_starts, loop_totals, loop_polygons):
+    loop_verts = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", loop_verts)
+    loop_edges = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("edge_index", loop_edges)
+    next_loops = get_next_loops(loop_starts, loop_totals)
+
+    order = np.argsort(loop_edges, kind='stable')
+    shared = loop_edges[order[:-1]] == loop_edges[order[1:]]
+    first, second = order[:-1][shared], order[1:][shared]
+    # Faces with flipped normals walk the shared edge in the same direction
+    same_direction = loop_verts[first] == loop_verts[second]
+    second_start = np.where(same_direction, second, next_loops[second])
+    second_end = np.where(same_direction, next_loops[second], second)
+    connected = (np.all(np.abs(uv[first] - uv[second_start]) < 1e-5, axis=1)
+                 & np.all(np.abs(uv[next_loops[first]] - uv[second_end]) < 1e-5, axis=1))
+    return label_components(len(loop_starts), loop_polygons[first[connected]], loop_polygons[second[connected]])
+
+# Scale every UV island of the object around its center so it covers `density` pixels per
+# world space meter on a square texture of `texture_size` pixels. Returns the number of islands.
+def normalize_texel_density(obj, density, texture_size):
+    mesh = obj.data
+    if mesh.uv_layers.active is None or not len(mesh.polygons):
+        return 0
+    uv = np.empty(len(mesh.loops) * 2, dtype=np.float32)
+    mesh.uv_layers.active.data.foreach_get("uv", uv)
+    uv = uv.reshape(-1, 2).astype(np.float64)
+    loop_starts = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get("loop_start", loop_starts)
+    loop_totals = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get("loop_total", loop_totals)
+    loop_polygons = get_loop_polygon_indices(mesh)
+    face_islands = get_uv_islands(mesh, uv, loop_starts, loop_totals, loop_polygons)
+    island_count = int(face_islands.max()) + 1
+
+    co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", co)
+    co = co.reshape(-1, 3) @ np.array(obj.matrix_world.to_3x3(), dtype=np.float64).T
+    loop_verts = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", loop_verts)
+
+    mesh.calc_loop_triangles()
+    tri_loops = np.empty(len(mesh.loop_triangles) * 3, dtype=np.int32)
+    mesh.loop_triangles.foreach_get("loops", tri_loops)
+    tri_loops = tri_loops.reshape(-1, 3)
+    tri_polygons = np.empty(len(mesh.loop_triangles), dtype=np.int32)
+    mesh.loop_triangles.foreach_get("polygon_index", tri_polygons)
+
+    points = co[loop_verts[tri_loops]]
+    surface_area = 0.5 * np.linalg.norm(np.cross(points[:, 1] - points[:, 0], points[:, 2] - points[:, 0]), axis=1)
+    uvs = uv[tri_loops]
+    edge_a, edge_b = uvs[:, 1] - uvs[:, 0], uvs[:, 2] - uvs[:, 0]
+    uv_area = 0.5 * np.abs(edge_a[:, 0] * edge_b[:, 1] - edge_a[:, 1] * edge_b[:, 0])
+
+    tri_islands = face_islands[tri_polygons]
+    island_surface = np.bincount(tri_islands, weights=surface_area, minlength=island_count)
+    island_uv = np.bincount(tri_islands, weights=uv_area, minlength=island_count)
+    # density = sqrt(uv area) * texture size / sqrt(surface area)
+    valid = (island_uv > 1e-12) & (island_surface > 1e-12)
+    scale = np.ones(island_count)
+    scale[valid] = density * np.sqrt(island_surface[valid]) / (texture_size * np.sqrt(island_uv[valid]))
+
+    loop_islands = face_islands[loop_polygons]
+    loop_counts = np.bincount(loop_islands, minlength=island_count)
+    center = np.stack([np.bincount(loop_islands, weights=uv[:, axis], minlength=island_count) for axis in range(2)], axis=1)
+    center /= np.maximum(loop_counts, 1)[:, None]
+    uv = center[loop_islands] + (uv - center[loop_islands]) * scale[loop_islands, None]
+    write_uvs(mesh, uv.astype(np.float32).ravel())
+    return island_count
+
+# Operator to normalize the texel density of all UV islands
+class OBJECT_OT_easy_normalize_texel_density(bpy.types.Operator):
+    bl_label = "Normalize Texel Density"
+    bl_idname = "object.easy_normalize_texel_density"
+    bl_description = "Scales every UV island of the selected mesh objects to the same texel density. If no objects are selected, applies to all mesh objects."
+
+    def execute(self, context):
+        if context.mode != 'OBJECT':
+            bpy.ops.object.mode_set(mode='OBJECT')
+
+        props = context.scene.easy_utils_props
+        batch = begin_undo_batch("Normalize Texel Density")
+        stats = new_stream_stats()
+        params = {"density": props.texel_density, "texture_size": props.texture_size}
+        result = texel_density(get_target_objects(context), props.texel_density, props.texture_size, batch,
+                               get_operator_stream(props, stats, "Normalize Texel Density", params))
+
+        self.report({'INFO'}, f"Texel density set to {props.texel_density:g} px/m on {result.count} islands.{stream_report(props, stats)}")
         return {'FINISHED'}
 
 # Operator to Perform Smart UV Unwrap on All Meshes
@@ -155,16 +1056,21 @@ class OBJECT_OT_easy_smart_uv_unwrap(bpy.types.Operator):
     def execute(self, context):
         props = context.scene.easy_utils_props
         island_margin = props.island_margin
-        target_objects = get_target_objects(context)
-        
-        for obj in target_objects:
-            if obj.type == 'MESH':
-                bpy.context.view_layer.objects.active = obj
-                bpy.ops.object.mode_set(mode='EDIT')
-                bpy.ops.uv.smart_project(island_margin=island_margin)
-                bpy.ops.object.mode_set(mode='OBJECT')
-
-        self.report({'INFO'}, f"Smart UV Unwrap applied with {island_margin} margin.")
+        if context.mode != 'OBJECT':
+            bpy.ops.object.mode_set(mode='OBJECT')
+
+        batch = begin_undo_batch("Smart UV Unwrap")
+        stats = new_stream_stats()
+        result = uv_unwrap(get_target_objects(context), island_margin, props.uv_workers if props.use_parallel_uv else None,
+                           props.normalize_after_unwrap, props.texel_density, props.texture_size, batch,
+                           get_operator_stream(props, stats, "Smart UV Unwrap", {
+                               "island_margin": island_margin, "normalize": props.normalize_after_unwrap,
+                               "density": props.texel_density, "texture_size": props.texture_size}))
+
+        message = f"Smart UV Unwrap applied with {island_margin} margin."
+        if result.count:
+            message += f" {result.count} meshes were unwrapped here after a worker failed."
+        self.report({'INFO'}, f"{message}{stream_report(props, stats)}")
         return {'FINISHED'}
 
 # Operator to Auto-Rename Meshes and Objects
@@ -175,23 +1081,295 @@ class OBJECT_OT_easy_auto_rename(bpy.types.Operator):
 
     def execute(self, context):
         props = context.scene.easy_utils_props
-        rename_prefix = props.rename_prefix
-        
-        n = 1
-        target_objects = get_target_objects(context)
-        sorted_objects = sorted(target_objects, key=lambda obj: obj.location.z, reverse=True)
-        
-        for obj in sorted_objects:
-            if obj.type == 'MESH':
-                obj.name = f"{rename_prefix}{n}"
-                obj.data.name = f"{rename_prefix}{n}"
-                n += 1
+        auto_rename(get_target_objects(context), props.rename_prefix)
 
         self.report({'INFO'}, "Objects and meshes renamed successfully.")
         return {'FINISHED'}
 
+# --- Multi-Object Modifier Editing ---
+
+# Settings of EasyOps modifiers editable across the selection: (modifier type, attribute, property name)
+MANAGED_MODIFIER_SETTINGS = [
+    ('BEVEL', "width", "multi_bevel_width"),
+    ('BEVEL', "segments", "multi_bevel_segments"),
+    ('BEVEL', "profile", "multi_bevel_profile"),
+    ('DECIMATE', "ratio", "multi_decimate_ratio"),
+]
+
+# Summary of the managed modifiers on the selection, rebuilt only when the selection
+# changes or a depsgraph update touches object geometry
+_modifier_summary_cache = {"key": None, "summary": None, "skipped": (None, [])}
+
+# Mesh objects edited by the modifier controls: the selection, or the active object
+def get_edit_targets(context):
+    targets = [obj for obj in context.selected_objects if obj.type == 'MESH']
+    if not targets and context.object and context.object.type == 'MESH':
+        targets = [context.object]
+    return targets
+
+def get_modifier_summary(context):
+    targets = get_edit_targets(context)
+    key = tuple(obj.name for obj in targets)
+    if _modifier_summary_cache["key"] == key:
+        return _modifier_summary_cache["summary"]
+
+    modifiers = {'BEVEL': [], 'DECIMATE': []}
+    ranges = {}
+    values = {}
+    # Single pass over every modifier stack
+    for obj in targets:
+        for modifier in obj.modifiers:
+            if modifier.type not in modifiers:
+                continue
+            modifiers[modifier.type].append((obj.name, modifier.name))
+            for modifier_type, attribute, _ in MANAGED_MODIFIER_SETTINGS:
+                if modifier_type != modifier.type:
+                    continue
+                value = getattr(modifier, attribute)
+                low, high = ranges.get(attribute, (value, value))
+                ranges[attribute] = (min(low, value), max(high, value))
+                values.setdefault(attribute, value)
+
+    summary = {"objects": len(targets), "modifiers": modifiers, "ranges": ranges, "values": values}
+    _modifier_summary_cache["key"] = key
+    _modifier_summary_cache["summary"] = summary
+    # The panel rebuilds the summary while drawing, where properties can't be written
+    if not bpy.app.timers.is_registered(sync_multi_modifier_fields):
+        bpy.app.timers.register(sync_multi_modifier_fields)
+    return summary
+
+# Show the first target's modifier values in the multi_* fields. They are written as ID properties,
+# so their update callbacks don't push the value to every other modifier.
+def sync_multi_modifier_fields():
+    summary = _modifier_summary_cache["summary"]
+    props = getattr(bpy.context.scene, "easy_utils_props", None)
+    if summary is None or props is None:
+        return None
+    changed = False
+    for _, attribute, prop_name in MANAGED_MODIFIER_SETTINGS:
+        value = summary["values"].get(attribute)
+        if value is not None and getattr(props, prop_name) != value:
+            props[prop_name] = value
+            changed = True
+    if changed:
+        for window in bpy.context.window_manager.windows:
+            for area in window.screen.areas:
+                if area.type == 'VIEW_3D':
+                    area.tag_redraw()
+    return None
+
+def invalidate_modifier_summary():
+    _modifier_summary_cache["key"] = None
+
+# Write one value to every managed modifier of a type on the selection.
+# Setting the properties only tags the objects, so the depsgraph evaluates all of them
+# together on the next update instead of once per object. Modifiers that were renamed or removed
+# since the summary was built are skipped and listed under the controls.
+def push_modifier_value(context, modifier_type, attribute, value):
+    summary = get_modifier_summary(context)
+    skipped = []
+    for obj_name, modifier_name in summary["modifiers"][modifier_type]:
+        obj = bpy.data.objects.get(obj_name)
+        modifier = obj.modifiers.get(modifier_name) if obj else None
+        if modifier is None:
+            skipped.append(f"{obj_name}/{modifier_name}")
+        elif getattr(modifier, attribute) != value:
+            setattr(modifier, attribute, value)
+    _modifier_summary_cache["skipped"] = (_modifier_summary_cache["key"], skipped)
+    invalidate_modifier_summary()
+    return skipped
+
+# Draw the modifier controls, either the active object's modifiers or the aggregated selection
+def draw_modifier_controls(layout, context):
+    props = context.scene.easy_utils_props
+    summary = get_modifier_summary(context)
+    if summary["objects"] == 0:
+        return
+
+    layout.separator()
+    layout.label(text="Modifier Controls")
+
+    if summary["objects"] == 1:
+        obj = get_edit_targets(context)[0]
+        for modifier in obj.modifiers:
+            if modifier.type == 'BEVEL':
+                box = layout.box()
+                box.label(text="Bevel Modifier")
+                box.prop(modifier, "width")
+                box.prop(modifier, "segments")
+                box.prop(modifier, "profile")
+            elif modifier.type == 'DECIMATE':
+                box = layout.box()
+                box.label(text="Decimate Modifier")
+                box.prop(modifier, "ratio")
+        return
+
+    for modifier_type, label in (('BEVEL', "Bevel Modifiers"), ('DECIMATE', "Decimate Modifiers")):
+        count = len(summary["modifiers"][modifier_type])
+        if count == 0:
+            continue
+        box = layout.box()
+        box.label(text=f"{label} ({count} on {summary['objects']} objects)")
+        for setting_type, attribute, prop_name in MANAGED_MODIFIER_SETTINGS:
+            if setting_type != modifier_type:
+                continue
+            low, high = summary["ranges"][attribute]
+            row = box.row()
+            row.prop(props, prop_name)
+            row.label(text="Mixed" if low != high else f"= {low:g}")
+
+    key, skipped = _modifier_summary_cache["skipped"]
+    if skipped and key == _modifier_summary_cache["key"]:
+        layout.label(text=f"Skipped {len(skipped)} renamed or removed modifiers: {', '.join(skipped[:3])}", icon='ERROR')
+
 # --- EasyOps Section ---
 
+# --- Output Size Estimate ---
+
+# Approximate bytes per element while a stack is evaluated: the mesh itself plus the
+# BMesh copy that bevel and boolean work on
+ELEMENT_BYTES = {"verts": 96, "edges": 96, "loops": 80, "faces": 96}
+
+def get_mesh_counts(mesh):
+    return {"verts": len(mesh.vertices), "edges": len(mesh.edges), "loops": len(mesh.loops), "faces": len(mesh.polygons)}
+
+def estimate_bytes(counts):
+    return int(sum(counts[key] * size for key, size in ELEMENT_BYTES.items()))
+
+def scale_counts(counts, factor):
+    return {key: value * factor for key, value in counts.items()}
+
+# Element counts after a modifier, from the counts before it. Rough upper bounds, without evaluating anything.
+def estimate_modifier_output(obj, modifier, counts, depth):
+    if modifier.type == 'BEVEL':
+        beveled = counts["edges"]
+        if modifier.limit_method in {'ANGLE', 'WEIGHT'} and len(obj.data.edges):
+            if modifier.limit_method == 'ANGLE':
+                mask = compute_sharp_edge_mask(obj.data, modifier.angle_limit)
+            else:
+                # Only edges with a bevel weight are beveled, like the ones SSharpen marks
+                mask = get_edge_float_attribute(obj.data, "bevel_weight_edge") > 0.0
+            beveled *= np.count_nonzero(mask) / len(obj.data.edges)
+        # Every beveled edge becomes a strip of quads and adds corners to its neighbours
+        added = modifier.segments * beveled
+        return {"verts": counts["verts"] + 2 * added, "edges": counts["edges"] + 3 * added,
+                "loops": counts["loops"] + 6 * added, "faces": counts["faces"] + added}
+    if modifier.type == 'BOOLEAN':
+        if getattr(modifier, "operand_type", 'OBJECT') == 'COLLECTION':
+            operands = list(modifier.collection.all_objects) if modifier.collection else []
+        else:
+            operands = [modifier.object] if modifier.object else []
+        # The result holds at most both inputs plus the cut lines
+        result = dict(counts)
+        for operand in operands:
+            if operand.type == 'MESH' and operand != obj:
+                for key, value in estimate_object_counts(operand, depth=depth + 1).items():
+                    result[key] += value
+        return result
+    if modifier.type == 'SUBSURF':
+        result = dict(counts)
+        for _ in range(modifier.levels):
+            result = {"verts": result["verts"] + result["edges"] + result["faces"],
+                      "edges": 2 * result["edges"] + result["loops"],
+                      "loops": 4 * result["loops"], "faces": result["loops"]}
+        return result
+    if modifier.type == 'ARRAY' and modifier.fit_type == 'FIXED_COUNT':
+        return scale_counts(counts, modifier.count)
+    if modifier.type == 'MIRROR':
+        return scale_counts(counts, 2 ** sum(modifier.use_axis))
+    if modifier.type == 'SOLIDIFY':
+        return {"verts": 2 * counts["verts"], "edges": 2 * counts["edges"] + counts["verts"],
+                "loops": 2 * counts["loops"] + 4 * counts["edges"], "faces": 2 * counts["faces"] + counts["edges"]}
+    if modifier.type == 'DECIMATE' and modifier.decimate_type == 'COLLAPSE':
+        return scale_counts(counts, modifier.ratio)
+    return counts
+
+# Estimated counts of the object's evaluated mesh, following the cutters of its booleans
+def estimate_object_counts(obj, modifier_filter=None, depth=0):
+    counts = get_mesh_counts(obj.data)
+    # Cutters of cutters are rarely deep, this also stops cyclic setups
+    if depth > 4:
+        return counts
+    for modifier in obj.modifiers:
+        if modifier.show_viewport and (modifier_filter is None or modifier_filter(modifier)):
+            counts = estimate_modifier_output(obj, modifier, counts, depth)
+    return counts
+
+# Split the objects by the memory budget: objects that fit, objects that only fit on their own
+# (deferred) and objects over the budget by themselves (refused). A budget of 0 accepts everything.
+def split_by_memory_budget(objects, estimates, budget_mb):
+    budget = budget_mb * 1024 * 1024
+    accepted, deferred, refused = [], [], []
+    used = 0
+    for obj in objects:
+        size = estimates[obj]
+        if budget and size > budget:
+            refused.append(obj)
+        elif budget and used + size > budget:
+            deferred.append(obj)
+        else:
+            accepted.append(obj)
+            used += size
+    return accepted, deferred, refused
+
+# Consecutive runs of objects whose estimated output fits in the budget together, freeing the
+# temporary meshes of a run before the next one. `kept` are the orphan meshes from before the run.
+def budget_chunks(objects, estimates, budget_mb, kept):
+    budget = budget_mb * 1024 * 1024
+    chunk, used = [], 0
+    for obj in objects:
+        if chunk and budget and used + estimates[obj] > budget:
+            yield chunk
+            purge_orphan_meshes(kept)
+            chunk, used = [], 0
+        chunk.append(obj)
+        used += estimates[obj]
+    if chunk:
+        yield chunk
+
+# Check the modifiers just added by an operator against the memory budget. Modifiers of objects
+# over the budget are removed; for the rest that don't fit together, they are removed ('REFUSE')
+# or disabled in the viewport so they can be enabled in smaller groups ('CHUNK').
+# Returns the objects whose modifiers were removed and a message for the report, empty when everything fits.
+def guard_added_modifiers(added, budget_mb, action):
+    if not budget_mb or not added:
+        return [], ""
+    estimates = {obj: estimate_bytes(estimate_object_counts(obj)) for obj in added}
+    accepted, deferred, refused = split_by_memory_budget(list(added), estimates, budget_mb)
+    removed = refused + (deferred if action == 'REFUSE' else [])
+    for obj in removed:
+        for modifier in added[obj]:
+            obj.modifiers.remove(modifier)
+    messages = []
+    if refused:
+        names = ", ".join(obj.name for obj in refused[:5])
+        messages.append(f"skipped {len(refused)} objects over the memory budget ({names})")
+    if deferred:
+        if action == 'REFUSE':
+            messages.append(f"skipped {len(deferred)} objects that don't fit in the memory budget")
+        else:
+            for obj in deferred:
+                for modifier in added[obj]:
+                    modifier.show_viewport = False
+            messages.append(f"disabled the new modifiers of {len(deferred)} objects in the viewport to stay within the memory budget")
+    return removed, "; ".join(messages)
+
+# Estimated output of the selection's current modifier stacks, rebuilt only when the
+# selection changes or a depsgraph update touches object geometry
+_output_estimate_cache = {"key": None, "estimate": None}
+
+def get_output_estimate(context):
+    targets = get_edit_targets(context)
+    key = tuple(obj.name for obj in targets)
+    if _output_estimate_cache["key"] != key:
+        counts = [estimate_object_counts(obj) for obj in targets]
+        _output_estimate_cache["estimate"] = (sum(int(c["faces"]) for c in counts), sum(estimate_bytes(c) for c in counts))
+        _output_estimate_cache["key"] = key
+    return _output_estimate_cache["estimate"]
+
+def invalidate_output_estimate():
+    _output_estimate_cache["key"] = None
+
 # Bevel operator
 class OBJECT_OT_easy_bevel(bpy.types.Operator):
     bl_label = "Bevel"
@@ -199,29 +1377,29 @@ class OBJECT_OT_easy_bevel(bpy.types.Operator):
     bl_description = "Adds a bevel modifier with default settings."
 
     def execute(self, context):
-        target_objects = get_target_objects(context)
-        for obj in target_objects:
-            if obj.type == 'MESH':
-                # Check if there's already a Bevel modifier
-                if not any(mod.type == 'BEVEL' for mod in obj.modifiers):
-                    modifier = obj.modifiers.new(name="Bevel", type='BEVEL')
-                    modifier.width = 0.02
-                    modifier.segments = 3
-                    modifier.profile = 0.7
-        self.report({'INFO'}, "Bevel applied to selected/all mesh objects.")
+        props = context.scene.easy_utils_props
+        # Only adds one if there's no Bevel modifier yet
+        result = bevel(get_target_objects(context), memory_budget_mb=props.memory_budget_mb,
+                       memory_guard=props.memory_guard_action)
+        if result.messages:
+            self.report({'WARNING'}, f"Bevel applied, {result.messages[0]}.")
+        else:
+            self.report({'INFO'}, "Bevel applied to selected/all mesh objects.")
         return {'FINISHED'}
 
+# Get an EasyOps collection, creating it in the scene if it doesn't exist
+def get_or_create_collection(name):
+    if name not in bpy.data.collections:
+        new_collection = bpy.data.collections.new(name)
+        bpy.context.scene.collection.children.link(new_collection)
+    return bpy.data.collections[name]
+
 def turn_into_wireframe(obj):
     # Set the object to display as wireframe in the viewport
     obj.display_type = 'WIRE'
     
-    # Check if the collection 'EASYOPS_CUTS' exists, if not, create it
-    if "EASYOPS_CUTS" not in bpy.data.collections:
-        new_collection = bpy.data.collections.new("EASYOPS_CUTS")
-        bpy.context.scene.collection.children.link(new_collection)
-
-    # Get the EASYOPS_CUTS collection
-    cuts_collection = bpy.data.collections["EASYOPS_CUTS"]
+    # Get the EASYOPS_CUTS collection, creating it if needed
+    cuts_collection = get_or_create_collection("EASYOPS_CUTS")
 
     # If the object is already in a collection, unlink it from the original collection
     for collection in obj.users_collection:
@@ -230,6 +1408,156 @@ def turn_into_wireframe(obj):
     # Link the object to the 'EASYOPS_CUTS' collection
     cuts_collection.objects.link(obj)
 
+# --- Boolean Input Health ---
+
+# Health reports keyed by mesh fingerprint, so unchanged meshes are only checked once
+_mesh_health_cache = {}
+MESH_HEALTH_CACHE_LIMIT = 4096
+
+def get_mesh_fingerprint(mesh):
+    hasher = hashlib.sha1()
+    hash_mesh(mesh, hasher)
+    return hasher.hexdigest()
+
+# Vectorized manifold, normal consistency, orientation and overlap checks on a mesh
+def check_mesh_health(mesh):
+    fingerprint = get_mesh_fingerprint(mesh)
+    cached = cache_get(_mesh_health_cache, fingerprint)
+    if cached is not None:
+        return cached
+
+    arrays = read_mesh_arrays(mesh)
+    loop_verts = arrays["loop_verts"]
+    loop_edges = arrays["loop_edges"]
+    loop_starts = arrays["loop_starts"]
+    loop_totals = arrays["loop_totals"]
+    co = arrays["co"].reshape(-1, 3).astype(np.float64)
+    loop_polygons = np.repeat(np.arange(len(loop_starts)), loop_totals)
+
+    # Manifold edges have exactly two faces
+    face_counts = np.bincount(loop_edges, minlength=len(mesh.edges))
+    manifold = face_counts == 2
+    non_manifold = int(np.count_nonzero(face_counts != 2))
+
+    # Two faces with consistent normals walk their shared edge in opposite directions
+    next_loops = get_next_loops(loop_starts, loop_totals)
+    wraps = next_loops < np.arange(len(loop_verts))
+    forward = loop_verts < loop_verts[next_loops]
+    forward_counts = np.bincount(loop_edges, weights=forward, minlength=len(mesh.edges))
+    inconsistent = int(np.count_nonzero(manifold & (forward_counts != 1)))
+
+    # A closed mesh with consistent normals pointing inwards has a negative volume
+    inverted = False
+    if non_manifold == 0 and inconsistent == 0 and len(loop_verts):
+        fan = ~np.isin(np.arange(len(loop_verts)), loop_starts) & ~wraps
+        first = co[loop_verts[loop_starts[loop_polygons[fan]]]]
+        volume = np.einsum('ij,ij->', first, np.cross(co[loop_verts[fan]], co[loop_verts[next_loops[fan]]]))
+        inverted = volume < 0.0
+
+    # Self-overlap heuristics: faces using the same set of vertices and faces without area.
+    # Faces are compared by their sorted vertex indices, per face size.
+    duplicate_faces = 0
+    for size in np.unique(loop_totals):
+        faces = np.flatnonzero(loop_totals == size)
+        keys = np.sort(loop_verts[loop_starts[faces, None] + np.arange(size)], axis=1)
+        duplicate_faces += len(keys) - len(np.unique(keys, axis=0))
+    areas = np.empty(len(mesh.polygons), dtype=np.float32)
+    mesh.polygons.foreach_get("area", areas)
+    degenerate_faces = int(np.count_nonzero(areas < 1e-12))
+
+    report = {
+        "non_manifold": non_manifold,
+        "inconsistent": inconsistent,
+        "inverted": bool(inverted),
+        "duplicate_faces": int(duplicate_faces),
+        "degenerate_faces": degenerate_faces,
+    }
+    cache_put(_mesh_health_cache, fingerprint, report, MESH_HEALTH_CACHE_LIMIT)
+    return report
+
+def needs_normal_fix(report):
+    return report["inconsistent"] > 0 or report["inverted"]
+
+def is_solver_safe(report):
+    return not (report["non_manifold"] or needs_normal_fix(report)
+                or report["duplicate_faces"] or report["degenerate_faces"])
+
+# Make face normals consistent and pointing outwards, one bmesh per mesh
+def recalculate_normals(meshes):
+    for mesh in meshes:
+        bm = bmesh.new()
+        bm.from_mesh(mesh)
+        bmesh.ops.recalc_face_normals(bm, faces=bm.faces)
+        bm.to_mesh(mesh)
+        bm.free()
+        mesh.update()
+
+def describe_health(report):
+    problems = []
+    if report["non_manifold"]:
+        problems.append(f"{report['non_manifold']} non-manifold edges")
+    if report["inconsistent"]:
+        problems.append(f"{report['inconsistent']} edges with flipped normals")
+    if report["inverted"]:
+        problems.append("inverted normals")
+    if report["duplicate_faces"]:
+        problems.append(f"{report['duplicate_faces']} duplicate faces")
+    if report["degenerate_faces"]:
+        problems.append(f"{report['degenerate_faces']} zero area faces")
+    return ", ".join(problems)
+
+# Check the boolean inputs before any modifier is added. With action 'FIX' and 'STRICT', bad normals
+# are recalculated in bulk. Inputs that still aren't safe for the solver are flagged in the messages,
+# and dropped with 'STRICT'.
+# Returns the usable objects and a message per rejected or repaired object.
+def gate_boolean_inputs(objects, action, undo_batch=None):
+    if action == 'OFF':
+        return list(objects), []
+
+    reports = {obj: check_mesh_health(obj.data) for obj in objects}
+    messages = []
+    if action in {'FIX', 'STRICT'}:
+        to_fix = {obj.data.name: obj.data for obj, report in reports.items() if needs_normal_fix(report)}
+        for obj in reports:
+            if obj.data.name in to_fix:
+                snapshot_object(undo_batch, obj)
+        recalculate_normals(to_fix.values())
+        for obj, report in reports.items():
+            if obj.data.name in to_fix:
+                messages.append(f"{obj.name}: recalculated normals")
+                reports[obj] = check_mesh_health(obj.data)
+
+    usable = []
+    for obj, report in reports.items():
+        if is_solver_safe(report):
+            usable.append(obj)
+        elif action != 'STRICT':
+            usable.append(obj)
+            messages.append(f"{obj.name}: {describe_health(report)}")
+        else:
+            messages.append(f"{obj.name} skipped: {describe_health(report)}")
+    return usable, messages
+
+# Add a boolean modifier with the active object as cutter to every target, after the health gate
+def add_boolean_modifiers(operator, context, operation, name):
+    props = context.scene.easy_utils_props
+    if props.boolean_health_action != 'OFF' and context.mode != 'OBJECT':
+        bpy.ops.object.mode_set(mode='OBJECT')
+    # Fixing the inputs edits their meshes, those edits can be reverted
+    batch = begin_undo_batch(name) if props.boolean_health_action in {'FIX', 'STRICT'} else None
+    try:
+        result = boolean(get_target_objects(context), context.view_layer.objects.active, operation,
+                         props.boolean_health_action, props.memory_budget_mb, props.memory_guard_action,
+                         undo_batch=batch)
+    except ValueError as error:
+        operator.report({'ERROR'}, str(error))
+        return {'CANCELLED'}
+
+    if result.messages:
+        operator.report({'WARNING'}, f"{name} applied. " + "; ".join(result.messages[:5]))
+    else:
+        operator.report({'INFO'}, f"{name} applied.")
+    return {'FINISHED'}
 
 # Boolean operations
 class OBJECT_OT_easy_boolean_difference(bpy.types.Operator):
@@ -238,19 +1566,7 @@ class OBJECT_OT_easy_boolean_difference(bpy.types.Operator):
     bl_description = "Performs a Boolean Difference operation with the active object."
 
     def execute(self, context):
-        target_objects = get_target_objects(context)
-        active_obj = context.view_layer.objects.active
-        
-        for obj in target_objects:
-            if obj.type == 'MESH' and obj != active_obj:
-                modifier = obj.modifiers.new(name="Boolean Difference", type='BOOLEAN')
-                modifier.operation = 'DIFFERENCE'
-                modifier.object = active_obj
-
-        turn_into_wireframe(active_obj)
-
-        self.report({'INFO'}, "Boolean Difference applied.")
-        return {'FINISHED'}
+        return add_boolean_modifiers(self, context, 'DIFFERENCE', "Boolean Difference")
 
     
 class OBJECT_OT_easy_boolean_union(bpy.types.Operator):
@@ -259,18 +1575,7 @@ class OBJECT_OT_easy_boolean_union(bpy.types.Operator):
     bl_description = "Performs a Boolean Union operation with the active object."
 
     def execute(self, context):
-        target_objects = get_target_objects(context)
-        active_obj = context.view_layer.objects.active
-        
-        for obj in target_objects:
-            if obj.type == 'MESH' and obj != active_obj:
-                modifier = obj.modifiers.new(name="Boolean Union", type='BOOLEAN')
-                modifier.operation = 'UNION'
-                modifier.object = active_obj
-
-        turn_into_wireframe(active_obj)
-        self.report({'INFO'}, "Boolean Union applied.")
-        return {'FINISHED'}
+        return add_boolean_modifiers(self, context, 'UNION', "Boolean Union")
 
 class OBJECT_OT_easy_boolean_intersect(bpy.types.Operator):
     bl_label = "Boolean Intersect"
@@ -278,107 +1583,1275 @@ class OBJECT_OT_easy_boolean_intersect(bpy.types.Operator):
     bl_description = "Performs a Boolean Intersect operation with the active object."
 
     def execute(self, context):
-        target_objects = get_target_objects(context)
-        active_obj = context.view_layer.objects.active
-        
-        for obj in target_objects:
-            if obj.type == 'MESH' and obj != active_obj:
-                modifier = obj.modifiers.new(name="Boolean Intersect", type='BOOLEAN')
-                modifier.operation = 'INTERSECT'
-                modifier.object = active_obj
-
-        turn_into_wireframe(active_obj)
-        self.report({'INFO'}, "Boolean Intersect applied.")
-        return {'FINISHED'}
+        return add_boolean_modifiers(self, context, 'INTERSECT', "Boolean Intersect")
     
-#---
-# Smart Apply for Boolean Modifiers
-def smart_apply(obj):
-    # Apply all boolean modifiers but leave other modifiers intact
-    for modifier in obj.modifiers:
-        if modifier.type == 'BOOLEAN':
-            bpy.context.view_layer.objects.active = obj
-            bpy.ops.object.modifier_apply(modifier=modifier.name)
+# --- Bulk Boolean Union ---
 
-class OBJECT_OT_easy_smart_apply(bpy.types.Operator):
-    bl_label = "Smart Apply"
-    bl_idname = "object.easy_smart_apply"
-    bl_description = "Applies all boolean modifiers on the selected object but preserves other modifiers."
+# Spread the lower 10 bits of each value so three of them can be interleaved
+def spread_bits(values):
+    values = values.astype(np.int64) & 0x3FF
+    values = (values | (values << 16)) & 0x030000FF
+    values = (values | (values << 8)) & 0x0300F00F
+    values = (values | (values << 4)) & 0x030C30C3
+    values = (values | (values << 2)) & 0x09249249
+    return values
 
-    def execute(self, context):
-        target_objects = get_target_objects(context)
+# Order objects along a Morton (Z-order) curve of their world bounding box centers,
+# so neighbouring objects end up in the same union pairs
+def sort_objects_spatially(objects):
+    if len(objects) < 3:
+        return list(objects)
+    centers = np.array([tuple(obj.matrix_world @ (sum((Vector(corner) for corner in obj.bound_box), Vector()) / 8.0))
+                        for obj in objects])
+    low = centers.min(axis=0)
+    extent = np.maximum(centers.max(axis=0) - low, 1e-9)
+    cells = ((centers - low) / extent * 1023.0).astype(np.int64)
+    codes = spread_bits(cells[:, 0]) | (spread_bits(cells[:, 1]) << 1) | (spread_bits(cells[:, 2]) << 2)
+    return [objects[i] for i in np.argsort(codes, kind='stable')]
 
-        for obj in target_objects:
-            if obj.type == 'MESH':
-                smart_apply(obj)  # Call the smart apply function
-        
-        self.report({'INFO'}, "Smart Apply completed for boolean modifiers.")
-        return {'FINISHED'}
+# Union many objects pairwise in a balanced binary tree. Every level of the tree is evaluated
+# in batches of at most chunk_size pairs, and the previous level is freed before the next one,
+# so the meshes in memory stay bounded and no operand grows along a long chain.
+def union_objects_balanced(context, objects, solver='EXACT', chunk_size=None):
+    temp_collection = bpy.data.collections.new("EASYOPS_TEMP")
+    context.scene.collection.children.link(temp_collection)
 
+    def add_temp_object(mesh):
+        temp_obj = bpy.data.objects.new("EASYOPS_TEMP", mesh)
+        temp_collection.objects.link(temp_obj)
+        return temp_obj
 
-# Smart Decimate operator
-class OBJECT_OT_easy_smart_decimate(bpy.types.Operator):
-    bl_label = "Smart Decimate"
-    bl_idname = "object.easy_smart_decimate"
-    bl_description = "Adds a decimate modifier to reduce the polygon count."
+    def remove_temp_object(temp_obj):
+        mesh = temp_obj.data
+        bpy.data.objects.remove(temp_obj)
+        if mesh.users == 0:
+            bpy.data.meshes.remove(mesh)
 
-    def execute(self, context):
-        target_objects = get_target_objects(context)
-        for obj in target_objects:
-            if obj.type == 'MESH':
-                # Check if there's already a Decimate modifier
-                if not any(mod.type == 'DECIMATE' for mod in obj.modifiers):
-                    modifier = obj.modifiers.new(name="Decimate", type='DECIMATE')
-                    modifier.ratio = 0.5  # Adjust reduction factor
-
-            
-        self.report({'INFO'}, "Decimate applied to reduce polygon count.")
-        return {'FINISHED'}
+    # Leaves are world space copies of the evaluated objects
+    depsgraph = context.evaluated_depsgraph_get()
+    level = []
+    for obj in objects:
+        mesh = bpy.data.meshes.new_from_object(obj.evaluated_get(depsgraph))
+        mesh.transform(obj.matrix_world)
+        level.append(add_temp_object(mesh))
 
-# Sharpen edges operator
-class OBJECT_OT_easy_sharpen_edges(bpy.types.Operator):
-    bl_label = "Sharpen Edges"
-    bl_idname = "object.easy_sharpen_edges"
-    bl_description = "Marks selected edges as sharp / equivalent to flat shading."
+    while len(level) > 1:
+        pairs = [(level[i], level[i + 1]) for i in range(0, len(level) - 1, 2)]
+        carry = [level[-1]] if len(level) % 2 else []
+        next_level = []
+        step = chunk_size or len(pairs)
+        for start in range(0, len(pairs), step):
+            chunk = pairs[start:start + step]
+            for target, operand in chunk:
+                modifier = target.modifiers.new(name="Boolean Union", type='BOOLEAN')
+                modifier.operation = 'UNION'
+                modifier.object = operand
+                modifier.solver = solver
 
-    def execute(self, context):
-        target_objects = get_target_objects(context)
-        for obj in target_objects:
-            if obj.type == 'MESH':
-                bpy.context.view_layer.objects.active = obj
-                bpy.ops.object.mode_set(mode='EDIT')
-                bpy.ops.mesh.mark_sharp()
-        self.report({'INFO'}, "Sharp edges marked on selected/all objects.")
-        return {'FINISHED'}
+            depsgraph = context.evaluated_depsgraph_get()
+            merged = [bpy.data.meshes.new_from_object(target.evaluated_get(depsgraph)) for target, _ in chunk]
+            for (target, operand), mesh in zip(chunk, merged):
+                remove_temp_object(target)
+                remove_temp_object(operand)
+                next_level.append(add_temp_object(mesh))
+        level = next_level + carry
 
-# Clean geometry operator
-class OBJECT_OT_easy_clean_geometry(bpy.types.Operator):
-    bl_label = "Clean Geometry"
-    bl_idname = "object.easy_clean_geometry"
-    bl_description = "Cleans loose geometry, removes doubles (merges vertices by distance), and dissolves degenerate faces."
+    result = level[0]
+    temp_collection.objects.unlink(result)
+    bpy.data.collections.remove(temp_collection)
+    return result
 
-    def execute(self, context):
-        target_objects = get_target_objects(context)
-        for obj in target_objects:
-            if obj.type == 'MESH':
-                bpy.context.view_layer.objects.active = obj
-                bpy.ops.object.mode_set(mode='EDIT')
+class OBJECT_OT_easy_boolean_union_bulk(bpy.types.Operator):
+    bl_label = "Bulk Boolean Union"
+    bl_idname = "object.easy_boolean_union_bulk"
+    bl_description = "Merges all selected mesh objects into one mesh with a balanced tree of boolean unions. The source objects are hidden."
 
-                # Merge by Distance (Equivalent to Remove Doubles for Blender 2.93)
-                bpy.ops.mesh.select_all(action='SELECT')
-                bpy.ops.mesh.remove_doubles()  # For Blender 2.93 compatibility
+    def execute(self, context):
+        props = context.scene.easy_utils_props
+        if context.mode != 'OBJECT':
+            bpy.ops.object.mode_set(mode='OBJECT')
+
+        chunk_size = props.stream_batch_size if props.use_streaming else None
+        try:
+            union = bulk_union(context.selected_objects, props.bulk_union_solver, props.bulk_union_spatial, chunk_size)
+        except ValueError as error:
+            self.report({'ERROR'}, str(error))
+            return {'CANCELLED'}
+
+        result = union.details["result"]
+        for obj in union.objects:
+            obj.select_set(False)
+        result.select_set(True)
+        context.view_layer.objects.active = result
+
+        self.report({'INFO'}, f"Merged {union.count} objects into '{result.name}'.")
+        return {'FINISHED'}
+
+# --- Cluster Join ---
+
+# Custom property holding how a cluster object splits back into its source objects
+CLUSTER_MAP_KEY = "easyops_cluster"
+
+# Names of the objects a modifier or constraint of another object points at: boolean cutters,
+# mirror objects, constraint targets, ...
+def get_referenced_object_names():
+    names = set()
+    for obj in bpy.data.objects:
+        for owner in list(obj.modifiers) + list(obj.constraints):
+            for prop in owner.bl_rna.properties:
+                if prop.type != 'POINTER' or prop.is_readonly:
+                    continue
+                value = getattr(owner, prop.identifier)
+                if isinstance(value, bpy.types.Object) and value != obj:
+                    names.add(value.name)
+                elif isinstance(value, bpy.types.Collection):
+                    names.update(ref.name for ref in value.all_objects if ref != obj)
+    return names
+
+# Objects are only joined when their mesh and object data carry nothing beyond what
+# write_join_arrays restores, so the result looks the same, and nothing else points at them,
+# since they are removed. Animated, driven or constrained objects would freeze in place in the
+# joined mesh, so they're left alone too. `referenced` comes from get_referenced_object_names.
+def can_join_object(obj, referenced):
+    return (obj.type == 'MESH' and not obj.modifiers and not obj.children and CLUSTER_MAP_KEY not in obj.keys()
+            and obj.animation_data is None and obj.data.animation_data is None and not obj.constraints
+            and obj.name not in referenced and not get_extra_mesh_data(obj.data, [obj]))
+
+# Cluster of an object: its grid cell plus whatever must be the same within one object
+# (material slots, display and visibility, auto smooth before Blender 4.1) and optionally its collection
+def get_cluster_key(obj, cell_size, by_material, by_collection):
+    corners = [obj.matrix_world @ Vector(corner) for corner in obj.bound_box]
+    center = sum(corners, Vector()) / 8.0
+    key = [tuple(math.floor(value / cell_size) for value in center)]
+    materials = tuple(slot.material.name if slot.material else "" for slot in obj.material_slots)
+    key.append(materials if by_material else len(materials))
+    key.append(obj.users_collection[0].name if by_collection and obj.users_collection else "")
+    key.append((obj.display_type, obj.hide_render, obj.hide_viewport, obj.hide_select, obj.hide_get()))
+    if bpy.app.version < (4, 1, 0):
+        key.append((obj.data.use_auto_smooth, round(obj.data.auto_smooth_angle, 6)))
+    return tuple(key)
+
+# Reverse the winding of every polygon, keeping each polygon's first corner. Used for objects
+# with a mirroring transform, and is its own inverse.
+def reverse_winding(arrays):
+    loop_starts, loop_totals = arrays["loop_starts"], arrays["loop_totals"]
+    starts = np.repeat(loop_starts, loop_totals)
+    sizes = np.repeat(loop_totals, loop_totals)
+    corners = np.arange(len(starts)) - starts
+    vert_source = starts + (sizes - corners) % sizes
+    edge_source = starts + (sizes - corners - 1) % sizes
+    arrays["loop_verts"] = arrays["loop_verts"][vert_source]
+    arrays["loop_edges"] = arrays["loop_edges"][edge_source]
+    if "uv" in arrays:
+        arrays["uv"] = arrays["uv"].reshape(-1, 2)[vert_source].ravel()
+
+def read_join_arrays(mesh):
+    arrays = read_mesh_arrays(mesh)
+    for attribute in ("use_edge_sharp", "use_seam"):
+        values = np.empty(len(mesh.edges), dtype=bool)
+        mesh.edges.foreach_get(attribute, values)
+        arrays[attribute] = values
+    return arrays
+
+def write_join_arrays(mesh, arrays):
+    write_mesh_arrays(mesh, arrays)
+    for attribute in ("use_edge_sharp", "use_seam"):
+        mesh.edges.foreach_set(attribute, arrays[attribute])
+    mesh.update()
+
+# Generic attributes read_join_arrays covers; internal ones start with a dot
+JOIN_ARRAY_ATTRIBUTES = {"position", "material_index", "sharp_face", "sharp_edge"}
+
+# Mesh data that read_join_arrays/write_join_arrays don't carry: extra UV maps, colors, shape keys,
+# custom normals, bevel weights, creases, vertex groups and any other attribute. Code that rebuilds
+# meshes from the arrays leaves meshes with any of it alone. `owners` are the objects whose vertex
+# groups count (all users of the mesh by default).
+def get_extra_mesh_data(mesh, owners=None):
+    extra = []
+    active_uv = mesh.uv_layers.active
+    uv_names = {layer.name for layer in mesh.uv_layers}
+    extra.extend(f"UV map {layer.name}" for layer in mesh.uv_layers if active_uv is None or layer.name != active_uv.name)
+    color_attributes = getattr(mesh, "color_attributes", None) or getattr(mesh, "vertex_colors", ())
+    color_names = {layer.name for layer in color_attributes}
+    extra.extend(f"color {name}" for name in sorted(color_names))
+    if mesh.shape_keys is not None:
+        extra.append("shape keys")
+    if mesh.has_custom_normals:
+        extra.append("custom normals")
+    # Bevel weights and creases are custom data layers before Blender 4.0
+    for flag in ("use_customdata_vertex_bevel", "use_customdata_edge_bevel",
+                 "use_customdata_vertex_crease", "use_customdata_edge_crease"):
+        if getattr(mesh, flag, False):
+            extra.append(flag[len("use_customdata_"):])
+    if owners is None:
+        owners = [obj for obj in bpy.data.objects if obj.data == mesh]
+    if any(len(obj.vertex_groups) for obj in owners):
+        extra.append("vertex groups")
+    covered = JOIN_ARRAY_ATTRIBUTES | uv_names | color_names
+    extra.extend(attribute.name for attribute in mesh.attributes
+                 if not attribute.name.startswith(".") and attribute.name not in covered)
+    return extra
+
+# Concatenate mesh buffers, offsetting the indices of every part. Returns the joined buffers and
+# the [offset, count] range of every part per element type.
+def concatenate_mesh_arrays(parts):
+    ranges = []
+    offsets = {"verts": 0, "edges": 0, "loops": 0, "faces": 0}
+    shifted = []
+    for arrays in parts:
+        counts = {"verts": len(arrays["co"]) // 3, "edges": len(arrays["edges"]) // 2,
+                  "loops": len(arrays["loop_verts"]), "faces": len(arrays["loop_starts"])}
+        ranges.append({key: [offsets[key], counts[key]] for key in counts})
+        arrays = dict(arrays)
+        arrays["edges"] = arrays["edges"] + offsets["verts"]
+        arrays["loop_verts"] = arrays["loop_verts"] + offsets["verts"]
+        arrays["loop_edges"] = arrays["loop_edges"] + offsets["edges"]
+        arrays["loop_starts"] = arrays["loop_starts"] + offsets["loops"]
+        for key in counts:
+            offsets[key] += counts[key]
+        shifted.append(arrays)
+    joined = {key: np.concatenate([arrays[key] for arrays in shifted]) for key in shifted[0]}
+    return joined, ranges
+
+# Join the objects into one new object by concatenating their buffers in the space of `origin`.
+# Returns the object; its custom property maps element ranges back to the source objects.
+def join_cluster(objects, name, origin, collection):
+    inverse = np.array(Matrix.Translation(origin).inverted(), dtype=np.float64)
+    parts = []
+    entries = []
+    has_uv = any(len(obj.data.uv_layers) for obj in objects)
+    for obj in objects:
+        arrays = read_join_arrays(obj.data)
+        matrix = np.array(obj.matrix_world, dtype=np.float64)
+        co = np.c_[arrays["co"].reshape(-1, 3), np.ones(len(arrays["co"]) // 3)] @ (inverse @ matrix).T
+        arrays["co"] = co[:, :3].astype(np.float32).ravel()
+        flipped = bool(np.linalg.det(matrix[:3, :3]) < 0.0)
+        if flipped:
+            reverse_winding(arrays)
+        if has_uv and "uv" not in arrays:
+            arrays["uv"] = np.zeros(len(arrays["loop_verts"]) * 2, dtype=np.float32)
+        entries.append({
+            "name": obj.name, "mesh": obj.data.name, "matrix": matrix.ravel().tolist(), "flipped": flipped,
+            "parent": obj.parent.name if obj.parent else None,
+        })
+        parts.append(arrays)
+
+    joined, ranges = concatenate_mesh_arrays(parts)
+    for entry, part_ranges in zip(entries, ranges):
+        entry["ranges"] = part_ranges
+    materials = [slot.material for slot in objects[0].material_slots]
+    mesh = bpy.data.meshes.new(name)
+    write_join_arrays(mesh, joined)
+    for material in materials:
+        mesh.materials.append(material)
+    if bpy.app.version < (4, 1, 0):
+        mesh.use_auto_smooth = objects[0].data.use_auto_smooth
+        mesh.auto_smooth_angle = objects[0].data.auto_smooth_angle
+
+    cluster = bpy.data.objects.new(name, mesh)
+    cluster.location = origin
+    collection.objects.link(cluster)
+    cluster[CLUSTER_MAP_KEY] = json.dumps({"origin": list(origin), "objects": entries})
+    return cluster
+
+# Group the objects into clusters and join every cluster with more than one object.
+# Returns the new cluster objects and the number of joined source objects.
+def cluster_join_objects(context, objects, cell_size, by_material=True, by_collection=True):
+    clusters = {}
+    referenced = get_referenced_object_names()
+    for obj in objects:
+        if can_join_object(obj, referenced):
+            clusters.setdefault(get_cluster_key(obj, cell_size, by_material, by_collection), []).append(obj)
+
+    created = []
+    removed = []
+    for key, members in clusters.items():
+        if len(members) < 2:
+            continue
+        origin = (Vector(key[0]) + Vector((0.5, 0.5, 0.5))) * cell_size
+        collection = members[0].users_collection[0] if members[0].users_collection else context.scene.collection
+        created.append(join_cluster(members, f"EASYOPS_Cluster_{len(created) + 1}", origin, collection))
+        removed.extend(members)
+
+    # One batch removal instead of one relation update per object
+    meshes = {obj.data for obj in removed}
+    bpy.data.batch_remove(removed)
+    bpy.data.batch_remove([mesh for mesh in meshes if mesh.users == 0])
+    return created, len(removed)
+
+# Recreate the source objects of a cluster object from its element ranges, then remove it.
+# Objects that shared a mesh share the rebuilt mesh again.
+def split_cluster(cluster):
+    mapping = json.loads(cluster[CLUSTER_MAP_KEY])
+    arrays = read_join_arrays(cluster.data)
+    to_cluster = np.array(Matrix.Translation(Vector(mapping["origin"])), dtype=np.float64)
+    materials = list(cluster.data.materials)
+    collections = list(cluster.users_collection)
+    meshes = {}
+    restored = []
+
+    for entry in mapping["objects"]:
+        matrix = np.array(entry["matrix"], dtype=np.float64).reshape(4, 4)
+        mesh = meshes.get(entry["mesh"])
+        if mesh is None:
+            (vert_start, vert_count), (edge_start, edge_count) = entry["ranges"]["verts"], entry["ranges"]["edges"]
+            (loop_start, loop_count), (face_start, face_count) = entry["ranges"]["loops"], entry["ranges"]["faces"]
+            part = {
+                "co": arrays["co"][vert_start * 3:(vert_start + vert_count) * 3],
+                "edges": arrays["edges"][edge_start * 2:(edge_start + edge_count) * 2] - vert_start,
+                "loop_verts": arrays["loop_verts"][loop_start:loop_start + loop_count] - vert_start,
+                "loop_edges": arrays["loop_edges"][loop_start:loop_start + loop_count] - edge_start,
+                "loop_starts": arrays["loop_starts"][face_start:face_start + face_count] - loop_start,
+                "loop_totals": arrays["loop_totals"][face_start:face_start + face_count],
+                "material_index": arrays["material_index"][face_start:face_start + face_count],
+                "use_smooth": arrays["use_smooth"][face_start:face_start + face_count],
+                "use_edge_sharp": arrays["use_edge_sharp"][edge_start:edge_start + edge_count],
+                "use_seam": arrays["use_seam"][edge_start:edge_start + edge_count],
+            }
+            if "uv" in arrays:
+                part["uv"] = arrays["uv"][loop_start * 2:(loop_start + loop_count) * 2]
+            co = np.c_[part["co"].reshape(-1, 3), np.ones(vert_count)] @ (np.linalg.inv(matrix) @ to_cluster).T
+            part["co"] = co[:, :3].astype(np.float32).ravel()
+            if entry["flipped"]:
+                reverse_winding(part)
+
+            mesh = bpy.data.meshes.new(entry["mesh"])
+            write_join_arrays(mesh, part)
+            for material in materials:
+                mesh.materials.append(material)
+            if bpy.app.version < (4, 1, 0):
+                mesh.use_auto_smooth = cluster.data.use_auto_smooth
+                mesh.auto_smooth_angle = cluster.data.auto_smooth_angle
+            meshes[entry["mesh"]] = mesh
+
+        obj = bpy.data.objects.new(entry["name"], mesh)
+        for collection in collections:
+            collection.objects.link(obj)
+        obj.parent = bpy.data.objects.get(entry["parent"]) if entry["parent"] else None
+        obj.matrix_world = Matrix(matrix.tolist())
+        restored.append(obj)
+
+    cluster_mesh = cluster.data
+    bpy.data.objects.remove(cluster)
+    if cluster_mesh.users == 0:
+        bpy.data.meshes.remove(cluster_mesh)
+    return restored
+
+class OBJECT_OT_easy_cluster_join(bpy.types.Operator):
+    bl_label = "Cluster Join"
+    bl_idname = "object.easy_cluster_join"
+    bl_description = "Joins selected/all mesh objects without modifiers into one object per grid cell, material set and collection. Clusters can be split back later."
+
+    def execute(self, context):
+        props = context.scene.easy_utils_props
+        if context.mode != 'OBJECT':
+            bpy.ops.object.mode_set(mode='OBJECT')
+
+        result = cluster_join(get_target_objects(context), props.cluster_cell_size,
+                              props.cluster_by_material, props.cluster_by_collection)
+        self.report({'INFO'}, f"Joined {result.count} objects into {len(result.objects)} clusters.")
+        return {'FINISHED'}
+
+class OBJECT_OT_easy_cluster_split(bpy.types.Operator):
+    bl_label = "Split Clusters"
+    bl_idname = "object.easy_cluster_split"
+    bl_description = "Restores the source objects of selected/all cluster objects made by Cluster Join."
+
+    def execute(self, context):
+        if context.mode != 'OBJECT':
+            bpy.ops.object.mode_set(mode='OBJECT')
+
+        result = cluster_split(get_target_objects(context))
+        self.report({'INFO'}, f"Split {result.count} clusters back into {len(result.objects)} objects.")
+        return {'FINISHED'}
+
+# --- Geometry Cache ---
+
+# Persistent cache of evaluated geometry, shared between sessions and .blend files
+GEOMETRY_CACHE_DIR = os.path.join(bpy.utils.resource_path('USER'), "easyops_cache")
+
+# Read the geometry of a mesh into flat NumPy buffers
+def read_mesh_arrays(mesh):
+    def read(collection, attribute, dtype, width=1):
+        values = np.empty(len(collection) * width, dtype=dtype)
+        collection.foreach_get(attribute, values)
+        return values
+
+    arrays = {
+        "co": read(mesh.vertices, "co", np.float32, 3),
+        "edges": read(mesh.edges, "vertices", np.int32, 2),
+        "loop_verts": read(mesh.loops, "vertex_index", np.int32),
+        "loop_edges": read(mesh.loops, "edge_index", np.int32),
+        "loop_starts": read(mesh.polygons, "loop_start", np.int32),
+        "loop_totals": read(mesh.polygons, "loop_total", np.int32),
+        "material_index": read(mesh.polygons, "material_index", np.int32),
+        "use_smooth": read(mesh.polygons, "use_smooth", bool),
+    }
+    if mesh.uv_layers.active is not None:
+        arrays["uv"] = read(mesh.uv_layers.active.data, "uv", np.float32, 2)
+    return arrays
+
+# Replace the geometry of a mesh with flat buffers from read_mesh_arrays
+def write_mesh_arrays(mesh, arrays):
+    mesh.clear_geometry()
+    mesh.vertices.add(len(arrays["co"]) // 3)
+    mesh.vertices.foreach_set("co", arrays["co"])
+    mesh.edges.add(len(arrays["edges"]) // 2)
+    mesh.edges.foreach_set("vertices", arrays["edges"])
+    mesh.loops.add(len(arrays["loop_verts"]))
+    mesh.loops.foreach_set("vertex_index", arrays["loop_verts"])
+    mesh.loops.foreach_set("edge_index", arrays["loop_edges"])
+    mesh.polygons.add(len(arrays["loop_starts"]))
+    mesh.polygons.foreach_set("loop_start", arrays["loop_starts"])
+    # Polygon sizes are derived from the loop starts since Blender 4.0
+    if bpy.app.version < (4, 0, 0):
+        mesh.polygons.foreach_set("loop_total", arrays["loop_totals"])
+    mesh.polygons.foreach_set("material_index", arrays["material_index"])
+    mesh.polygons.foreach_set("use_smooth", arrays["use_smooth"])
+    if "uv" in arrays:
+        uv_layer = mesh.uv_layers.active or mesh.uv_layers.new()
+        uv_layer.data.foreach_set("uv", arrays["uv"])
+    mesh.update()
+
+# Create a new mesh from flat buffers, with materials looked up by name
+def build_mesh_from_arrays(name, arrays, material_names=()):
+    mesh = bpy.data.meshes.new(name)
+    write_join_arrays(mesh, arrays)
+    for material_name in material_names:
+        mesh.materials.append(bpy.data.materials.get(material_name))
+    return mesh
+
+def hash_mesh(mesh, hasher):
+    for name, values in sorted(read_join_arrays(mesh).items()):
+        hasher.update(name.encode())
+        hasher.update(values.tobytes())
+
+# Objects a modifier points at, directly or through a collection
+def get_modifier_references(modifier):
+    references = []
+    for prop in modifier.bl_rna.properties:
+        if prop.type != 'POINTER' or prop.is_readonly:
+            continue
+        value = getattr(modifier, prop.identifier)
+        if isinstance(value, bpy.types.Object):
+            references.append(value)
+        elif isinstance(value, bpy.types.Collection):
+            references.extend(sorted(value.all_objects, key=lambda ref: ref.name))
+    return references
+
+# Cache key of an object's evaluated geometry: the input mesh, the modifier settings and,
+# for every object reachable through the modifiers and the references' own modifiers, its transform
+# relative to the object and its geometry.
+# None when a mesh carries data the key and the cached arrays don't cover, those aren't cached.
+def get_geometry_cache_key(obj, modifiers):
+    if get_extra_mesh_data(obj.data, [obj]):
+        return None
+    hasher = hashlib.sha1()
+    hash_mesh(obj.data, hasher)
+    inverse = obj.matrix_world.inverted_safe()
+
+    for modifier in modifiers:
+        hasher.update(repr(get_modifier_signature(modifier, include_references=False)).encode())
+
+    # Walk the whole reference graph: a cutter's own booleans change its shape, and with it this result
+    pending = [ref for modifier in modifiers for ref in get_modifier_references(modifier)]
+    visited = {obj.name}
+    while pending:
+        ref = pending.pop(0)
+        hasher.update(ref.name.encode())
+        if ref.name in visited:
+            continue
+        visited.add(ref.name)
+        hasher.update(repr(tuple(tuple(row) for row in inverse @ ref.matrix_world)).encode())
+        if ref.type != 'MESH':
+            continue
+        if get_extra_mesh_data(ref.data, [ref]):
+            return None
+        hash_mesh(ref.data, hasher)
+        for ref_modifier in ref.modifiers:
+            if ref_modifier.show_viewport:
+                hasher.update(repr(get_modifier_signature(ref_modifier, include_references=False)).encode())
+                pending.extend(get_modifier_references(ref_modifier))
+
+    return hasher.hexdigest()
+
+# Load cached geometry as memory-mapped arrays, or None on a miss
+def load_cached_geometry(key):
+    entry_dir = os.path.join(GEOMETRY_CACHE_DIR, key)
+    meta_path = os.path.join(entry_dir, "meta.json")
+    if not os.path.exists(meta_path):
+        return None
+
+    try:
+        with open(meta_path, 'r') as meta_file:
+            meta = json.load(meta_file)
+        arrays = {name: np.load(os.path.join(entry_dir, f"{name}.npy"), mmap_mode='r') for name in meta["arrays"]}
+    except (OSError, ValueError, KeyError):
+        return None
+
+    # Mark the entry as recently used for the LRU eviction
+    os.utime(entry_dir)
+    return arrays, meta["materials"]
+
+# Store evaluated geometry as uncompressed .npy files, then evict old entries above the size limit.
+# Results with data a rebuilt mesh wouldn't have (e.g. attributes made by modifiers) aren't stored.
+def store_cached_geometry(key, mesh, max_size_mb):
+    if get_extra_mesh_data(mesh, ()):
+        return
+    entry_dir = os.path.join(GEOMETRY_CACHE_DIR, key)
+    os.makedirs(entry_dir, exist_ok=True)
+
+    arrays = read_join_arrays(mesh)
+    for name, values in arrays.items():
+        np.save(os.path.join(entry_dir, f"{name}.npy"), values)
+    # Written last, an entry without meta.json is incomplete and ignored
+    with open(os.path.join(entry_dir, "meta.json"), 'w') as meta_file:
+        json.dump({"arrays": list(arrays), "materials": [mat.name if mat else "" for mat in mesh.materials]}, meta_file)
+
+    evict_geometry_cache(max_size_mb * 1024 * 1024)
+
+# Remove the least recently used entries until the cache fits in max_bytes
+def evict_geometry_cache(max_bytes):
+    if not os.path.isdir(GEOMETRY_CACHE_DIR):
+        return
+
+    entries = []
+    total = 0
+    for key in os.listdir(GEOMETRY_CACHE_DIR):
+        entry_dir = os.path.join(GEOMETRY_CACHE_DIR, key)
+        if not os.path.isdir(entry_dir):
+            continue
+        size = sum(entry.stat().st_size for entry in os.scandir(entry_dir) if entry.is_file())
+        entries.append((os.stat(entry_dir).st_mtime, size, entry_dir))
+        total += size
+
+    for _, size, entry_dir in sorted(entries):
+        if total <= max_bytes:
+            break
+        shutil.rmtree(entry_dir, ignore_errors=True)
+        total -= size
+
+# Get the evaluated mesh of each object, reusing cached results.
+# Objects that aren't cached are evaluated together by one depsgraph update, with only
+# the given modifiers enabled (all enabled modifiers when modifier_filter is None).
+def get_evaluated_meshes(context, objects, modifier_filter=None, use_cache=False, cache_size_mb=2048):
+    meshes = {}
+    keys = {}
+    pending = []
+    for obj in objects:
+        modifiers = [mod for mod in obj.modifiers
+                     if mod.show_viewport and (modifier_filter is None or modifier_filter(mod))]
+        if use_cache:
+            keys[obj] = get_geometry_cache_key(obj, modifiers)
+            cached = load_cached_geometry(keys[obj]) if keys[obj] else None
+            if cached is not None:
+                meshes[obj] = build_mesh_from_arrays(obj.data.name, *cached)
+                continue
+        pending.append(obj)
+
+    if pending:
+        muted = []
+        if modifier_filter is not None:
+            for obj in pending:
+                for modifier in obj.modifiers:
+                    if modifier.show_viewport and not modifier_filter(modifier):
+                        modifier.show_viewport = False
+                        muted.append(modifier)
+
+        depsgraph = context.evaluated_depsgraph_get()
+        for obj in pending:
+            meshes[obj] = bpy.data.meshes.new_from_object(obj.evaluated_get(depsgraph))
+            if use_cache and keys[obj]:
+                store_cached_geometry(keys[obj], meshes[obj], cache_size_mb)
+
+        for modifier in muted:
+            modifier.show_viewport = True
+
+    return meshes
+
+class OBJECT_OT_easy_clear_geometry_cache(bpy.types.Operator):
+    bl_label = "Clear Geometry Cache"
+    bl_idname = "object.easy_clear_geometry_cache"
+    bl_description = "Deletes all cached evaluated geometry from disk."
+
+    def execute(self, context):
+        evict_geometry_cache(0)
+        self.report({'INFO'}, "Geometry cache cleared.")
+        return {'FINISHED'}
+
+#--- Smart Apply for Boolean Modifiers ---
+# Get the objects a boolean modifier uses as its operand (single object or collection)
+def get_boolean_operands(modifier):
+    if getattr(modifier, "operand_type", 'OBJECT') == 'COLLECTION':
+        if modifier.collection is None:
+            return []
+        return list(modifier.collection.all_objects)
+    return [modifier.object] if modifier.object else []
+
+# Order objects so every cutter is applied before the objects it cuts.
+# Returns a list of levels (objects within a level don't depend on each other)
+# and the objects that are part of a dependency cycle.
+def get_boolean_dependency_levels(objects):
+    targets = [obj for obj in objects if obj.type == 'MESH']
+    target_set = set(targets)
+    depends_on = {obj: set() for obj in targets}
+    dependents = {obj: [] for obj in targets}
+
+    for obj in targets:
+        for modifier in obj.modifiers:
+            if modifier.type != 'BOOLEAN':
+                continue
+            for operand in get_boolean_operands(modifier):
+                if operand in target_set and operand != obj and operand not in depends_on[obj]:
+                    depends_on[obj].add(operand)
+                    dependents[operand].append(obj)
+
+    # Kahn's algorithm, one level at a time
+    in_degree = {obj: len(depends_on[obj]) for obj in targets}
+    level = [obj for obj in targets if in_degree[obj] == 0]
+    levels = []
+    while level:
+        levels.append(level)
+        next_level = []
+        for obj in level:
+            for dependent in dependents[obj]:
+                in_degree[dependent] -= 1
+                if in_degree[dependent] == 0:
+                    next_level.append(dependent)
+        level = next_level
+
+    cyclic = [obj for obj in targets if in_degree[obj] > 0]
+    return levels, cyclic
+
+# Apply the boolean modifiers of a whole level with a single depsgraph evaluation.
+# Other modifiers are muted while the level is evaluated so only the booleans get baked.
+def smart_apply_level(context, level, use_cache=False, cache_size_mb=2048, undo_batch=None):
+    level = [obj for obj in level
+             if any(mod.type == 'BOOLEAN' and mod.show_viewport for mod in obj.modifiers)]
+    if not level:
+        return 0
+
+    new_meshes = get_evaluated_meshes(context, level, lambda mod: mod.type == 'BOOLEAN', use_cache, cache_size_mb)
+
+    for obj in level:
+        booleans = [mod for mod in obj.modifiers if mod.type == 'BOOLEAN' and mod.show_viewport]
+        snapshot_object(undo_batch, obj, booleans)
+
+        new_mesh = new_meshes[obj]
+        old_mesh = obj.data
+        mesh_name = old_mesh.name
+        obj.data = new_mesh
+
+        for modifier in booleans:
+            obj.modifiers.remove(modifier)
+
+        # Only take over the original name when the old mesh isn't shared
+        if old_mesh.users == 0:
+            bpy.data.meshes.remove(old_mesh)
+            new_mesh.name = mesh_name
+
+    return len(level)
+
+# Apply all boolean modifiers but leave other modifiers intact.
+# Cutters that are targets themselves are baked first; each object is evaluated once
+# (or not at all when its result is in the geometry cache).
+def apply_boolean_levels(context, objects, use_cache=False, cache_size_mb=2048, undo_batch=None, stream=None):
+    levels, cyclic = get_boolean_dependency_levels(objects)
+    applied = 0
+    for level in levels:
+        # A level can be split into batches, its objects don't depend on each other
+        for chunk in (stream(level) if stream else [level]):
+            applied += smart_apply_level(context, chunk, use_cache, cache_size_mb, undo_batch)
+    return applied, cyclic
+
+class OBJECT_OT_easy_smart_apply(bpy.types.Operator):
+    bl_label = "Smart Apply"
+    bl_idname = "object.easy_smart_apply"
+    bl_description = "Applies all boolean modifiers on the selected objects in dependency order but preserves other modifiers."
+
+    def execute(self, context):
+        if context.mode != 'OBJECT':
+            bpy.ops.object.mode_set(mode='OBJECT')
+
+        props = context.scene.easy_utils_props
+        batch = begin_undo_batch("Smart Apply")
+        stats = new_stream_stats()
+        result = smart_apply(get_target_objects(context), props.use_geometry_cache, props.geometry_cache_size,
+                             props.memory_budget_mb, props.memory_guard_action, batch,
+                             get_operator_stream(props, stats, "Smart Apply", {}))
+
+        if result.messages:
+            self.report({'WARNING'}, f"Smart Apply completed on {result.count} objects, " + "; ".join(result.messages)
+                        + stream_report(props, stats))
+        else:
+            self.report({'INFO'}, f"Smart Apply completed for boolean modifiers on {result.count} objects.{stream_report(props, stats)}")
+        return {'FINISHED'}
+
+# --- Freeze / Unfreeze ---
+
+# Custom property holding the parametric state of a frozen object
+FROZEN_STATE_KEY = "easyops_frozen"
+
+def is_frozen(obj):
+    return FROZEN_STATE_KEY in obj.keys()
+
+# Replace the object's mesh with its evaluated result. The original mesh is kept with a fake
+# user, and the modifiers are disabled and detached from the objects they reference, so the
+# object has no modifier work and no relations that would trigger a re-evaluation.
+def freeze_objects(context, objects, use_cache=False, cache_size_mb=2048):
+    objects = [obj for obj in objects if obj.type == 'MESH' and not is_frozen(obj)]
+    frozen_meshes = get_evaluated_meshes(context, objects, None, use_cache, cache_size_mb)
+
+    for obj in objects:
+        frozen_mesh = frozen_meshes[obj]
+        original_mesh = obj.data
+        original_mesh.use_fake_user = True
+        frozen_mesh.name = f"{original_mesh.name}_frozen"
+
+        modifiers = []
+        for modifier in obj.modifiers:
+            pointers = {}
+            for prop in modifier.bl_rna.properties:
+                if prop.type != 'POINTER' or prop.is_readonly:
+                    continue
+                value = getattr(modifier, prop.identifier)
+                if isinstance(value, bpy.types.Object):
+                    pointers[prop.identifier] = ['OBJECT', value.name]
+                elif isinstance(value, bpy.types.Collection):
+                    pointers[prop.identifier] = ['COLLECTION', value.name]
+                else:
+                    continue
+                setattr(modifier, prop.identifier, None)
+
+            modifiers.append({
+                "name": modifier.name,
+                "show_viewport": modifier.show_viewport,
+                "show_render": modifier.show_render,
+                "pointers": pointers,
+            })
+            modifier.show_viewport = False
+            modifier.show_render = False
+
+        obj.data = frozen_mesh
+        obj[FROZEN_STATE_KEY] = json.dumps({"mesh": original_mesh.name, "modifiers": modifiers})
+
+    return len(objects)
+
+# Restore the original mesh and modifier stack of frozen objects
+def unfreeze_objects(objects):
+    count = 0
+    for obj in objects:
+        if obj.type != 'MESH' or not is_frozen(obj):
+            continue
+        state = json.loads(obj[FROZEN_STATE_KEY])
+        original_mesh = bpy.data.meshes.get(state["mesh"])
+        if original_mesh is None:
+            continue
+
+        frozen_mesh = obj.data
+        obj.data = original_mesh
+        original_mesh.use_fake_user = False
+        if frozen_mesh.users == 0:
+            bpy.data.meshes.remove(frozen_mesh)
+
+        for saved in state["modifiers"]:
+            modifier = obj.modifiers.get(saved["name"])
+            if modifier is None:
+                continue
+            for identifier, (id_type, name) in saved["pointers"].items():
+                data = bpy.data.objects if id_type == 'OBJECT' else bpy.data.collections
+                setattr(modifier, identifier, data.get(name))
+            modifier.show_viewport = saved["show_viewport"]
+            modifier.show_render = saved["show_render"]
+
+        del obj[FROZEN_STATE_KEY]
+        count += 1
+    return count
+
+class OBJECT_OT_easy_freeze(bpy.types.Operator):
+    bl_label = "Freeze Modifiers"
+    bl_idname = "object.easy_freeze"
+    bl_description = "Bakes the evaluated modifier stack of selected/all mesh objects into their mesh. The original mesh and modifiers are kept so the objects can be unfrozen."
+
+    def execute(self, context):
+        if context.mode != 'OBJECT':
+            bpy.ops.object.mode_set(mode='OBJECT')
+
+        props = context.scene.easy_utils_props
+        stats = new_stream_stats()
+        result = freeze(get_target_objects(context), props.use_geometry_cache, props.geometry_cache_size,
+                        get_operator_stream(props, stats, "Freeze", {}))
+        self.report({'INFO'}, f"Froze {result.count} objects.{stream_report(props, stats)}")
+        return {'FINISHED'}
+
+class OBJECT_OT_easy_unfreeze(bpy.types.Operator):
+    bl_label = "Unfreeze Modifiers"
+    bl_idname = "object.easy_unfreeze"
+    bl_description = "Restores the original mesh and modifier stack of frozen objects."
+
+    def execute(self, context):
+        if context.mode != 'OBJECT':
+            bpy.ops.object.mode_set(mode='OBJECT')
+
+        result = unfreeze(get_target_objects(context))
+        self.report({'INFO'}, f"Unfroze {result.count} objects.")
+        return {'FINISHED'}
+
+# --- Smart Decimate ---
+
+# Cached source (pre-decimate) triangle counts keyed by object name: (signature, triangles)
+_source_triangle_cache = {}
+SOURCE_TRIANGLE_CACHE_LIMIT = 65536
+
+# Hashable summary of a modifier's settings, including the transforms of the objects it references
+# unless include_references is False
+def get_modifier_signature(modifier, include_references=True):
+    values = [modifier.type, modifier.show_viewport]
+    for prop in modifier.bl_rna.properties:
+        if prop.is_readonly or prop.identifier in {"name", "show_expanded", "show_in_editmode", "show_on_cage"}:
+            continue
+        value = getattr(modifier, prop.identifier)
+        if prop.type == 'POINTER':
+            if not include_references and isinstance(value, (bpy.types.Object, bpy.types.Collection)):
+                value = None
+            elif isinstance(value, bpy.types.Object):
+                value = (value.name, tuple(tuple(row) for row in value.matrix_world),
+                         len(value.data.polygons) if value.type == 'MESH' else 0)
+            elif isinstance(value, bpy.types.Collection):
+                value = tuple(sorted(obj.name for obj in value.all_objects))
+            else:
+                value = getattr(value, "name", None)
+        elif prop.type in {'FLOAT', 'INT', 'BOOLEAN'} and prop.is_array:
+            value = tuple(value)
+        elif prop.type == 'ENUM' and prop.is_enum_flag:
+            value = tuple(sorted(value))
+        values.append((prop.identifier, value))
+    return tuple(values)
 
-                # Delete loose geometry
-                bpy.ops.mesh.delete_loose()
+# Signature of everything that changes an object's triangle count before decimation
+def get_source_signature(obj):
+    mesh = obj.data
+    return (
+        mesh.name, len(mesh.vertices), len(mesh.polygons), len(mesh.loops),
+        tuple(get_modifier_signature(mod) for mod in obj.modifiers if mod.type != 'DECIMATE'),
+    )
+
+# Triangle count of an evaluated mesh object (n-gons count as their fan triangulation)
+def get_evaluated_triangles(obj_eval):
+    mesh = obj_eval.data
+    return len(mesh.loops) - 2 * len(mesh.polygons)
+
+# Get the pre-decimate triangle counts of objects, evaluating only the objects that aren't cached.
+# All uncached objects are evaluated together with their Decimate modifiers muted.
+def get_source_triangle_counts(context, objects):
+    prune_object_cache(_source_triangle_cache)
+    signatures = {obj: get_source_signature(obj) for obj in objects}
+    # Kept locally as well, the cache may evict entries of this call when it has more objects than fit
+    entries = {obj: cache_get(_source_triangle_cache, obj.name, (None, 0)) for obj in objects}
+    missing = [obj for obj in objects if entries[obj][0] != signatures[obj]]
+
+    if missing:
+        muted = []
+        for obj in missing:
+            for modifier in obj.modifiers:
+                if modifier.type == 'DECIMATE' and modifier.show_viewport:
+                    modifier.show_viewport = False
+                    muted.append(modifier)
+
+        depsgraph = context.evaluated_depsgraph_get()
+        for obj in missing:
+            entries[obj] = (signatures[obj], get_evaluated_triangles(obj.evaluated_get(depsgraph)))
+            cache_put(_source_triangle_cache, obj.name, entries[obj], SOURCE_TRIANGLE_CACHE_LIMIT)
+
+        for modifier in muted:
+            modifier.show_viewport = True
+
+    return np.array([entries[obj][1] for obj in objects], dtype=np.float64)
+
+# Relative on-screen size of each object, seen from the scene camera when there is one
+def get_screen_sizes(context, objects):
+    camera = context.scene.camera
+    sizes = np.empty(len(objects), dtype=np.float64)
+    for i, obj in enumerate(objects):
+        radius = max(obj.dimensions) * 0.5
+        if camera is not None:
+            distance = (obj.matrix_world.translation - camera.matrix_world.translation).length
+            radius /= max(distance, 1e-6)
+        sizes[i] = radius
+    return sizes
+
+# Split a triangle budget between objects.
+# Each object receives min(T_i, lambda * w_i) triangles with w_i = T_i * importance_i; lambda is found
+# with one sort (water-filling), so this runs in O(n log n).
+def allocate_triangle_budget(triangles, importance, budget, min_ratio=0.01):
+    if budget >= triangles.sum():
+        return np.ones_like(triangles)
+
+    weights = triangles * importance
+    saturation = 1.0 / importance  # lambda at which an object keeps all its triangles
+    order = np.argsort(saturation)
+    sorted_saturation = saturation[order]
+    # Triangles of objects already saturated, and weights of the ones still scaling with lambda
+    saturated = np.concatenate(([0.0], np.cumsum(triangles[order])))
+    remaining = np.concatenate((np.cumsum(weights[order][::-1])[::-1], [0.0]))
+
+    lam = 0.0
+    for k in range(len(order)):
+        if remaining[k] <= 0.0:
+            break
+        lam = (budget - saturated[k]) / remaining[k]
+        if lam <= sorted_saturation[k]:
+            break
+
+    return np.clip(lam * importance, min_ratio, 1.0)
+
+# Decimate objects so their total evaluated triangle count lands near the budget
+def decimate_to_budget(context, objects, budget, tolerance, screen_size_weight, max_passes=3):
+    triangles = get_source_triangle_counts(context, objects)
+    sizes = get_screen_sizes(context, objects)
+    importance = (sizes / max(sizes.mean(), 1e-12)) ** screen_size_weight
+    importance = np.maximum(importance, 1e-6)
+
+    modifiers = []
+    for obj in objects:
+        modifier = next((mod for mod in obj.modifiers if mod.type == 'DECIMATE'), None)
+        if modifier is None:
+            modifier = obj.modifiers.new(name="Decimate", type='DECIMATE')
+        modifier.decimate_type = 'COLLAPSE'
+        modifier.show_viewport = True
+        modifiers.append(modifier)
+
+    target = float(budget)
+    total = 0
+    for _ in range(max_passes):
+        ratios = allocate_triangle_budget(triangles, importance, target)
+        for modifier, ratio in zip(modifiers, ratios):
+            modifier.ratio = float(ratio)
+
+        depsgraph = context.evaluated_depsgraph_get()
+        total = sum(get_evaluated_triangles(obj.evaluated_get(depsgraph)) for obj in objects)
+        if total == 0 or abs(total - budget) <= tolerance * budget:
+            break
+        # Collapse decimation isn't exact, correct the target by the observed error
+        target *= budget / total
+
+    return total
+
+# Cached source surfaces keyed by object name: (signature, world scale, BVH tree, sample points).
+# A BVH tree holds the whole surface, so only the most recently used objects are kept.
+_source_sample_cache = {}
+SOURCE_SAMPLE_CACHE_LIMIT = 256
+
+# Sample an evaluated mesh surface at its vertices and face centers. Only the side that is
+# measured is subsampled, distances are always taken to the full surface of the other side.
+def get_mesh_samples(mesh, max_samples):
+    co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", co)
+    centers = np.empty(len(mesh.polygons) * 3, dtype=np.float32)
+    mesh.polygons.foreach_get("center", centers)
+    points = np.concatenate((co.reshape(-1, 3), centers.reshape(-1, 3)))
+    if len(points) > max_samples:
+        points = points[np.linspace(0, len(points) - 1, max_samples).astype(np.int64)]
+    return points
+
+# BVH tree of the full surface of a mesh, for point to surface distances
+def build_bvhtree(mesh):
+    bm = bmesh.new()
+    bm.from_mesh(mesh)
+    tree = BVHTree.FromBMesh(bm)
+    bm.free()
+    return tree
+
+# Largest distance from the points to the surface in the tree, stops as soon as the limit is exceeded
+def get_max_deviation(tree, points, limit):
+    deviation = 0.0
+    for point in points:
+        distance = tree.find_nearest(point)[3]
+        if distance is None:
+            distance = math.inf
+        if distance > deviation:
+            deviation = distance
+            if deviation > limit:
+                break
+    return deviation
+
+# Build (or reuse) the BVH trees and samples of the pre-decimate surface of each object
+def get_source_samples(context, objects, max_samples):
+    prune_object_cache(_source_sample_cache)
+    signatures = {obj: get_source_signature(obj) for obj in objects}
+    entries = {obj: cache_get(_source_sample_cache, obj.name, (None,)) for obj in objects}
+    missing = [obj for obj in objects if entries[obj][0] != signatures[obj]]
+
+    if missing:
+        muted = []
+        for obj in missing:
+            for modifier in obj.modifiers:
+                if modifier.type == 'DECIMATE' and modifier.show_viewport:
+                    modifier.show_viewport = False
+                    muted.append(modifier)
+
+        depsgraph = context.evaluated_depsgraph_get()
+        for obj in missing:
+            mesh = obj.evaluated_get(depsgraph).data
+            scale = max(abs(value) for value in obj.matrix_world.to_scale())
+            entries[obj] = (signatures[obj], scale, build_bvhtree(mesh), get_mesh_samples(mesh, max_samples))
+            cache_put(_source_sample_cache, obj.name, entries[obj], SOURCE_SAMPLE_CACHE_LIMIT)
+
+        for modifier in muted:
+            modifier.show_viewport = True
+
+    return [entries[obj][1:] for obj in objects]
+
+# Set how aggressive a Decimate modifier is: 0 keeps the mesh, 1 is the strongest setting searched
+def set_decimate_strength(modifier, strength, min_ratio, max_angle):
+    if modifier.decimate_type == 'DISSOLVE':
+        modifier.angle_limit = strength * max_angle
+    else:
+        modifier.ratio = 1.0 - strength * (1.0 - min_ratio)
+
+# Find, per object, the strongest decimation whose deviation from the source stays under max_error.
+# All objects are bisected in lockstep so each step is a single depsgraph evaluation, letting Blender
+# evaluate the objects on its worker threads. The strongest setting is tried first and objects drop
+# out of the search as soon as their interval is below the precision.
+def decimate_to_error(context, objects, max_error, decimate_type, precision, max_samples=20000,
+                      min_ratio=0.01, max_angle=math.radians(60.0)):
+    sources = get_source_samples(context, objects, max_samples)
+
+    modifiers = []
+    for obj in objects:
+        modifier = next((mod for mod in obj.modifiers if mod.type == 'DECIMATE'), None)
+        if modifier is None:
+            modifier = obj.modifiers.new(name="Decimate", type='DECIMATE')
+        modifier.decimate_type = decimate_type
+        modifier.show_viewport = True
+        modifiers.append(modifier)
+
+    # Strength 'good' is known to be within the error, 'bad' is known to exceed it
+    good = [0.0] * len(objects)
+    bad = [None] * len(objects)
+    active = list(range(len(objects)))
+    while active:
+        trial = {i: 1.0 if bad[i] is None else (good[i] + bad[i]) * 0.5 for i in active}
+        for i, strength in trial.items():
+            set_decimate_strength(modifiers[i], strength, min_ratio, max_angle)
 
-                # Dissolve degenerate geometry
-                bpy.ops.mesh.dissolve_degenerate()
+        depsgraph = context.evaluated_depsgraph_get()
+        for i, strength in trial.items():
+            scale, source_tree, source_points = sources[i]
+            limit = max_error / max(scale, 1e-12)
+            mesh = objects[i].evaluated_get(depsgraph).data
+            points = get_mesh_samples(mesh, max_samples)
+            deviation = 0.0
+            if len(points):
+                # Decimated surface against the source surface, then source samples against the decimated surface
+                deviation = get_max_deviation(source_tree, points, limit)
+                if deviation <= limit:
+                    deviation = max(deviation, get_max_deviation(build_bvhtree(mesh), source_points, limit))
+            if deviation <= limit:
+                good[i] = strength
+            else:
+                bad[i] = strength
 
-                bpy.ops.object.mode_set(mode='OBJECT')
+        active = [i for i in active if bad[i] is not None and bad[i] - good[i] > precision]
 
-        self.report({'INFO'}, "Cleaned geometry on selected/all objects.")
+    for modifier, strength in zip(modifiers, good):
+        set_decimate_strength(modifier, strength, min_ratio, max_angle)
+
+    return good
+
+# Smart Decimate operator
+class OBJECT_OT_easy_smart_decimate(bpy.types.Operator):
+    bl_label = "Smart Decimate"
+    bl_idname = "object.easy_smart_decimate"
+    bl_description = "Adds a decimate modifier to reduce the polygon count. In Budget mode the ratio of each object is chosen so the total triangle count matches the budget."
+
+    def execute(self, context):
+        props = context.scene.easy_utils_props
+        if props.decimate_mode != 'RATIO' and context.mode != 'OBJECT':
+            bpy.ops.object.mode_set(mode='OBJECT')
+        # In Ratio mode only adds one if there's no Decimate modifier yet
+        result = decimate(get_target_objects(context), props.decimate_mode, props.decimate_ratio, props.triangle_budget,
+                          props.budget_tolerance, props.screen_size_weight, props.max_deviation,
+                          props.error_decimate_type, props.search_precision)
+
+        if props.decimate_mode == 'BUDGET':
+            self.report({'INFO'}, f"Decimated {result.count} objects to {result.details['triangles']:,} triangles (budget {props.triangle_budget:,}).")
+            return {'FINISHED'}
+
+        if props.decimate_mode == 'ERROR':
+            strengths = result.details["strengths"]
+            average = sum(strengths) / max(len(strengths), 1)
+            self.report({'INFO'}, f"Decimated {result.count} objects within {props.max_deviation} (average strength {average:.2f}).")
+            return {'FINISHED'}
+
+        self.report({'INFO'}, "Decimate applied to reduce polygon count.")
         return {'FINISHED'}
 
+# --- LOD Chain Generator ---
+
+# Parse a comma separated list of numbers such as "1.0, 0.5, 0.25"
+def parse_number_list(text):
+    values = []
+    for part in text.replace(";", ",").split(","):
+        part = part.strip()
+        if part:
+            values.append(float(part))
+    return values
+
+# Decimate each mesh by its own ratio. Every mesh gets a temporary object so the whole
+# batch is evaluated by a single depsgraph update.
+def decimate_meshes(context, meshes, ratios):
+    temp_collection = bpy.data.collections.new("EASYOPS_TEMP")
+    context.scene.collection.children.link(temp_collection)
+
+    temp_objects = []
+    for mesh, ratio in zip(meshes, ratios):
+        temp_obj = bpy.data.objects.new("EASYOPS_TEMP", mesh)
+        temp_collection.objects.link(temp_obj)
+        modifier = temp_obj.modifiers.new(name="Decimate", type='DECIMATE')
+        modifier.ratio = ratio
+        temp_objects.append(temp_obj)
+
+    depsgraph = context.evaluated_depsgraph_get()
+    results = [bpy.data.meshes.new_from_object(temp_obj.evaluated_get(depsgraph)) for temp_obj in temp_objects]
+
+    for temp_obj in temp_objects:
+        bpy.data.objects.remove(temp_obj)
+    bpy.data.collections.remove(temp_collection)
+    return results
+
+# Generate LOD meshes for objects. Objects sharing a mesh and an identical modifier stack
+# share one source evaluation and one set of LOD meshes. Each LOD is decimated from the
+# previous one, and all sources of one level are decimated together.
+def generate_lod_chains(context, objects, levels, mode, prefix):
+    groups = {}
+    for obj in objects:
+        key = (obj.data.name, tuple(get_modifier_signature(mod) for mod in obj.modifiers))
+        groups.setdefault(key, []).append(obj)
+    groups = list(groups.values())
+
+    depsgraph = context.evaluated_depsgraph_get()
+    current = [bpy.data.meshes.new_from_object(group[0].evaluated_get(depsgraph)) for group in groups]
+    created = list(current)
+    current_ratio = [1.0] * len(groups)
+    chains = [[] for _ in groups]
+
+    for value in levels:
+        to_decimate = []
+        for i, mesh in enumerate(current):
+            if mode == 'TRIANGLES':
+                triangles = len(mesh.loops) - 2 * len(mesh.polygons)
+                relative = value / max(triangles, 1)
+            else:
+                relative = value / current_ratio[i]
+            # A level that doesn't reduce the mesh reuses the previous LOD mesh
+            if relative < 0.999:
+                to_decimate.append((i, relative))
+                current_ratio[i] = value
+
+        decimated = decimate_meshes(context, [current[i] for i, _ in to_decimate],
+                                    [ratio for _, ratio in to_decimate])
+        for (i, _), mesh in zip(to_decimate, decimated):
+            current[i] = mesh
+        created.extend(decimated)
+
+        for i in range(len(groups)):
+            chains[i].append(current[i])
+
+    # Name each LOD mesh after the first level that uses it
+    for group, chain in zip(groups, chains):
+        base_name = get_prefixed_name(group[0].name, prefix)
+        for level, mesh in enumerate(chain):
+            if level == 0 or mesh != chain[level - 1]:
+                mesh.name = f"{base_name}_LOD{level}"
+
+    lod_objects = []
+    lods_collection = get_or_create_collection("EASYOPS_LODS")
+    for group, chain in zip(groups, chains):
+        for obj in group:
+            base_name = get_prefixed_name(obj.name, prefix)
+            for level, mesh in enumerate(chain):
+                lod_obj = bpy.data.objects.new(f"{base_name}_LOD{level}", mesh)
+                lod_obj.matrix_world = obj.matrix_world.copy()
+                lods_collection.objects.link(lod_obj)
+                lod_objects.append(lod_obj)
+
+    # Intermediate meshes that didn't end up as a LOD
+    for mesh in created:
+        if mesh.users == 0:
+            bpy.data.meshes.remove(mesh)
+    return lod_objects
+
+# Name with the rename prefix added when it isn't there yet
+def get_prefixed_name(name, prefix):
+    return name if name.startswith(prefix) else f"{prefix}{name}"
+
+class OBJECT_OT_easy_generate_lods(bpy.types.Operator):
+    bl_label = "Generate LODs"
+    bl_idname = "object.easy_generate_lods"
+    bl_description = "Generates a chain of decimated LOD objects for selected/all mesh objects. Each LOD is decimated from the previous one."
+
+    def execute(self, context):
+        props = context.scene.easy_utils_props
+        if context.mode != 'OBJECT':
+            bpy.ops.object.mode_set(mode='OBJECT')
+
+        try:
+            levels = parse_number_list(props.lod_levels)
+        except ValueError:
+            self.report({'ERROR'}, f"Invalid LOD levels: '{props.lod_levels}'.")
+            return {'CANCELLED'}
+
+        stats = new_stream_stats()
+        try:
+            result = generate_lods(get_target_objects(context), levels, props.lod_mode, props.rename_prefix,
+                                   lambda objects: stream_batches(objects, props, stats))
+        except ValueError as error:
+            self.report({'ERROR'}, str(error))
+            return {'CANCELLED'}
+
+        self.report({'INFO'}, f"Generated {result.count} LOD objects for {len(result.objects)} objects.{stream_report(props, stats)}")
+        return {'FINISHED'}
+
+# Sharpen edges operator
+class OBJECT_OT_easy_sharpen_edges(bpy.types.Operator):
+    bl_label = "Sharpen Edges"
+    bl_idname = "object.easy_sharpen_edges"
+    bl_description = "Marks selected edges as sharp / equivalent to flat shading."
+
+    def execute(self, context):
+        # Leaving edit mode writes the edge selection back to the meshes
+        if context.mode != 'OBJECT':
+            bpy.ops.object.mode_set(mode='OBJECT')
+
+        batch = begin_undo_batch("Flat Shading")
+        result = flat_shading(get_target_objects(context), undo_batch=batch)
+        self.report({'INFO'}, f"{result.count} sharp edges marked on selected/all objects.")
+        return {'FINISHED'}
+
+# Clean geometry operator
+class OBJECT_OT_easy_clean_geometry(bpy.types.Operator):
+    bl_label = "Clean Geometry"
+    bl_idname = "object.easy_clean_geometry"
+    bl_description = "Cleans loose geometry, removes doubles (merges vertices by distance), and dissolves degenerate faces."
+
+    def execute(self, context):
+        if context.mode != 'OBJECT':
+            bpy.ops.object.mode_set(mode='OBJECT')
+
+        props = context.scene.easy_utils_props
+        batch = begin_undo_batch("Clean Geometry")
+        stats = new_stream_stats()
+        # Merge by distance, delete loose and dissolve degenerate geometry without edit mode
+        result = clean(get_target_objects(context), undo_batch=batch,
+                       stream=get_operator_stream(props, stats, "Clean Geometry", {}), **get_chunk_settings(props))
+
+        message = f"Cleaned geometry on selected/all objects.{stream_report(props, stats)}"
+        if result.messages:
+            self.report({'WARNING'}, f"{message} " + "; ".join(result.messages[:5]))
+        else:
+            self.report({'INFO'}, message)
+        return {'FINISHED'}
 
 # Operator to Remove Doubles (Merge by Distance) on All Meshes
 class OBJECT_OT_easy_remove_doubles(bpy.types.Operator):
@@ -387,59 +2860,110 @@ class OBJECT_OT_easy_remove_doubles(bpy.types.Operator):
     bl_description = "Removes doubles by merging vertices by distance for all selected mesh objects. If no objects are selected, applies to all mesh objects."
 
     def execute(self, context):
-        target_objects = get_target_objects(context)
-        for obj in target_objects:
-            if obj.type == 'MESH':
-                bpy.context.view_layer.objects.active = obj
-                bpy.ops.object.mode_set(mode='EDIT')
-                bpy.ops.mesh.select_all(action='SELECT')
-                bpy.ops.mesh.remove_doubles()
-                bpy.ops.object.mode_set(mode='OBJECT')
-
-        self.report({'INFO'}, "Doubles removed from selected/all mesh objects.")
+        if context.mode != 'OBJECT':
+            bpy.ops.object.mode_set(mode='OBJECT')
+
+        props = context.scene.easy_utils_props
+        batch = begin_undo_batch("Remove Doubles")
+        stats = new_stream_stats()
+        result = remove_doubles(get_target_objects(context), undo_batch=batch,
+                                stream=get_operator_stream(props, stats, "Remove Doubles", {}), **get_chunk_settings(props))
+
+        message = f"Doubles removed from selected/all mesh objects.{stream_report(props, stats)}"
+        if result.messages:
+            self.report({'WARNING'}, f"{message} " + "; ".join(result.messages[:5]))
+        else:
+            self.report({'INFO'}, message)
         return {'FINISHED'}
 
-# Detect and mark sharp edges with customizable angle threshold
+# Polygon index of every loop
+def get_loop_polygon_indices(mesh):
+    loop_totals = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get("loop_total", loop_totals)
+    return np.repeat(np.arange(len(mesh.polygons), dtype=np.int32), loop_totals)
+
+# Mask of the manifold edges whose two faces meet at more than the angle threshold
+def compute_sharp_edge_mask(mesh, angle_threshold_rad):
+    edge_count = len(mesh.edges)
+    loop_edges = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("edge_index", loop_edges)
+    loop_polygons = get_loop_polygon_indices(mesh)
+    normals = np.empty(len(mesh.polygons) * 3, dtype=np.float32)
+    mesh.polygons.foreach_get("normal", normals)
+    normals = normals.reshape(-1, 3)
+
+    # Group the loops by edge; manifold edges have exactly two faces
+    order = np.argsort(loop_edges, kind='stable')
+    sorted_polygons = loop_polygons[order]
+    face_counts = np.bincount(loop_edges, minlength=edge_count)
+    starts = np.concatenate(([0], np.cumsum(face_counts)[:-1]))
+    manifold = np.flatnonzero(face_counts == 2)
+    first = sorted_polygons[starts[manifold]]
+    second = sorted_polygons[starts[manifold] + 1]
+
+    cos_angle = np.einsum('ij,ij->i', normals[first], normals[second])
+    mask = np.zeros(edge_count, dtype=bool)
+    mask[manifold] = cos_angle < math.cos(angle_threshold_rad)
+    return mask
+
+# Add the masked edges to a boolean edge flag such as use_edge_sharp or use_seam
+def add_edge_flags(mesh, attribute, mask):
+    flags = np.empty(len(mesh.edges), dtype=bool)
+    mesh.edges.foreach_get(attribute, flags)
+    mesh.edges.foreach_set(attribute, flags | mask)
+
+# Custom data name of bevel weight and crease on edges before Blender 4.0
+EDGE_FLOAT_LAYERS = {
+    "bevel_weight_edge": ("use_customdata_edge_bevel", "bevel_weight"),
+    "crease_edge": ("use_customdata_edge_crease", "crease"),
+}
+
+# Per-edge bevel weight or crease values, zero when the mesh has none
+def get_edge_float_attribute(mesh, name):
+    values = np.zeros(len(mesh.edges), dtype=np.float32)
+    if bpy.app.version >= (4, 0, 0):
+        attribute = mesh.attributes.get(name)
+        if attribute is not None and attribute.domain == 'EDGE' and attribute.data_type == 'FLOAT':
+            attribute.data.foreach_get("value", values)
+    else:
+        layer_toggle, edge_attribute = EDGE_FLOAT_LAYERS[name]
+        if getattr(mesh, layer_toggle):
+            mesh.edges.foreach_get(edge_attribute, values)
+    return values
+
+# Write per-edge bevel weight or crease values.
+# Blender 4.0+ stores them as generic attributes, earlier versions as edge custom data.
+def set_edge_float_attribute(mesh, name, values):
+    if bpy.app.version >= (4, 0, 0):
+        attribute = mesh.attributes.get(name)
+        if attribute is None or attribute.domain != 'EDGE' or attribute.data_type != 'FLOAT':
+            if attribute is not None:
+                mesh.attributes.remove(attribute)
+            attribute = mesh.attributes.new(name, 'FLOAT', 'EDGE')
+        attribute.data.foreach_set("value", values)
+    else:
+        layer_toggle, edge_attribute = EDGE_FLOAT_LAYERS[name]
+        setattr(mesh, layer_toggle, True)
+        mesh.edges.foreach_set(edge_attribute, values)
+
+# Detect and mark sharp edges with customizable angle threshold.
+# Bevel weight and crease are raised to full on the detected edges only, so a weight-limited
+# bevel doesn't bevel the whole mesh and hand painted values elsewhere are kept.
+# Works in object mode without any operators.
 def detect_sharp_edges(obj, angle_threshold=30):
     angle_threshold_rad = math.radians(angle_threshold)
-    
-    # Ensure the object is in edit mode
-    bpy.context.view_layer.objects.active = obj
-    bpy.ops.object.mode_set(mode='EDIT')
-    
-    # Create a BMesh for edge detection
-    bm = bmesh.from_edit_mesh(obj.data)
-    
-    # Loop through all edges
-    for edge in bm.edges:
-        if not edge.is_manifold:  # Skip non-manifold edges
-            continue
-        
-        # Get the faces adjacent to this edge
-        linked_faces = edge.link_faces
-        
-        # Ensure the edge is between two faces
-        if len(linked_faces) == 2:
-            # Calculate the angle between the faces
-            angle = linked_faces[0].normal.angle(linked_faces[1].normal)
-            
-            # Mark sharp if the angle exceeds the threshold
-            if angle > angle_threshold_rad:
-                edge.smooth = False  # Mark as sharp (affects shading)
-                edge.seam = True  # Optional: mark as seam for UVs too
-    
-    # Update the BMesh
-    bmesh.update_edit_mesh(obj.data)
+    mesh = obj.data
 
-    # Apply bevel weight to selected edges
-    bpy.ops.mesh.select_all(action='SELECT')
-    bpy.ops.transform.edge_bevelweight(value=1.0)  # Apply maximum bevel weight
-    
-    # Apply crease weight to selected edges (optional, can be toggled by user)
-    bpy.ops.transform.edge_crease(value=1.0)  # Apply full creasing
+    mask = compute_sharp_edge_mask(mesh, angle_threshold_rad)
+    add_edge_flags(mesh, "use_edge_sharp", mask)  # Mark as sharp (affects shading)
+    add_edge_flags(mesh, "use_seam", mask)  # Optional: mark as seam for UVs too
 
-    # Return to object mode
-    bpy.ops.object.mode_set(mode='OBJECT')
+    weights = mask.astype(np.float32)
+    for name in ("bevel_weight_edge", "crease_edge"):  # Full bevel weight and crease on sharp edges
+        set_edge_float_attribute(mesh, name, np.maximum(get_edge_float_attribute(mesh, name), weights))
+
+    mesh.update()
+    return int(mask.sum())
 
 # Add or update bevel modifier for smart sharpening
 def apply_bevel_modifier(obj):
@@ -455,10 +2979,45 @@ def apply_bevel_modifier(obj):
     bevel_mod.segments = 3  # Adjust segments as needed
     bevel_mod.limit_method = 'WEIGHT'  # Use weight for bevel control
 
-# Enable auto smooth with user-defined angle
+# Set smooth or flat shading on every face of a mesh
+def set_smooth_shading(mesh, smooth):
+    mesh.polygons.foreach_set("use_smooth", np.full(len(mesh.polygons), smooth, dtype=bool))
+    mesh.update()
+
+# Write a boolean attribute, replacing an existing one with a different domain or type
+def set_boolean_attribute(mesh, name, domain, values):
+    attribute = mesh.attributes.get(name)
+    if attribute is None or attribute.domain != domain or attribute.data_type != 'BOOLEAN':
+        if attribute is not None:
+            mesh.attributes.remove(attribute)
+        attribute = mesh.attributes.new(name, 'BOOLEAN', domain)
+    attribute.data.foreach_set("value", values)
+
+# Bake the angle based sharp edges into sharp_edge and mark all faces smooth (sharp_face).
+# This replaces the Smooth by Angle modifier on Blender 4.1+ without any runtime cost.
+def bake_smooth_by_angle(mesh, smooth_angle_rad, keep_sharp_edges=True):
+    sharp = compute_sharp_edge_mask(mesh, smooth_angle_rad)
+    existing = mesh.attributes.get("sharp_edge")
+    if keep_sharp_edges and existing is not None and existing.domain == 'EDGE':
+        values = np.empty(len(mesh.edges), dtype=bool)
+        existing.data.foreach_get("value", values)
+        sharp |= values
+
+    set_boolean_attribute(mesh, "sharp_edge", 'EDGE', sharp)
+    set_boolean_attribute(mesh, "sharp_face", 'FACE', np.zeros(len(mesh.polygons), dtype=bool))
+    mesh.update()
+
+# Enable auto smooth with user-defined angle.
+# Auto smooth was removed in Blender 4.1, there the sharp edges are baked instead.
 def enable_auto_smooth(obj, smooth_angle=30):
-    obj.data.use_auto_smooth = True
-    obj.data.auto_smooth_angle = math.radians(smooth_angle)
+    set_auto_smooth(obj.data, smooth_angle)
+
+def set_auto_smooth(mesh, smooth_angle=30):
+    if bpy.app.version >= (4, 1, 0):
+        bake_smooth_by_angle(mesh, math.radians(smooth_angle))
+    else:
+        mesh.use_auto_smooth = True
+        mesh.auto_smooth_angle = math.radians(smooth_angle)
 
 # Main SSharpen operator
 class OBJECT_OT_easy_ssharpen(bpy.types.Operator):
@@ -467,50 +3026,1823 @@ class OBJECT_OT_easy_ssharpen(bpy.types.Operator):
     bl_description = "Detect sharp edges based on angle, apply bevel and crease, and enable auto smooth."
 
     def execute(self, context):
-        target_objects = get_target_objects(context)  # Assuming this function gets selected or all objects
-        for obj in target_objects:
-            if obj.type == 'MESH':
-                # Detect sharp edges based on angle
-                detect_sharp_edges(obj, angle_threshold=30)  # You can expose this as a parameter
-                
-                # Apply bevel modifier for sharp edges
-                apply_bevel_modifier(obj)
-                
-                # Enable auto smooth to maintain smooth surfaces
-                enable_auto_smooth(obj, smooth_angle=30)  # You can expose this as a parameter
-        
-        self.report({'INFO'}, "SSharpen applied to selected/all objects.")
+        # Mesh data is written directly, edit mode would overwrite it on exit
+        if context.mode != 'OBJECT':
+            bpy.ops.object.mode_set(mode='OBJECT')
+
+        props = context.scene.easy_utils_props
+        batch = begin_undo_batch("SSharpen")
+        stats = new_stream_stats()
+        # Sharp edges, bevel weights and auto smooth at 30 degrees, plus a weighted bevel on every object
+        result = ssharpen(get_target_objects(context), 30, batch, get_operator_stream(props, stats, "SSharpen", {"angle": 30}))
+
+        self.report({'INFO'}, f"SSharpen applied to selected/all objects ({result.count} sharp edges).{stream_report(props, stats)}")
+        return {'FINISHED'}
+
+# --- Weighted Normals ---
+# Face weighted normals baked into custom split normals, instead of a Weighted Normal modifier
+# that is evaluated again on every update. Normals are averaged per smooth fan: the corners
+# around a vertex that are connected through smooth edges, so SSharpen's sharp edges stay hard.
+
+# Pairs of loops around the same vertex that are connected through a smooth manifold edge
+def get_smooth_fan_links(loop_verts, loop_edges, next_loops, smooth_edges):
+    order = np.argsort(loop_edges, kind='stable')
+    face_counts = np.bincount(loop_edges, minlength=len(smooth_edges))
+    starts = np.concatenate(([0], np.cumsum(face_counts)[:-1]))
+    linked = np.flatnonzero((face_counts == 2) & smooth_edges)
+    a = order[starts[linked]]
+    b = order[starts[linked] + 1]
+    # With consistent winding the second face runs the edge the other way round
+    same = loop_verts[a] == loop_verts[b]
+    first = np.concatenate([a, next_loops[a]])
+    second = np.concatenate([np.where(same, b, next_loops[b]), np.where(same, next_loops[b], b)])
+    return first, second
+
+# Loop normals averaged over every smooth fan, weighted by face area, corner angle or both
+def compute_weighted_normals(mesh, weighting='FACE_AREA_ANGLE'):
+    arrays = read_join_arrays(mesh)
+    co = arrays["co"].reshape(-1, 3).astype(np.float64)
+    loop_verts, loop_edges = arrays["loop_verts"], arrays["loop_edges"]
+    loop_polygons = np.repeat(np.arange(len(arrays["loop_totals"])), arrays["loop_totals"])
+    face_normals = np.empty(len(mesh.polygons) * 3, dtype=np.float32)
+    mesh.polygons.foreach_get("normal", face_normals)
+    face_normals = face_normals.reshape(-1, 3).astype(np.float64)
+
+    next_loops = get_next_loops(arrays["loop_starts"], arrays["loop_totals"])
+    prev_loops = np.empty_like(next_loops)
+    prev_loops[next_loops] = np.arange(len(next_loops))
+    weights = np.ones(len(loop_verts))
+    if weighting in {'FACE_AREA', 'FACE_AREA_ANGLE'}:
+        areas = np.empty(len(mesh.polygons), dtype=np.float32)
+        mesh.polygons.foreach_get("area", areas)
+        weights = weights * areas[loop_polygons]
+    if weighting in {'CORNER_ANGLE', 'FACE_AREA_ANGLE'}:
+        to_next = co[loop_verts[next_loops]] - co[loop_verts]
+        to_prev = co[loop_verts[prev_loops]] - co[loop_verts]
+        weights = weights * np.arctan2(np.linalg.norm(np.cross(to_next, to_prev), axis=1),
+                                       np.einsum('ij,ij->i', to_next, to_prev))
+
+    # Sharp edges, edges of flat faces and (before Blender 4.1) edges over the auto smooth angle split fans
+    smooth_edges = ~arrays["use_edge_sharp"]
+    flat_loops = ~arrays["use_smooth"][loop_polygons]
+    smooth_edges[loop_edges[flat_loops]] = False
+    if bpy.app.version < (4, 1, 0) and mesh.use_auto_smooth:
+        smooth_edges &= ~compute_sharp_edge_mask(mesh, mesh.auto_smooth_angle)
+
+    first, second = get_smooth_fan_links(loop_verts, loop_edges, next_loops, smooth_edges)
+    fans = label_components(len(loop_verts), first, second)
+    weighted = face_normals[loop_polygons] * weights[:, None]
+    normals = np.stack([np.bincount(fans, weights=weighted[:, axis]) for axis in range(3)], axis=1)[fans]
+    lengths = np.linalg.norm(normals, axis=1)
+    # Degenerate fans keep the face normal
+    valid = lengths > 1e-12
+    normals[valid] /= lengths[valid, None]
+    normals[~valid] = face_normals[loop_polygons[~valid]]
+    return normals.astype(np.float32)
+
+# Bake weighted normals into the custom split normals of a mesh.
+# Custom normals need auto smooth before Blender 4.1; its angle is opened up when it was off,
+# so only the sharp edges split the baked normals.
+def bake_weighted_normals(mesh, weighting='FACE_AREA_ANGLE'):
+    normals = compute_weighted_normals(mesh, weighting)
+    if bpy.app.version < (4, 1, 0) and not mesh.use_auto_smooth:
+        mesh.use_auto_smooth = True
+        mesh.auto_smooth_angle = math.pi
+    mesh.normals_split_custom_set(normals)
+    mesh.update()
+
+class OBJECT_OT_easy_weighted_normals(bpy.types.Operator):
+    bl_label = "Weighted Normals"
+    bl_idname = "object.easy_weighted_normals"
+    bl_description = "Bakes face weighted normals into custom split normals on selected/all mesh objects. Sharp edges and flat faces keep their hard shading."
+
+    def execute(self, context):
+        if context.mode != 'OBJECT':
+            bpy.ops.object.mode_set(mode='OBJECT')
+
+        props = context.scene.easy_utils_props
+        batch = begin_undo_batch("Weighted Normals")
+        stats = new_stream_stats()
+        params = {"weighting": props.weighted_normal_mode}
+        result = weighted_normals(get_target_objects(context), props.weighted_normal_mode, batch,
+                                  get_operator_stream(props, stats, "Weighted Normals", params))
+
+        self.report({'INFO'}, f"Weighted normals baked on {result.count} meshes.{stream_report(props, stats)}")
+        return {'FINISHED'}
+
+# --- Batch Snapshots ---
+
+# Snapshots of the meshes touched by the last EasyOps batches, newest last. A snapshot is a full
+# copy of the mesh datablock (all attributes, vertex groups, custom normals, ...) kept alive by a
+# fake user. Only changed meshes are copied, so memory scales with the batch and not with the scene.
+# The copies belong to the session: they're left out when the file is saved.
+_undo_batches = []
+UNDO_BATCH_LIMIT = 8
+SNAPSHOT_MESH_PREFIX = "EASYOPS_Snapshot"
+
+def begin_undo_batch(label):
+    batch = {"label": label, "objects": {}, "meshes": {}}
+    _undo_batches.append(batch)
+    for dropped in _undo_batches[:-UNDO_BATCH_LIMIT]:
+        free_undo_batch(dropped)
+    del _undo_batches[:-UNDO_BATCH_LIMIT]
+    return batch
+
+# Remove the snapshot copies of a batch that weren't restored
+def free_undo_batch(batch):
+    for copy_name in batch["meshes"].values():
+        mesh = bpy.data.meshes.get(copy_name)
+        if mesh is not None and mesh.use_fake_user and mesh.users == 1:
+            bpy.data.meshes.remove(mesh)
+
+def set_snapshot_fake_users(state):
+    for batch in _undo_batches:
+        for copy_name in batch["meshes"].values():
+            mesh = bpy.data.meshes.get(copy_name)
+            if mesh is not None:
+                mesh.use_fake_user = state
+
+# Modifier settings by value, referenced objects and collections by name
+def read_modifier_settings(modifier):
+    settings = {}
+    for prop in modifier.bl_rna.properties:
+        if prop.is_readonly or prop.identifier == "name":
+            continue
+        value = getattr(modifier, prop.identifier)
+        if prop.type == 'POINTER':
+            if isinstance(value, bpy.types.Object):
+                value = ('OBJECT', value.name)
+            elif isinstance(value, bpy.types.Collection):
+                value = ('COLLECTION', value.name)
+            elif value is not None:
+                continue
+        elif prop.type in {'FLOAT', 'INT', 'BOOLEAN'} and prop.is_array:
+            value = tuple(value)
+        settings[prop.identifier] = value
+    return settings
+
+def restore_modifier_settings(modifier, settings):
+    for identifier, value in settings.items():
+        if isinstance(value, tuple) and len(value) == 2 and value[0] in {'OBJECT', 'COLLECTION'}:
+            data = bpy.data.objects if value[0] == 'OBJECT' else bpy.data.collections
+            value = data.get(value[1])
+        try:
+            setattr(modifier, identifier, value)
+        except (AttributeError, TypeError, ValueError):
+            pass
+
+# Record an object's mesh and optionally the modifiers the batch is going to remove. Objects
+# sharing a mesh each get their entry, the mesh itself is only copied once.
+def snapshot_object(batch, obj, removed_modifiers=()):
+    if batch is None or obj.name in batch["objects"]:
+        return
+    mesh = obj.data
+    if mesh.name not in batch["meshes"]:
+        copy = mesh.copy()
+        copy.name = f"{SNAPSHOT_MESH_PREFIX}_{mesh.name}"
+        copy.use_fake_user = True
+        batch["meshes"][mesh.name] = copy.name
+
+    batch["objects"][obj.name] = {
+        "mesh": mesh.name,
+        "modifiers": [(list(obj.modifiers).index(mod), mod.name, mod.type, read_modifier_settings(mod))
+                      for mod in removed_modifiers],
+    }
+
+# Restore every mesh (and removed modifier) of the most recent batch. A mesh edited in place is
+# replaced by its snapshot for all of its users, and every recorded object gets its snapshot back
+# even when the operation gave it a new mesh. The snapshots take over the original names.
+def revert_last_batch():
+    if not _undo_batches:
+        return None
+    batch = _undo_batches.pop()
+
+    copies = {name: bpy.data.meshes.get(copy_name) for name, copy_name in batch["meshes"].items()}
+    for name, copy in copies.items():
+        original = bpy.data.meshes.get(name)
+        if copy is not None and original is not None:
+            original.user_remap(copy)
+
+    replaced = set()
+    for obj_name, snapshot in batch["objects"].items():
+        obj = bpy.data.objects.get(obj_name)
+        copy = copies.get(snapshot["mesh"])
+        if obj is None or obj.type != 'MESH' or copy is None:
+            continue
+
+        if obj.data != copy:
+            replaced.add(obj.data.name)
+            obj.data = copy
+
+        for index, name, modifier_type, settings in snapshot["modifiers"]:
+            modifier = obj.modifiers.new(name=name, type=modifier_type)
+            restore_modifier_settings(modifier, settings)
+            # ModifierSlots.move is only available on newer Blender versions
+            if hasattr(obj.modifiers, "move"):
+                obj.modifiers.move(len(obj.modifiers) - 1, min(index, len(obj.modifiers) - 1))
+
+    # Meshes the operation made (or edited in place) that nothing uses anymore
+    for name in replaced | set(copies):
+        mesh = bpy.data.meshes.get(name)
+        if mesh is not None and mesh.users == 0:
+            bpy.data.meshes.remove(mesh)
+    for name, copy in copies.items():
+        if copy is not None:
+            copy.use_fake_user = False
+            copy.name = name
+
+    free_undo_batch(batch)
+    return batch
+
+# Snapshots and session caches don't outlive the file they were made for; drop any snapshots
+# that were saved into the file
+@bpy.app.handlers.persistent
+def easyops_load_post(*args):
+    _undo_batches.clear()
+    _source_sample_cache.clear()
+    _source_triangle_cache.clear()
+    _mesh_health_cache.clear()
+    for mesh in [mesh for mesh in bpy.data.meshes if mesh.name.startswith(SNAPSHOT_MESH_PREFIX) and mesh.use_fake_user]:
+        bpy.data.meshes.remove(mesh)
+
+# Datablocks without users aren't written, so the snapshots drop their fake user while saving
+@bpy.app.handlers.persistent
+def easyops_save_pre(*args):
+    set_snapshot_fake_users(False)
+
+@bpy.app.handlers.persistent
+def easyops_save_post(*args):
+    set_snapshot_fake_users(True)
+
+class OBJECT_OT_easy_revert_batch(bpy.types.Operator):
+    bl_label = "Revert Last EasyOps Batch"
+    bl_idname = "object.easy_revert_batch"
+    bl_description = "Restores the meshes changed by the last EasyOps batch operation from snapshots."
+
+    @classmethod
+    def poll(cls, context):
+        return len(_undo_batches) > 0
+
+    def execute(self, context):
+        if context.mode != 'OBJECT':
+            bpy.ops.object.mode_set(mode='OBJECT')
+
+        batch = revert_last_batch()
+        self.report({'INFO'}, f"Reverted '{batch['label']}' on {len(batch['objects'])} objects.")
+        return {'FINISHED'}
+
+# --- Operation Pipeline ---
+
+# Directory to store pipeline presets
+PIPELINE_PRESETS_DIR = os.path.join(bpy.utils.resource_path('USER'), "easyops_pipelines")
+
+# How each step touches the mesh; consecutive steps of the same kind share one pass
+PIPELINE_STEP_KINDS = {
+    'CLEAN': 'BMESH',
+    'REMOVE_DOUBLES': 'BMESH',
+    'SSHARPEN': 'MESH',
+    'UV': 'EDIT',
+    'SMOOTH': 'MESH',
+    'BEVEL': 'OBJECT',
+    'DECIMATE': 'OBJECT',
+}
+
+# Merge by distance, delete loose vertices/edges and dissolve degenerate geometry on a bmesh
+def clean_bmesh(bm, merge_distance=0.0001):
+    bmesh.ops.remove_doubles(bm, verts=bm.verts, dist=merge_distance)
+    bmesh.ops.delete(bm, geom=[edge for edge in bm.edges if not edge.link_faces], context='EDGES')
+    bmesh.ops.delete(bm, geom=[vert for vert in bm.verts if not vert.link_edges], context='VERTS')
+    bmesh.ops.dissolve_degenerate(bm, dist=merge_distance, edges=bm.edges)
+
+def remove_doubles_bmesh(bm, merge_distance=0.0001):
+    bmesh.ops.remove_doubles(bm, verts=bm.verts, dist=merge_distance)
+
+# Add a bevel modifier with the EasyOps defaults unless the object already has one
+def add_bevel_modifier(obj, width=0.02, segments=3, profile=0.7):
+    if not any(mod.type == 'BEVEL' for mod in obj.modifiers):
+        modifier = obj.modifiers.new(name="Bevel", type='BEVEL')
+        modifier.width = width
+        modifier.segments = segments
+        modifier.profile = profile
+        return modifier
+    return None
+
+def add_decimate_modifier(obj, ratio):
+    if not any(mod.type == 'DECIMATE' for mod in obj.modifiers):
+        modifier = obj.modifiers.new(name="Decimate", type='DECIMATE')
+        modifier.ratio = ratio
+
+# Split the steps into runs of the same kind, keeping their order
+def group_pipeline_steps(steps):
+    groups = []
+    for step in steps:
+        kind = PIPELINE_STEP_KINDS[step]
+        if groups and groups[-1][0] == kind:
+            groups[-1][1].append(step)
+        else:
+            groups.append((kind, [step]))
+    return groups
+
+# Run the steps on the objects with one mesh->bmesh->mesh round-trip per run of bmesh steps
+# and one edit mode session per UV step. Returns the time spent in each step.
+def run_pipeline(context, objects, steps, props, undo_batch=None):
+    objects = [obj for obj in objects if obj.type == 'MESH']
+    # Mesh level steps run once per mesh, even when it is shared
+    unique_meshes = list({obj.data.name: obj for obj in objects}.values())
+    timings = {step: 0.0 for step in steps}
+
+    for obj in unique_meshes:
+        snapshot_object(undo_batch, obj)
+
+    for kind, group in group_pipeline_steps(steps):
+        if kind == 'BMESH':
+            for obj in unique_meshes:
+                bm = bmesh.new()
+                bm.from_mesh(obj.data)
+                for step in group:
+                    start = time.perf_counter()
+                    if step == 'CLEAN':
+                        clean_bmesh(bm)
+                    else:
+                        remove_doubles_bmesh(bm)
+                    timings[step] += time.perf_counter() - start
+                bm.to_mesh(obj.data)
+                bm.free()
+                obj.data.update()
+        elif kind == 'EDIT':
+            for step in group:
+                start = time.perf_counter()
+                # Same per-mesh unwrap (and parallel workers) as the Smart UV Unwrap button
+                uv_unwrap(unique_meshes, props.island_margin, props.uv_workers if props.use_parallel_uv else None,
+                          props.normalize_after_unwrap, props.texel_density, props.texture_size)
+                timings[step] += time.perf_counter() - start
+        else:
+            for step in group:
+                start = time.perf_counter()
+                for obj in (unique_meshes if kind == 'MESH' else objects):
+                    if step == 'SSHARPEN':
+                        detect_sharp_edges(obj, angle_threshold=30)
+                        enable_auto_smooth(obj, smooth_angle=30)
+                    elif step == 'SMOOTH':
+                        set_smooth_shading(obj.data, True)
+                        if props.enable_auto_smooth:
+                            enable_auto_smooth(obj, smooth_angle=props.auto_smooth_angle)
+                    elif step == 'BEVEL':
+                        add_bevel_modifier(obj)
+                    elif step == 'DECIMATE':
+                        add_decimate_modifier(obj, props.decimate_ratio)
+                # The SSharpen bevel goes on every object, also the ones sharing a mesh
+                if step == 'SSHARPEN':
+                    for obj in objects:
+                        apply_bevel_modifier(obj)
+                timings[step] += time.perf_counter() - start
+
+    return timings
+
+# Pipeline step list in the panel
+class EASYOPS_UL_pipeline_steps(bpy.types.UIList):
+    def draw_item(self, context, layout, data, item, icon, active_data, active_propname, index):
+        layout.label(text=f"{index + 1}.")
+        layout.prop(item, "step", text="")
+
+class OBJECT_OT_easy_pipeline_add_step(bpy.types.Operator):
+    bl_label = "Add Pipeline Step"
+    bl_idname = "object.easy_pipeline_add_step"
+    bl_description = "Adds a step to the end of the pipeline."
+
+    step: bpy.props.EnumProperty(items=PIPELINE_STEP_ITEMS)
+
+    def execute(self, context):
+        props = context.scene.easy_utils_props
+        item = props.pipeline_steps.add()
+        item.step = self.step
+        props.pipeline_step_index = len(props.pipeline_steps) - 1
+        return {'FINISHED'}
+
+class OBJECT_OT_easy_pipeline_remove_step(bpy.types.Operator):
+    bl_label = "Remove Pipeline Step"
+    bl_idname = "object.easy_pipeline_remove_step"
+    bl_description = "Removes the active step from the pipeline."
+
+    def execute(self, context):
+        props = context.scene.easy_utils_props
+        if 0 <= props.pipeline_step_index < len(props.pipeline_steps):
+            props.pipeline_steps.remove(props.pipeline_step_index)
+            props.pipeline_step_index = max(0, min(props.pipeline_step_index, len(props.pipeline_steps) - 1))
+        return {'FINISHED'}
+
+class OBJECT_OT_easy_pipeline_move_step(bpy.types.Operator):
+    bl_label = "Move Pipeline Step"
+    bl_idname = "object.easy_pipeline_move_step"
+    bl_description = "Moves the active step up or down."
+
+    direction: bpy.props.EnumProperty(items=[('UP', "Up", ""), ('DOWN', "Down", "")])
+
+    def execute(self, context):
+        props = context.scene.easy_utils_props
+        index = props.pipeline_step_index
+        target = index - 1 if self.direction == 'UP' else index + 1
+        if 0 <= index < len(props.pipeline_steps) and 0 <= target < len(props.pipeline_steps):
+            props.pipeline_steps.move(index, target)
+            props.pipeline_step_index = target
+        return {'FINISHED'}
+
+class OBJECT_OT_easy_pipeline_save_preset(bpy.types.Operator):
+    bl_label = "Save Pipeline Preset"
+    bl_idname = "object.easy_pipeline_save_preset"
+    bl_description = "Saves the pipeline steps as a preset."
+
+    def execute(self, context):
+        props = context.scene.easy_utils_props
+        if not props.pipeline_preset_name:
+            self.report({'ERROR'}, "Preset name cannot be empty.")
+            return {'CANCELLED'}
+
+        os.makedirs(PIPELINE_PRESETS_DIR, exist_ok=True)
+        preset_path = os.path.join(PIPELINE_PRESETS_DIR, f"{props.pipeline_preset_name}.json")
+        try:
+            with open(preset_path, 'w') as preset_file:
+                json.dump({"steps": [item.step for item in props.pipeline_steps]}, preset_file, indent=2)
+        except OSError as e:
+            self.report({'ERROR'}, f"Error saving preset: {str(e)}")
+            return {'CANCELLED'}
+
+        self.report({'INFO'}, f"Pipeline preset '{props.pipeline_preset_name}' saved.")
+        return {'FINISHED'}
+
+# Read the steps of a saved pipeline preset
+def load_pipeline_preset(name):
+    with open(os.path.join(PIPELINE_PRESETS_DIR, f"{name}.json"), 'r') as preset_file:
+        steps = json.load(preset_file)["steps"]
+    return [step for step in steps if step in PIPELINE_STEP_KINDS]
+
+class OBJECT_OT_easy_pipeline_load_preset(bpy.types.Operator):
+    bl_label = "Load Pipeline Preset"
+    bl_idname = "object.easy_pipeline_load_preset"
+    bl_description = "Replaces the pipeline steps with a saved preset."
+
+    preset: bpy.props.EnumProperty(
+        name="Preset",
+        items=lambda self, context: [(f[:-5], f[:-5], "") for f in sorted(os.listdir(PIPELINE_PRESETS_DIR)) if f.endswith('.json')]
+        if os.path.isdir(PIPELINE_PRESETS_DIR) else []
+    )
+
+    def execute(self, context):
+        props = context.scene.easy_utils_props
+        try:
+            steps = load_pipeline_preset(self.preset)
+        except (OSError, ValueError, KeyError) as e:
+            self.report({'ERROR'}, f"Error loading preset: {str(e)}")
+            return {'CANCELLED'}
+
+        props.pipeline_steps.clear()
+        for step in steps:
+            props.pipeline_steps.add().step = step
+        props.pipeline_step_index = 0
+        props.pipeline_preset_name = self.preset
+        return {'FINISHED'}
+
+class OBJECT_OT_easy_run_pipeline(bpy.types.Operator):
+    bl_label = "Run Pipeline"
+    bl_idname = "object.easy_run_pipeline"
+    bl_description = "Runs all pipeline steps on selected/all mesh objects, sharing one bmesh round-trip per mesh and one edit mode session per UV step."
+
+    def execute(self, context):
+        props = context.scene.easy_utils_props
+        steps = [item.step for item in props.pipeline_steps]
+        if not steps:
+            self.report({'ERROR'}, "The pipeline has no steps.")
+            return {'CANCELLED'}
+        if context.mode != 'OBJECT':
+            bpy.ops.object.mode_set(mode='OBJECT')
+
+        target_objects = get_target_objects(context)
+        batch = begin_undo_batch("Pipeline")
+        stats = new_stream_stats()
+        timings = {step: 0.0 for step in steps}
+        stream = get_operator_stream(props, stats, "Pipeline", {"steps": steps})
+        for batch_objects in stream([obj for obj in target_objects if obj.type == 'MESH']):
+            for step, seconds in run_pipeline(context, batch_objects, steps, props, batch).items():
+                timings[step] += seconds
+
+        summary = ", ".join(f"{step.title().replace('_', ' ')} {seconds:.2f}s" for step, seconds in timings.items())
+        self.report({'INFO'}, f"Pipeline finished: {summary}{stream_report(props, stats)}")
+        return {'FINISHED'}
+
+# Pipeline editor, shown below the EasyOps panel
+class EasyOpsPipelinePanel(bpy.types.Panel):
+    bl_label = "Pipeline"
+    bl_idname = "OBJECT_PT_easy_ops_pipeline"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = "Easy Utils"
+    bl_parent_id = "OBJECT_PT_easy_ops"
+    bl_options = {'DEFAULT_CLOSED'}
+
+    def draw(self, context):
+        layout = self.layout
+        props = context.scene.easy_utils_props
+
+        row = layout.row()
+        row.template_list("EASYOPS_UL_pipeline_steps", "", props, "pipeline_steps", props, "pipeline_step_index", rows=4)
+        column = row.column(align=True)
+        column.operator_menu_enum("object.easy_pipeline_add_step", "step", text="", icon='ADD')
+        column.operator("object.easy_pipeline_remove_step", text="", icon='REMOVE')
+        column.separator()
+        column.operator("object.easy_pipeline_move_step", text="", icon='TRIA_UP').direction = 'UP'
+        column.operator("object.easy_pipeline_move_step", text="", icon='TRIA_DOWN').direction = 'DOWN'
+
+        row = layout.row(align=True)
+        row.prop(props, "pipeline_preset_name", text="")
+        row.operator("object.easy_pipeline_save_preset", text="", icon='FILE_TICK')
+        row.operator_menu_enum("object.easy_pipeline_load_preset", "preset", text="", icon='PRESET')
+
+        layout.operator("object.easy_run_pipeline", text="Run Pipeline")
+
+# --- Modifier Profiler ---
+
+# Cached profiler results keyed by object name, refreshed incrementally on depsgraph updates
+_profiler_cache = {}
+
+# Read vertex/face counts of an evaluated mesh object (modifiers included)
+def get_evaluated_counts(obj_eval):
+    mesh = obj_eval.data
+    return len(mesh.vertices), len(mesh.polygons)
+
+# Collect evaluated counts and per-modifier timings for one object
+def collect_object_profile(obj, depsgraph):
+    obj_eval = obj.evaluated_get(depsgraph)
+    verts, faces = get_evaluated_counts(obj_eval)
+    previous = _profiler_cache.get(obj.name, {})
+    growth = {mod["name"]: mod["growth"] for mod in previous.get("modifiers", [])}
+
+    modifiers = []
+    for modifier in obj_eval.modifiers:
+        # execution_time only exists on Blender 3.0+
+        execution_time = getattr(modifier, "execution_time", 0.0) if modifier.show_viewport else 0.0
+        modifiers.append({
+            "name": modifier.name,
+            "type": modifier.type,
+            "enabled": modifier.show_viewport,
+            "time": execution_time,
+            "growth": growth.get(modifier.name, 1.0),
+        })
+
+    _profiler_cache[obj.name] = {
+        "verts": verts,
+        "faces": faces,
+        "base_faces": len(obj.data.polygons),
+        "time": sum(mod["time"] for mod in modifiers),
+        "modifiers": modifiers,
+    }
+
+# Measure how much each modifier multiplies the face count.
+# The stacks of all objects are grown one modifier at a time, so each step is a single depsgraph evaluation.
+def profile_modifier_growth(context, objects):
+    stacks = {obj: [mod for mod in obj.modifiers if mod.show_viewport] for obj in objects}
+    depth = max((len(stack) for stack in stacks.values()), default=0)
+    for stack in stacks.values():
+        for modifier in stack:
+            modifier.show_viewport = False
+
+    growth = {obj: {} for obj in objects}
+    previous = {obj: len(obj.data.polygons) for obj in objects}
+    try:
+        for step in range(depth):
+            stepped = [obj for obj, stack in stacks.items() if step < len(stack)]
+            for obj in stepped:
+                stacks[obj][step].show_viewport = True
+            depsgraph = context.evaluated_depsgraph_get()
+            for obj in stepped:
+                faces = get_evaluated_counts(obj.evaluated_get(depsgraph))[1]
+                growth[obj][stacks[obj][step].name] = faces / max(previous[obj], 1)
+                previous[obj] = faces
+    finally:
+        for stack in stacks.values():
+            for modifier in stack:
+                modifier.show_viewport = True
+    return growth
+
+# Profile objects from scratch, including per-modifier growth
+def profile_objects(context, objects):
+    objects = [obj for obj in objects if obj.type == 'MESH']
+    growth = profile_modifier_growth(context, objects)
+    depsgraph = context.evaluated_depsgraph_get()
+    for obj in objects:
+        _profiler_cache.pop(obj.name, None)
+        collect_object_profile(obj, depsgraph)
+        for modifier in _profiler_cache[obj.name]["modifiers"]:
+            modifier["growth"] = growth[obj].get(modifier["name"], 1.0)
+
+# Sort cached profiles for the hot-list
+def get_profiler_hot_list(sort_key):
+    def key(item):
+        entry = item[1]
+        if sort_key == 'TIME':
+            return entry["time"]
+        if sort_key == 'GROWTH':
+            return entry["faces"] / max(entry["base_faces"], 1)
+        return entry["faces"]
+    return sorted(_profiler_cache.items(), key=key, reverse=True)
+
+# Keep the profiler cache up to date with only the objects whose geometry changed,
+# and drop the modifier summary when any object geometry changed
+@bpy.app.handlers.persistent
+def easyops_depsgraph_update_post(scene, depsgraph):
+    props = getattr(scene, "easy_utils_props", None)
+    if props is None:
+        return
+    profile = props.profiler_live and _profiler_cache
+    for update in depsgraph.updates:
+        if not update.is_updated_geometry or not isinstance(update.id, bpy.types.Object):
+            continue
+        invalidate_modifier_summary()
+        invalidate_output_estimate()
+        obj = update.id.original
+        if profile and obj.name in _profiler_cache and obj.type == 'MESH':
+            collect_object_profile(obj, depsgraph)
+
+class OBJECT_OT_easy_profile_modifiers(bpy.types.Operator):
+    bl_label = "Profile Modifiers"
+    bl_idname = "object.easy_profile_modifiers"
+    bl_description = "Collects evaluated vertex/face counts, modifier timings and growth factors for selected/all mesh objects."
+
+    def execute(self, context):
+        if context.mode != 'OBJECT':
+            bpy.ops.object.mode_set(mode='OBJECT')
+
+        target_objects = get_target_objects(context)
+        _profiler_cache.clear()
+        profile_objects(context, target_objects)
+
+        self.report({'INFO'}, f"Profiled {len(_profiler_cache)} objects.")
+        return {'FINISHED'}
+
+class OBJECT_OT_easy_profiler_select(bpy.types.Operator):
+    bl_label = "Select Profiled Object"
+    bl_idname = "object.easy_profiler_select"
+    bl_description = "Selects the profiled object and makes it active."
+
+    object_name: bpy.props.StringProperty()
+
+    def execute(self, context):
+        obj = bpy.data.objects.get(self.object_name)
+        if obj is None:
+            _profiler_cache.pop(self.object_name, None)
+            self.report({'WARNING'}, f"Object '{self.object_name}' no longer exists.")
+            return {'CANCELLED'}
+
+        for selected in context.selected_objects:
+            selected.select_set(False)
+        obj.select_set(True)
+        context.view_layer.objects.active = obj
         return {'FINISHED'}
 
+class OBJECT_OT_easy_profiler_disable(bpy.types.Operator):
+    bl_label = "Disable Costly Modifier"
+    bl_idname = "object.easy_profiler_disable"
+    bl_description = "Disables the modifier in the viewport."
+
+    object_name: bpy.props.StringProperty()
+    modifier_name: bpy.props.StringProperty()
+
+    def execute(self, context):
+        obj = bpy.data.objects.get(self.object_name)
+        modifier = obj.modifiers.get(self.modifier_name) if obj else None
+        if modifier is None:
+            self.report({'WARNING'}, f"Modifier '{self.modifier_name}' not found.")
+            return {'CANCELLED'}
+
+        modifier.show_viewport = False
+        self.report({'INFO'}, f"Disabled '{modifier.name}' on '{obj.name}'.")
+        return {'FINISHED'}
+
+# Profiler hot-list, shown below the EasyOps panel
+class EasyOpsProfilerPanel(bpy.types.Panel):
+    bl_label = "Modifier Profiler"
+    bl_idname = "OBJECT_PT_easy_ops_profiler"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = "Easy Utils"
+    bl_parent_id = "OBJECT_PT_easy_ops"
+    bl_options = {'DEFAULT_CLOSED'}
+
+    def draw(self, context):
+        layout = self.layout
+        props = context.scene.easy_utils_props
+
+        layout.operator("object.easy_profile_modifiers", text="Profile Modifiers")
+        row = layout.row()
+        row.prop(props, "profiler_live")
+        row.prop(props, "profiler_rows")
+        layout.prop(props, "profiler_sort", expand=True)
+
+        for name, entry in get_profiler_hot_list(props.profiler_sort)[:props.profiler_rows]:
+            box = layout.box()
+            row = box.row()
+            op = row.operator("object.easy_profiler_select", text=name, icon='RESTRICT_SELECT_OFF')
+            op.object_name = name
+            row.label(text=f"{entry['faces']:,} faces  {entry['time'] * 1000.0:.1f} ms")
+
+            for modifier in entry["modifiers"]:
+                if not modifier["enabled"]:
+                    continue
+                row = box.row()
+                row.label(text=f"{modifier['name']}: x{modifier['growth']:.1f}  {modifier['time'] * 1000.0:.1f} ms")
+                op = row.operator("object.easy_profiler_disable", text="", icon='HIDE_ON')
+                op.object_name = name
+                op.modifier_name = modifier["name"]
+
+# --- Chunked Processing ---
+# Giant meshes are split into a grid of chunks by face center. Every chunk also carries the
+# faces in a band around its cell so merges near the cell border see their neighbours. Workers
+# run the bmesh operation on their chunks and drop the band again, and the chunks are stitched
+# back together by welding the vertices on the cut.
+
+BMESH_OPERATIONS = {
+    'CLEAN': clean_bmesh,
+    'REMOVE_DOUBLES': remove_doubles_bmesh,
+}
+
+# Face of every loop, and the position of every face center
+def get_face_centers(arrays):
+    co = arrays["co"].reshape(-1, 3)
+    loop_totals = arrays["loop_totals"]
+    loop_polygons = np.repeat(np.arange(len(loop_totals)), loop_totals)
+    corners = co[arrays["loop_verts"]]
+    centers = np.stack([np.bincount(loop_polygons, weights=corners[:, axis], minlength=len(loop_totals))
+                        for axis in range(3)], axis=1)
+    return centers / np.maximum(loop_totals, 1)[:, None]
+
+# Buffers of a part of a mesh: the given faces plus extra loose edges and vertices, with
+# compacted indices. `core` marks the faces the part is responsible for.
+def extract_mesh_part(arrays, faces, core, loose_edges=(), loose_verts=()):
+    loop_starts, loop_totals = arrays["loop_starts"][faces], arrays["loop_totals"][faces]
+    starts = np.repeat(loop_starts, loop_totals)
+    part_starts = np.cumsum(loop_totals) - loop_totals
+    loops = starts + np.arange(len(starts)) - np.repeat(part_starts, loop_totals)
+
+    edges = np.unique(np.concatenate([arrays["loop_edges"][loops], np.asarray(loose_edges, dtype=np.int64)])).astype(np.int64)
+    edge_verts = arrays["edges"].reshape(-1, 2)[edges]
+    verts = np.unique(np.concatenate([edge_verts.ravel(), arrays["loop_verts"][loops], np.asarray(loose_verts, dtype=np.int64)])).astype(np.int64)
+
+    part = {
+        "co": arrays["co"].reshape(-1, 3)[verts].ravel(),
+        "edges": np.searchsorted(verts, edge_verts).astype(np.int32).ravel(),
+        "loop_verts": np.searchsorted(verts, arrays["loop_verts"][loops]).astype(np.int32),
+        "loop_edges": np.searchsorted(edges, arrays["loop_edges"][loops]).astype(np.int32),
+        "loop_starts": part_starts.astype(np.int32),
+        "loop_totals": loop_totals,
+        "material_index": arrays["material_index"][faces],
+        "use_smooth": arrays["use_smooth"][faces],
+        "use_edge_sharp": arrays["use_edge_sharp"][edges],
+        "use_seam": arrays["use_seam"][edges],
+        "core": np.asarray(core, dtype=np.int32),
+    }
+    if "uv" in arrays:
+        part["uv"] = arrays["uv"].reshape(-1, 2)[loops].ravel()
+    return part
+
+# Split the mesh buffers into grid chunks. `overlap` is the band width as a fraction of a cell.
+def split_mesh_chunks(arrays, grid, overlap, keep_loose=True):
+    co = arrays["co"].reshape(-1, 3)
+    centers = get_face_centers(arrays)
+    low = co.min(axis=0)
+    size = np.maximum((co.max(axis=0) - low) / grid, 1e-9)
+    cells = np.clip(((centers - low) / size).astype(np.int64), 0, grid - 1)
+    face_cells = (cells[:, 0] * grid + cells[:, 1]) * grid + cells[:, 2]
+    order = np.argsort(face_cells, kind='stable')
+    sorted_cells = face_cells[order]
+
+    chunks = []
+    for cell in np.unique(face_cells):
+        index = np.array([cell // (grid * grid), (cell // grid) % grid, cell % grid])
+        # The band is narrower than a cell, so only faces of the neighbouring cells can be in it
+        candidates = []
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                for dz in (-1, 0, 1):
+                    neighbour = index + (dx, dy, dz)
+                    if np.any(neighbour < 0) or np.any(neighbour >= grid):
+                        continue
+                    key = (neighbour[0] * grid + neighbour[1]) * grid + neighbour[2]
+                    start, end = np.searchsorted(sorted_cells, [key, key + 1])
+                    candidates.append(order[start:end])
+        candidates = np.sort(np.concatenate(candidates))
+        box_low = low + index * size - overlap * size
+        box_high = low + (index + 1) * size + overlap * size
+        inside = np.all((centers[candidates] >= box_low) & (centers[candidates] <= box_high), axis=1)
+        faces = candidates[inside]
+        chunks.append(extract_mesh_part(arrays, faces, face_cells[faces] == cell))
+
+    # Loose edges and vertices aren't in any chunk, they go straight to the stitch
+    if keep_loose:
+        edge_used = np.zeros(len(arrays["edges"]) // 2, dtype=bool)
+        edge_used[arrays["loop_edges"]] = True
+        vert_used = np.zeros(len(co), dtype=bool)
+        vert_used[arrays["edges"]] = True
+        loose_edges, loose_verts = np.flatnonzero(~edge_used), np.flatnonzero(~vert_used)
+        if len(loose_edges) or len(loose_verts):
+            no_faces = np.zeros(0, dtype=np.int64)
+            chunks.append(extract_mesh_part(arrays, no_faces, no_faces, loose_edges, loose_verts))
+    return chunks
+
+# Spatial hash keys of integer grid cells; collisions only add candidates that fail the distance test
+def get_cell_keys(cells):
+    return cells[:, 0] * 73856093 ^ cells[:, 1] * 19349663 ^ cells[:, 2] * 83492791
+
+# Pairs of points closer than `distance`, from a spatial hash with cells of that size. Every
+# point is looked up in its own and the 26 neighbouring cells with searchsorted on the sorted keys.
+def find_close_pairs(points, distance):
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+    cells = np.floor(points / max(distance, 1e-12)).astype(np.int64)
+    keys = get_cell_keys(cells)
+    order = np.argsort(keys, kind='stable')
+    sorted_keys = keys[order]
+    first, second = [], []
+    for dx in (-1, 0, 1):
+        for dy in (-1, 0, 1):
+            for dz in (-1, 0, 1):
+                neighbour = get_cell_keys(cells + (dx, dy, dz))
+                start = np.searchsorted(sorted_keys, neighbour, 'left')
+                counts = np.searchsorted(sorted_keys, neighbour, 'right') - start
+                a = np.repeat(np.arange(len(points)), counts)
+                offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+                b = order[np.repeat(start, counts) + offsets]
+                keep = a < b
+                a, b = a[keep], b[keep]
+                delta = points[a] - points[b]
+                close = np.einsum('ij,ij->i', delta, delta) <= distance * distance
+                first.append(a[close])
+                second.append(b[close])
+    pairs = np.unique(np.stack([np.concatenate(first), np.concatenate(second)], axis=1), axis=0)
+    return pairs[:, 0], pairs[:, 1]
+
+# Index every vertex is welded to: candidates closer than `distance` (transitively) are merged
+# into the lowest index of their group, all other vertices map to themselves
+def get_weld_map(co, candidates, distance):
+    weld_map = np.arange(len(co) // 3)
+    if len(candidates) < 2:
+        return weld_map
+    first, second = find_close_pairs(co.reshape(-1, 3)[candidates], distance)
+    labels = label_components(len(candidates), first, second)
+    _, representative = np.unique(labels, return_index=True)
+    weld_map[candidates] = candidates[representative[labels]]
+    return weld_map
+
+# Apply a weld map to mesh buffers: remove merged vertices, and merge the edges that now connect
+# the same vertices (their flags are combined)
+def weld_mesh_arrays(arrays, weld_map):
+    used, vert_index = np.unique(weld_map, return_inverse=True)
+    welded = dict(arrays)
+    welded["co"] = arrays["co"].reshape(-1, 3)[used].ravel()
+    welded["loop_verts"] = vert_index[arrays["loop_verts"]].astype(np.int32)
+
+    edges = np.sort(vert_index[arrays["edges"]].reshape(-1, 2), axis=1)
+    unique_edges, edge_index = np.unique(edges, axis=0, return_inverse=True)
+    edge_index = edge_index.ravel()
+    welded["edges"] = unique_edges.astype(np.int32).ravel()
+    welded["loop_edges"] = edge_index[arrays["loop_edges"]].astype(np.int32)
+    for attribute in ("use_edge_sharp", "use_seam"):
+        values = np.zeros(len(unique_edges), dtype=bool)
+        np.logical_or.at(values, edge_index, arrays[attribute])
+        welded[attribute] = values
+    return welded
+
+# Vertices that can be welded after stitching: the ones on edges with a single face (the cut
+# between chunks and the open borders of the mesh) and loose vertices and edges
+def get_weld_candidates(arrays):
+    face_counts = np.bincount(arrays["loop_edges"], minlength=len(arrays["edges"]) // 2)
+    edges = arrays["edges"].reshape(-1, 2)
+    vert_used = np.zeros(len(arrays["co"]) // 3, dtype=bool)
+    vert_used[edges.ravel()] = True
+    return np.union1d(np.unique(edges[face_counts <= 1]), np.flatnonzero(~vert_used))
+
+# Keyword arguments for clean/remove_doubles from the panel settings
+def get_chunk_settings(props):
+    if not props.use_chunked_processing:
+        return {}
+    return {"chunk_min_vertices": props.chunk_min_vertices, "chunk_grid": props.chunk_grid,
+            "chunk_overlap": props.chunk_overlap, "chunk_workers": props.chunk_workers or None}
+
+# Run a bmesh operation on a mesh in grid chunks in background Blender processes and stitch the
+# results. Returns False (and leaves the mesh alone) when a worker failed.
+def process_mesh_chunked(mesh, operation, merge_distance, grid, overlap, worker_count):
+    arrays = read_join_arrays(mesh)
+    # Clean removes loose geometry anyway
+    chunks = split_mesh_chunks(arrays, grid, overlap, keep_loose=operation != 'CLEAN')
+    results = {}
+
+    def collect(index, path):
+        with np.load(path) as data:
+            results[index] = {name: data[name] for name in data.files}
+
+    missing = run_background_jobs("--easyops-chunk-worker", chunks, [len(chunk["loop_verts"]) for chunk in chunks],
+                                  {"operation": operation, "merge_distance": merge_distance},
+                                  min(worker_count, len(chunks)), collect)
+    if missing:
+        return False
+
+    parts = [results[index] for index in range(len(chunks))]
+    has_uv = any("uv" in part for part in parts)
+    for part in parts:
+        part.pop("core", None)
+        if has_uv and "uv" not in part:
+            part["uv"] = np.zeros(len(part["loop_verts"]) * 2, dtype=np.float32)
+    joined, _ = concatenate_mesh_arrays(parts)
+    weld_map = get_weld_map(joined["co"], get_weld_candidates(joined), merge_distance)
+    write_join_arrays(mesh, weld_mesh_arrays(joined, weld_map))
+    return True
+
+# Entry point of a chunk worker: run the operation on each chunk of the shard, then delete
+# the band faces that belong to other chunks
+def run_chunk_worker(job_dir, shard):
+    with open(os.path.join(job_dir, f"shard_{shard}.json")) as f:
+        job = json.load(f)
+    operation = BMESH_OPERATIONS[job["operation"]]
+
+    for index in job["items"]:
+        with np.load(os.path.join(job_dir, f"item_{index}.npz")) as data:
+            arrays = {name: data[name] for name in data.files}
+        mesh = bpy.data.meshes.new(f"EasyOpsChunk{index}")
+        write_join_arrays(mesh, arrays)
+        # The face domain is called POLYGON before Blender 3.0
+        core = mesh.attributes.new("easyops_core", 'INT', 'FACE' if bpy.app.version >= (3, 0, 0) else 'POLYGON')
+        core.data.foreach_set("value", arrays["core"])
+
+        bm = bmesh.new()
+        bm.from_mesh(mesh)
+        operation(bm, job["merge_distance"])
+        layer = bm.faces.layers.int.get("easyops_core")
+        bmesh.ops.delete(bm, geom=[face for face in bm.faces if not face[layer]], context='FACES')
+        bm.to_mesh(mesh)
+        bm.free()
+        mesh.attributes.remove(mesh.attributes["easyops_core"])
+
+        write_background_result(job_dir, index, read_join_arrays(mesh))
+        bpy.data.meshes.remove(mesh)
+
+# --- Seam Weld ---
+# Remove Doubles only merges vertices within one mesh. Seam Weld hashes the open border vertices
+# of all targets in world space at once, finds the ones that coincide with a vertex of another
+# object, and either snaps them to their average position or joins the touching objects and
+# merges them.
+
+# Open border (and loose) vertices of an object, as local indices and world positions
+def get_seam_points(obj):
+    mesh = obj.data
+    arrays = {
+        "co": np.empty(len(mesh.vertices) * 3, dtype=np.float32),
+        "edges": np.empty(len(mesh.edges) * 2, dtype=np.int32),
+        "loop_edges": np.empty(len(mesh.loops), dtype=np.int32),
+    }
+    mesh.vertices.foreach_get("co", arrays["co"])
+    mesh.edges.foreach_get("vertices", arrays["edges"])
+    mesh.loops.foreach_get("edge_index", arrays["loop_edges"])
+    verts = get_weld_candidates(arrays)
+    matrix = np.array(obj.matrix_world, dtype=np.float64)
+    return verts, arrays["co"].reshape(-1, 3)[verts] @ matrix[:3, :3].T + matrix[:3, 3]
+
+# Seam vertices of all objects (owner object index, local vertex index, world position) and the
+# pairs of them that are on different objects and closer than `distance`
+def find_seam_pairs(objects, distance):
+    owners, verts, points = [], [], []
+    for index, obj in enumerate(objects):
+        obj_verts, obj_points = get_seam_points(obj)
+        owners.append(np.full(len(obj_verts), index))
+        verts.append(obj_verts)
+        points.append(obj_points)
+    owners, verts, points = np.concatenate(owners), np.concatenate(verts), np.concatenate(points)
+    first, second = find_close_pairs(points, distance)
+    cross = owners[first] != owners[second]
+    return owners, verts, points, first[cross], second[cross]
+
+# Move every group of paired seam vertices to its average world position
+def snap_seam_groups(objects, owners, verts, points, first, second, undo_batch=None):
+    labels = label_components(len(points), first, second)
+    sizes = np.bincount(labels)
+    welded = sizes[labels] > 1
+    targets = np.stack([np.bincount(labels, weights=points[:, axis]) for axis in range(3)], axis=1) / sizes[:, None]
+
+    for index in np.unique(owners[welded]):
+        obj = objects[index]
+        snapshot_object(undo_batch, obj)
+        mask = welded & (owners == index)
+        inverse = np.linalg.inv(np.array(obj.matrix_world, dtype=np.float64))
+        co = np.empty(len(obj.data.vertices) * 3, dtype=np.float32)
+        obj.data.vertices.foreach_get("co", co)
+        co = co.reshape(-1, 3)
+        co[verts[mask]] = targets[labels[mask]] @ inverse[:3, :3].T + inverse[:3, 3]
+        obj.data.vertices.foreach_set("co", co.ravel())
+        obj.data.update()
+    return int(welded.sum())
+
+# Join every group of paired objects with Cluster Join's concatenation and merge the paired
+# seam vertices in the joined mesh. Returns the new objects and the number of joined objects.
+def merge_seam_groups(context, objects, owners, verts, first, second):
+    groups = label_components(len(objects), owners[first], owners[second])
+    members = {}
+    for index, group in enumerate(groups):
+        members.setdefault(group, []).append(index)
+
+    created = []
+    removed = []
+    for indices in members.values():
+        if len(indices) < 2:
+            continue
+        group_objects = [objects[index] for index in indices]
+        origin = sum((obj.matrix_world.translation for obj in group_objects), Vector()) / len(group_objects)
+        collection = group_objects[0].users_collection[0] if group_objects[0].users_collection else context.scene.collection
+        joined = join_cluster(group_objects, f"EASYOPS_Welded_{len(created) + 1}", origin, collection)
+        # Merged vertices no longer map back to the source objects
+        mapping = json.loads(joined[CLUSTER_MAP_KEY])
+        del joined[CLUSTER_MAP_KEY]
+
+        offsets = np.zeros(len(objects), dtype=np.int64)
+        offsets[indices] = [entry["ranges"]["verts"][0] for entry in mapping["objects"]]
+        inside = np.isin(owners[first], indices)
+        a = offsets[owners[first[inside]]] + verts[first[inside]]
+        b = offsets[owners[second[inside]]] + verts[second[inside]]
+        labels = label_components(len(joined.data.vertices), a, b)
+        _, representative = np.unique(labels, return_index=True)
+        write_join_arrays(joined.data, weld_mesh_arrays(read_join_arrays(joined.data), representative[labels]))
+        created.append(joined)
+        removed.extend(group_objects)
+
+    meshes = {obj.data for obj in removed}
+    bpy.data.batch_remove(removed)
+    bpy.data.batch_remove([mesh for mesh in meshes if mesh.users == 0])
+    return created, len(removed)
+
+class OBJECT_OT_easy_weld_seams(bpy.types.Operator):
+    bl_label = "Weld Seams"
+    bl_idname = "object.easy_weld_seams"
+    bl_description = "Closes the cracks between selected/all mesh objects by snapping or merging border vertices that coincide with a border vertex of another object"
+
+    def execute(self, context):
+        if context.mode != 'OBJECT':
+            bpy.ops.object.mode_set(mode='OBJECT')
+
+        props = context.scene.easy_utils_props
+        batch = begin_undo_batch("Weld Seams")
+        result = weld_seams(get_target_objects(context), props.seam_weld_distance, props.seam_weld_mode, batch)
+        report = f"Welded {result.count} seam vertices."
+        if props.seam_weld_mode == 'MERGE':
+            report += f" Joined {result.details['merged']} objects into {len(result.details['created'])}."
+        if result.skipped:
+            report += f" Skipped {len(result.skipped)} objects with shared meshes."
+        self.report({'INFO'}, report)
+        return {'FINISHED'}
+
+# --- Batch API ---
+# Every operation is available as a plain function taking explicit objects (or meshes for mesh
+# level operations), so scripts don't depend on the selection, the active object or the UI:
+#
+#     import easy_utils_easyops as easyops
+#     easyops.clean(bpy.data.meshes)
+#     easyops.ssharpen(objects, angle=40)
+#     easyops.boolean(targets, cutter, operation='UNION')
+#
+# `stream` is an optional callable splitting a list into batches (see stream_batches) and
+# `undo_batch` an optional batch from begin_undo_batch. The operators are thin wrappers over these.
+
+# Result of a batch operation: the processed objects or meshes, an operation specific count
+# (removed vertices, sharp edges, applied objects, ...), the objects that were skipped,
+# messages for a report and extra values by name
+EasyOpsResult = namedtuple("EasyOpsResult", ["objects", "count", "skipped", "messages", "details"])
+
+def mesh_objects(objects):
+    return [obj for obj in objects if obj.type == 'MESH']
+
+# Unique (mesh, owner object) pairs of a list of objects and/or meshes. The owner is used
+# for snapshots and is None when a mesh was passed directly.
+def get_api_meshes(items):
+    meshes = {}
+    for item in items:
+        if isinstance(item, bpy.types.Object):
+            if item.type == 'MESH':
+                meshes.setdefault(item.data.name, (item.data, item))
+        elif isinstance(item, bpy.types.Mesh):
+            meshes.setdefault(item.name, (item, None))
+    return list(meshes.values())
+
+def get_batches(items, stream):
+    return stream(items) if stream else [items]
+
+# Run a bmesh operation (a BMESH_OPERATIONS name) on every mesh with one mesh->bmesh->mesh
+# round-trip each. Meshes with at least `chunk_min_vertices` vertices (0 = never) are processed
+# in chunk_grid^3 grid chunks by `chunk_workers` background processes (None = all cores), unless
+# they carry data the chunks can't (see get_extra_mesh_data).
+def run_bmesh_operation(items, operation, merge_distance=0.0001, undo_batch=None, stream=None,
+                        chunk_min_vertices=0, chunk_grid=4, chunk_overlap=0.05, chunk_workers=None):
+    targets = get_api_meshes(items)
+    removed = 0
+    chunked = 0
+    messages = []
+    for batch in get_batches(targets, stream):
+        for mesh, owner in batch:
+            if owner is not None:
+                snapshot_object(undo_batch, owner)
+            vertex_count = len(mesh.vertices)
+            use_chunks = bool(chunk_min_vertices and vertex_count >= chunk_min_vertices and len(mesh.polygons))
+            if use_chunks:
+                extra = get_extra_mesh_data(mesh)
+                if extra:
+                    use_chunks = False
+                    messages.append(f"{mesh.name} not chunked, it has {', '.join(extra[:3])}")
+            if use_chunks and process_mesh_chunked(mesh, operation, merge_distance, chunk_grid, chunk_overlap,
+                                                   chunk_workers or os.cpu_count() or 1):
+                chunked += 1
+            else:
+                bm = bmesh.new()
+                bm.from_mesh(mesh)
+                BMESH_OPERATIONS[operation](bm, merge_distance)
+                bm.to_mesh(mesh)
+                bm.free()
+                mesh.update()
+            removed += vertex_count - len(mesh.vertices)
+    return EasyOpsResult([mesh for mesh, _ in targets], removed, [], messages, {"chunked": chunked})
+
+# Merge by distance, delete loose and dissolve degenerate geometry. Counts removed vertices.
+def clean(items, merge_distance=0.0001, undo_batch=None, stream=None,
+          chunk_min_vertices=0, chunk_grid=4, chunk_overlap=0.05, chunk_workers=None):
+    return run_bmesh_operation(items, 'CLEAN', merge_distance, undo_batch, stream,
+                               chunk_min_vertices, chunk_grid, chunk_overlap, chunk_workers)
+
+# Merge by distance. Counts removed vertices.
+def remove_doubles(items, merge_distance=0.0001, undo_batch=None, stream=None,
+                   chunk_min_vertices=0, chunk_grid=4, chunk_overlap=0.05, chunk_workers=None):
+    return run_bmesh_operation(items, 'REMOVE_DOUBLES', merge_distance, undo_batch, stream,
+                               chunk_min_vertices, chunk_grid, chunk_overlap, chunk_workers)
+
+# Smooth shading, optionally with auto smooth (baked sharp edges on Blender 4.1+). Counts meshes.
+def shade_smooth(items, auto_smooth=False, angle=30.0, undo_batch=None, stream=None):
+    targets = get_api_meshes(items)
+    for batch in get_batches(targets, stream):
+        for mesh, owner in batch:
+            if owner is not None:
+                snapshot_object(undo_batch, owner)
+            set_smooth_shading(mesh, True)
+            if auto_smooth:
+                set_auto_smooth(mesh, angle)
+    return EasyOpsResult([mesh for mesh, _ in targets], len(targets), [], [], {})
+
+# Mark sharp edges by angle with bevel weight and crease, add the weighted bevel and enable
+# auto smooth. Counts sharp edges.
+def ssharpen(objects, angle=30.0, undo_batch=None, stream=None):
+    objects = mesh_objects(objects)
+    processed_meshes = set()
+    sharp_edges = 0
+    for batch in get_batches(objects, stream):
+        for obj in batch:
+            # Mesh data is written once per shared mesh
+            if obj.data.name not in processed_meshes:
+                processed_meshes.add(obj.data.name)
+                snapshot_object(undo_batch, obj)
+                sharp_edges += detect_sharp_edges(obj, angle_threshold=angle)
+                enable_auto_smooth(obj, smooth_angle=angle)
+            apply_bevel_modifier(obj)
+    return EasyOpsResult(objects, sharp_edges, [], [], {})
+
+# Weld the open borders of objects to coincident border vertices of other objects in one
+# world space pass. 'SNAP' moves each group of coincident vertices to its average position,
+# 'MERGE' also joins the touching objects (joinable ones with the same materials and visibility) and merges them; other
+# pairs are snapped. Objects with shared meshes are skipped. Counts welded vertices.
+def weld_seams(objects, distance=0.001, mode='SNAP', undo_batch=None):
+    objects = mesh_objects(objects)
+    targets = [obj for obj in objects if obj.data.users == 1]
+    skipped = [obj for obj in objects if obj.data.users != 1]
+    details = {"created": [], "merged": 0}
+    if len(targets) < 2:
+        return EasyOpsResult(targets, 0, skipped, [], details)
+
+    owners, verts, points, first, second = find_seam_pairs(targets, distance)
+    mergeable = np.zeros(len(first), dtype=bool)
+    if mode == 'MERGE':
+        # Objects can only be merged with objects that could share one mesh
+        keys = {}
+        referenced = get_referenced_object_names()
+        key_ids = np.array([keys.setdefault(get_cluster_key(obj, 1.0, True, False)[1:], len(keys))
+                            if can_join_object(obj, referenced) else -1 for obj in targets])
+        mergeable = (key_ids[owners[first]] >= 0) & (key_ids[owners[first]] == key_ids[owners[second]])
+
+    welded = len(np.unique(np.concatenate([first, second])))
+    snap_seam_groups(targets, owners, verts, points, first[~mergeable], second[~mergeable], undo_batch)
+    if mergeable.any():
+        details["created"], details["merged"] = merge_seam_groups(bpy.context, targets, owners, verts,
+                                                                  first[mergeable], second[mergeable])
+    return EasyOpsResult(targets, welded, skipped, [], details)
+
+# Bake face area and/or corner angle weighted normals into custom split normals. Normals are
+# only averaged across smooth edges, so marked sharp edges and flat faces stay hard. Counts meshes.
+def weighted_normals(items, weighting='FACE_AREA_ANGLE', undo_batch=None, stream=None):
+    targets = get_api_meshes(items)
+    for batch in get_batches(targets, stream):
+        for mesh, owner in batch:
+            if owner is not None:
+                snapshot_object(undo_batch, owner)
+            bake_weighted_normals(mesh, weighting)
+    return EasyOpsResult([mesh for mesh, _ in targets], len(targets), [], [], {})
+
+# Smart UV Project every mesh on its own, in background workers when `workers` isn't None
+# (0 uses all cores). Needs edit mode internally; the selection is restored afterwards.
+# Counts meshes unwrapped in this session after a worker failed.
+def uv_unwrap(objects, island_margin=0.02, workers=None, normalize=False, density=1024.0, texture_size=2048,
+              undo_batch=None, stream=None):
+    context = bpy.context
+    # Each mesh is unwrapped once, with the transform of the last object using it
+    objects = list({obj.data.name: obj for obj in mesh_objects(objects)}.values())
+    selected_objects = list(context.selected_objects)
+    active_obj = context.view_layer.objects.active
+    fallback = 0
+
+    for batch in get_batches(objects, stream):
+        for obj in batch:
+            snapshot_object(undo_batch, obj)
+        if workers is not None and len(batch) > 1:
+            serial_objects = smart_uv_unwrap_parallel(batch, island_margin, min(workers or os.cpu_count() or 1, len(batch)))
+            fallback += len(serial_objects)
+        else:
+            serial_objects = batch
+        for obj in serial_objects:
+            smart_uv_unwrap_single(context, obj, island_margin)
+        if normalize:
+            for obj in batch:
+                normalize_texel_density(obj, density, texture_size)
+
+    for obj in context.selected_objects:
+        obj.select_set(False)
+    for obj in selected_objects:
+        obj.select_set(True)
+    context.view_layer.objects.active = active_obj
+    return EasyOpsResult(objects, fallback, [], [], {})
+
+# Scale all UV islands to the same texel density. Counts islands.
+def texel_density(objects, density=1024.0, texture_size=2048, undo_batch=None, stream=None):
+    objects = list({obj.data.name: obj for obj in mesh_objects(objects)}.values())
+    islands = 0
+    for batch in get_batches(objects, stream):
+        for obj in batch:
+            snapshot_object(undo_batch, obj)
+            islands += normalize_texel_density(obj, density, texture_size)
+    return EasyOpsResult(objects, islands, [], [], {})
+
+# Add a bevel modifier to objects that don't have one, within the memory budget.
+# Counts added modifiers; objects with a bevel or over the budget are skipped.
+def bevel(objects, width=0.02, segments=3, profile=0.7, memory_budget_mb=0, memory_guard='CHUNK'):
+    objects = mesh_objects(objects)
+    added = {}
+    for obj in objects:
+        modifier = add_bevel_modifier(obj, width, segments, profile)
+        if modifier is not None:
+            added[obj] = [modifier]
+    removed, message = guard_added_modifiers(added, memory_budget_mb, memory_guard)
+    skipped = [obj for obj in objects if obj not in added or obj in removed]
+    return EasyOpsResult(objects, len(added) - len(removed), skipped, [message] if message else [], {})
+
+# Add a boolean modifier with the cutter to every target, after the input health check
+# (health: 'OFF', 'WARN', 'FIX' or 'STRICT', fixed meshes are snapshotted into undo_batch) and within
+# the memory budget. Raises ValueError when the cutter isn't usable. Counts added modifiers.
+def boolean(targets, cutter, operation='DIFFERENCE', health='OFF', memory_budget_mb=0, memory_guard='CHUNK',
+            hide_cutter=True, undo_batch=None):
+    if cutter is None or cutter.type != 'MESH':
+        raise ValueError("The cutter must be a mesh object.")
+    name = f"Boolean {operation.title()}"
+    targets = [obj for obj in mesh_objects(targets) if obj != cutter]
+
+    usable, messages = gate_boolean_inputs([cutter] + targets, health, undo_batch)
+    if cutter not in usable:
+        raise ValueError(f"Cutter {cutter.name} rejected: {describe_health(check_mesh_health(cutter.data))}")
+
+    added = {}
+    for obj in usable:
+        if obj != cutter:
+            modifier = obj.modifiers.new(name=name, type='BOOLEAN')
+            modifier.operation = operation
+            modifier.object = cutter
+            added[obj] = [modifier]
+
+    if hide_cutter:
+        turn_into_wireframe(cutter)
+    removed, message = guard_added_modifiers(added, memory_budget_mb, memory_guard)
+    if message:
+        messages.append(message)
+    skipped = [obj for obj in targets if obj not in added or obj in removed]
+    return EasyOpsResult(targets, len(added) - len(removed), skipped, messages, {})
+
+# Decimate by ratio ('RATIO', adds a modifier where there is none), to a total triangle budget
+# ('BUDGET') or to a maximum surface deviation ('ERROR'). Counts objects.
+def decimate(objects, mode='RATIO', ratio=0.5, triangle_budget=1000000, tolerance=0.05, screen_size_weight=0.5,
+             max_deviation=0.01, decimate_type='COLLAPSE', precision=0.02):
+    objects = mesh_objects(objects)
+    if mode == 'BUDGET':
+        total = decimate_to_budget(bpy.context, objects, triangle_budget, tolerance, screen_size_weight)
+        return EasyOpsResult(objects, len(objects), [], [], {"triangles": total})
+    if mode == 'ERROR':
+        strengths = decimate_to_error(bpy.context, objects, max_deviation, decimate_type, precision)
+        return EasyOpsResult(objects, len(objects), [], [], {"strengths": strengths})
+
+    skipped = []
+    for obj in objects:
+        if any(mod.type == 'DECIMATE' for mod in obj.modifiers):
+            skipped.append(obj)
+        else:
+            add_decimate_modifier(obj, ratio)
+    return EasyOpsResult(objects, len(objects) - len(skipped), skipped, [], {})
+
+# Apply the boolean modifiers in dependency order, keeping the other modifiers, within the
+# memory budget. Counts applied objects; cyclic and over budget objects are skipped.
+def smart_apply(objects, use_cache=False, cache_size_mb=2048, memory_budget_mb=0, memory_guard='CHUNK',
+                undo_batch=None, stream=None):
+    objects = mesh_objects(objects)
+    kept = get_orphan_meshes()
+    estimates = {obj: estimate_bytes(estimate_object_counts(obj, lambda mod: mod.type == 'BOOLEAN')) for obj in objects}
+    accepted, deferred, refused = split_by_memory_budget(objects, estimates, memory_budget_mb)
+    if memory_guard == 'CHUNK':
+        accepted += deferred
+        deferred = []
+
+    # Levels are split into batches, and batches further to fit the memory budget
+    def chunks(level):
+        for batch in get_batches(level, stream):
+            yield from budget_chunks(batch, estimates, memory_budget_mb, kept)
+
+    applied, cyclic = apply_boolean_levels(bpy.context, accepted, use_cache, cache_size_mb, undo_batch, chunks)
+    over_budget = refused + deferred
+    messages = []
+    if cyclic:
+        names = ", ".join(obj.name for obj in cyclic[:5])
+        messages.append(f"skipped {len(cyclic)} objects with cyclic boolean dependencies: {names}")
+    if over_budget:
+        names = ", ".join(obj.name for obj in over_budget[:5])
+        messages.append(f"skipped {len(over_budget)} objects over the memory budget: {names}")
+    return EasyOpsResult(objects, applied, cyclic + over_budget, messages, {"cyclic": cyclic, "over_budget": over_budget})
+
+# Bake the modifier stacks into the meshes, keeping the originals for unfreeze. Counts frozen objects.
+def freeze(objects, use_cache=False, cache_size_mb=2048, stream=None):
+    objects = mesh_objects(objects)
+    count = 0
+    for batch in get_batches(objects, stream):
+        count += freeze_objects(bpy.context, batch, use_cache, cache_size_mb)
+    return EasyOpsResult(objects, count, [], [], {})
+
+# Restore frozen objects. Counts unfrozen objects.
+def unfreeze(objects):
+    objects = mesh_objects(objects)
+    return EasyOpsResult(objects, unfreeze_objects(objects), [], [], {})
+
+# Rename mesh objects and their meshes to prefix + a number, from the highest object down.
+# Counts renamed objects.
+def auto_rename(objects, prefix="EO-"):
+    objects = sorted(mesh_objects(objects), key=lambda obj: obj.location.z, reverse=True)
+    for n, obj in enumerate(objects, start=1):
+        obj.name = f"{prefix}{n}"
+        obj.data.name = f"{prefix}{n}"
+    return EasyOpsResult(objects, len(objects), [], [], {})
+
+# Mark edges sharp for flat shading: the selected edges (as stored in the mesh), or all edges
+# when selected_only is False. Counts marked edges.
+def flat_shading(items, selected_only=True, undo_batch=None, stream=None):
+    targets = get_api_meshes(items)
+    marked = 0
+    for batch in get_batches(targets, stream):
+        for mesh, owner in batch:
+            mask = np.ones(len(mesh.edges), dtype=bool)
+            if selected_only:
+                mesh.edges.foreach_get("select", mask)
+            if owner is not None:
+                snapshot_object(undo_batch, owner)
+            add_edge_flags(mesh, "use_edge_sharp", mask)
+            mesh.update()
+            marked += int(mask.sum())
+    return EasyOpsResult([mesh for mesh, _ in targets], marked, [], [], {})
+
+# Merge the objects into one new object with a balanced tree of boolean unions (at most chunk_size
+# pairs evaluated at once, None = a whole tree level), optionally pairing neighbours first, and hide
+# the sources. Raises ValueError with fewer than two mesh objects. Counts merged objects; the new
+# object is details["result"].
+def bulk_union(objects, solver='EXACT', spatial=True, chunk_size=None):
+    objects = mesh_objects(objects)
+    if len(objects) < 2:
+        raise ValueError("Bulk Union needs at least two mesh objects.")
+    if spatial:
+        objects = sort_objects_spatially(objects)
+
+    first = objects[0]
+    result = union_objects_balanced(bpy.context, objects, solver, chunk_size)
+    result.name = f"{first.name}_Union"
+    result.data.name = result.name
+    for collection in first.users_collection:
+        collection.objects.link(result)
+    for obj in objects:
+        obj.hide_set(True)
+        obj.hide_render = True
+    return EasyOpsResult(objects, len(objects), [], [], {"result": result})
+
+# Generate a chain of LOD objects per object, each decimated from the previous one. Levels are
+# ratios of the source triangle count ('RATIO') or triangle counts ('TRIANGLES'). Raises ValueError
+# when a level isn't positive. Counts LOD objects, which are details["lods"].
+def generate_lods(objects, levels=(1.0, 0.5, 0.25, 0.125), mode='RATIO', prefix="EO-", stream=None):
+    levels = list(levels)
+    if not levels or any(value <= 0.0 for value in levels):
+        raise ValueError("LOD levels must be a list of positive numbers.")
+    objects = mesh_objects(objects)
+    lods = []
+    for batch in get_batches(objects, stream):
+        lods.extend(generate_lod_chains(bpy.context, batch, levels, mode, prefix))
+    return EasyOpsResult(objects, len(lods), [], [], {"lods": lods})
+
+# Join objects into one object per grid cell, material set and collection. The joined source
+# objects are removed, so the result's objects are the new clusters. Counts joined source objects.
+def cluster_join(objects, cell_size=10.0, by_material=True, by_collection=True):
+    created, joined = cluster_join_objects(bpy.context, list(objects), cell_size, by_material, by_collection)
+    return EasyOpsResult(created, joined, [], [], {})
+
+# Restore the source objects of cluster objects made by cluster_join (other objects are ignored)
+# and remove the clusters, so the result's objects are the restored ones. Counts split clusters.
+def cluster_split(objects):
+    clusters = [obj for obj in mesh_objects(objects) if CLUSTER_MAP_KEY in obj.keys()]
+    restored = []
+    for cluster in clusters:
+        restored.extend(split_cluster(cluster))
+    return EasyOpsResult(restored, len(clusters), [], [], {})
+
+# --- Worker Service ---
+# A long running dispatcher keeps a pool of warm background Blender processes that loaded this
+# file once, and hands them jobs received as JSON lines on a local socket:
+#
+#     blender -b --factory-startup --python easy_utils_easyops.py -- --easyops-service --workers 4
+#
+# Requests: {"type": "job", "file": ..., "steps": [...] or "preset": ..., "settings": {...}, "output": ...},
+# {"type": "metrics"} and {"type": "shutdown"}. Each request gets one JSON line back.
+# Every request carries the "token" the service writes to a file only the current user can read,
+# so other local users can't submit jobs (the TCP fallback is open to every local process).
+
+# Workers print other output too, protocol lines are marked with this prefix
+SERVICE_PREFIX = "EASYOPS:"
+
+# Unix socket when the platform has them, localhost TCP otherwise
+if hasattr(socket, "AF_UNIX"):
+    SERVICE_DEFAULT_ADDRESS = os.path.join(tempfile.gettempdir(), "easyops.sock")
+else:
+    SERVICE_DEFAULT_ADDRESS = "127.0.0.1:47100"
+
+# "host:port" is a TCP address, anything else a Unix socket path
+def create_service_socket(address):
+    host, _, port = address.rpartition(":")
+    if port.isdigit():
+        return socket.socket(socket.AF_INET, socket.SOCK_STREAM), (host, int(port))
+    return socket.socket(socket.AF_UNIX, socket.SOCK_STREAM), address
+
+# The token file sits next to the socket, or in the (per-user on Windows) temp directory for TCP
+def get_service_token_path(address):
+    host, _, port = address.rpartition(":")
+    if port.isdigit():
+        return os.path.join(tempfile.gettempdir(), f"easyops-{port}.token")
+    return address + ".token"
+
+# Write a new token to a file created with owner-only permissions. A leftover file is removed
+# first, so the new one can't be a file someone else created.
+def write_service_token(address):
+    path = get_service_token_path(address)
+    if os.path.exists(path):
+        os.remove(path)
+    token = secrets.token_hex(32)
+    with os.fdopen(os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600), 'w') as token_file:
+        token_file.write(token)
+    return token
+
+def read_service_token(address):
+    with open(get_service_token_path(address), 'r') as token_file:
+        return token_file.read().strip()
+
+# Whether a service accepts connections on the address
+def is_service_running(address):
+    sock, target = create_service_socket(address)
+    with sock:
+        try:
+            sock.connect(target)
+        except OSError:
+            return False
+    return True
+
+# Send one request to the service and wait for its reply. The token is read from the service's token file.
+def submit_service_request(request, address=SERVICE_DEFAULT_ADDRESS):
+    request = {"token": read_service_token(address), **request}
+    sock, target = create_service_socket(address)
+    with sock:
+        sock.connect(target)
+        stream = sock.makefile('rw')
+        stream.write(json.dumps(request) + "\n")
+        stream.flush()
+        return json.loads(stream.readline())
+
+# Open the file, run the pipeline on all of its mesh objects and save it
+def run_service_job(job):
+    bpy.ops.wm.open_mainfile(filepath=job["file"])
+    props = bpy.context.scene.easy_utils_props
+    for name, value in job.get("settings", {}).items():
+        setattr(props, name, value)
+    if "preset" in job:
+        steps = load_pipeline_preset(job["preset"])
+    else:
+        steps = [step for step in job.get("steps", []) if step in PIPELINE_STEP_KINDS]
+
+    objects = [obj for obj in bpy.context.scene.objects if obj.type == 'MESH']
+    timings = run_pipeline(bpy.context, objects, steps, props)
+    bpy.ops.wm.save_as_mainfile(filepath=job.get("output") or job["file"])
+    return {"objects": len(objects), "timings": timings}
+
+def write_service_message(message):
+    sys.stdout.write(SERVICE_PREFIX + json.dumps(message) + "\n")
+    sys.stdout.flush()
+
+# Entry point of a warm worker: register once, then run jobs from stdin until it is closed
+def run_service_worker():
+    register()
+    write_service_message({"ready": True})
+    for line in sys.stdin:
+        job = json.loads(line)
+        start = time.perf_counter()
+        try:
+            reply = {"ok": True, **run_service_job(job)}
+        # A failing job must not take the warm worker down
+        except Exception as e:
+            reply = {"ok": False, "error": str(e)}
+        reply["seconds"] = time.perf_counter() - start
+        reply["memory"] = get_memory_usage()
+        write_service_message(reply)
+
+# Next protocol message of a worker, or None when it exited
+def read_service_message(process):
+    for line in process.stdout:
+        if line.startswith(SERVICE_PREFIX):
+            return json.loads(line[len(SERVICE_PREFIX):])
+    return None
+
+def start_service_worker():
+    process = subprocess.Popen(
+        [bpy.app.binary_path, "-b", "--factory-startup", "--python", os.path.abspath(__file__), "--", "--easyops-service-worker"],
+        stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, bufsize=1)
+    read_service_message(process)
+    return {"process": process, "jobs": 0}
+
+def stop_service_worker(worker):
+    process = worker["process"]
+    if process.poll() is None:
+        process.stdin.close()
+        try:
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+def percentile(values, fraction):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+# Queue depth, worker usage and latency (queue wait and total time per job, over the last 1000 jobs)
+def get_service_metrics(jobs, metrics):
+    latencies = list(metrics["latencies"])
+    waits = list(metrics["waits"])
+    return {
+        "queue_depth": jobs.qsize(),
+        "workers": metrics["workers"],
+        "busy": metrics["busy"],
+        "completed": metrics["completed"],
+        "failed": metrics["failed"],
+        "recycled": metrics["recycled"],
+        "latency_avg": sum(latencies) / len(latencies) if latencies else 0.0,
+        "latency_p50": percentile(latencies, 0.5),
+        "latency_p95": percentile(latencies, 0.95),
+        "wait_avg": sum(waits) / len(waits) if waits else 0.0,
+        "skipped": metrics["skipped"],
+    }
+
+# Journal parameters and output file of a service job. The input hash only matters when the
+# job writes a new file; jobs saving in place are recognized by the hash of their result.
+def get_service_job_params(job):
+    params = {key: job.get(key) for key in ("steps", "preset", "settings", "output")}
+    output = job.get("output") or job["file"]
+    if output != job["file"] and os.path.exists(job["file"]):
+        params["input"] = hash_file(job["file"])
+    return params, output
+
+# Run the dispatcher until a shutdown request. Every worker is recycled after `max_jobs` jobs,
+# when it reports more than `max_memory_mb` resident memory (0 disables), or when it dies.
+# With a journal, finished files are recorded and, when resuming, jobs whose output is still valid are skipped.
+def run_service(address=SERVICE_DEFAULT_ADDRESS, worker_count=4, max_jobs=50, max_memory_mb=0,
+                journal_path=None, resume=False):
+    jobs = queue.Queue()
+    lock = threading.Lock()
+    journal = open_journal(journal_path, resume) if journal_path else None
+    metrics = {"workers": worker_count, "busy": 0, "completed": 0, "failed": 0, "recycled": 0, "skipped": 0,
+               "latencies": deque(maxlen=1000), "waits": deque(maxlen=1000)}
+
+    def worker_loop():
+        worker = start_service_worker()
+        while True:
+            job, replies, queued_at, params = jobs.get()
+            if job is None:
+                break
+            with lock:
+                metrics["busy"] += 1
+                metrics["waits"].append(time.perf_counter() - queued_at)
+
+            try:
+                worker["process"].stdin.write(json.dumps(job) + "\n")
+                worker["process"].stdin.flush()
+                reply = read_service_message(worker["process"])
+            except OSError:
+                reply = None
+            worker["jobs"] += 1
+            if reply is None:
+                reply = {"ok": False, "error": "The worker exited while running the job."}
+            too_big = max_memory_mb and (reply.get("memory") or 0) > max_memory_mb * 1024 * 1024
+            if worker["process"].poll() is not None or worker["jobs"] >= max_jobs or too_big:
+                stop_service_worker(worker)
+                worker = start_service_worker()
+                with lock:
+                    metrics["recycled"] += 1
+
+            with lock:
+                metrics["busy"] -= 1
+                metrics["completed" if reply["ok"] else "failed"] += 1
+                metrics["latencies"].append(time.perf_counter() - queued_at)
+                if journal is not None and reply["ok"]:
+                    params, output = params
+                    record_journal(journal, "Service", job["file"], hash_file(output), params)
+            replies.put(reply)
+        stop_service_worker(worker)
+
+    server, target = create_service_socket(address)
+    if server.family != socket.AF_INET and os.path.exists(address):
+        # Only a stale socket file of a service that didn't shut down cleanly is replaced
+        if is_service_running(address):
+            server.close()
+            raise RuntimeError(f"An EasyOps service is already running on {address}.")
+        os.remove(address)
+    server.bind(target)
+    if server.family != socket.AF_INET:
+        os.chmod(address, 0o600)
+    server.listen()
+    token = write_service_token(address)
+    # The accept loop wakes up regularly to notice a shutdown request
+    server.settimeout(0.5)
+    stopping = threading.Event()
+
+    def handle_request(request):
+        if not isinstance(request, dict):
+            raise ValueError("a request must be a JSON object")
+        if not hmac.compare_digest(str(request.pop("token", "")), token):
+            raise PermissionError("missing or wrong token")
+        if request.get("type") == 'metrics':
+            with lock:
+                return get_service_metrics(jobs, metrics)
+        if request.get("type") == 'shutdown':
+            stopping.set()
+            return {"ok": True}
+        if not isinstance(request.get("file"), str):
+            raise ValueError("a job needs a \"file\" path")
+
+        params = get_service_job_params(request) if journal is not None else None
+        if params and os.path.exists(params[1]) and is_journaled(journal, "Service", request["file"], hash_file(params[1]), params[0]):
+            with lock:
+                metrics["skipped"] += 1
+            return {"ok": True, "skipped": True}
+        replies = queue.Queue(maxsize=1)
+        jobs.put((request, replies, time.perf_counter(), params))
+        return replies.get()
+
+    def handle_client(connection):
+        with connection:
+            stream = connection.makefile('rw')
+            for line in stream:
+                # A malformed request gets an error reply instead of ending the connection
+                try:
+                    reply = handle_request(json.loads(line))
+                except (ValueError, KeyError, TypeError, OSError) as error:
+                    with lock:
+                        metrics["failed"] += 1
+                    reply = {"ok": False, "error": f"Invalid request: {error}"}
+                stream.write(json.dumps(reply) + "\n")
+                stream.flush()
+
+    threads = [threading.Thread(target=worker_loop, daemon=True) for _ in range(worker_count)]
+    for thread in threads:
+        thread.start()
+    while not stopping.is_set():
+        try:
+            connection, _ = server.accept()
+        except socket.timeout:
+            continue
+        threading.Thread(target=handle_client, args=(connection,), daemon=True).start()
+    server.close()
+
+    for _ in threads:
+        jobs.put((None, None, None, None))
+    for thread in threads:
+        thread.join()
+    if journal is not None:
+        flush_journal(journal)
+    if server.family != socket.AF_INET and os.path.exists(address):
+        os.remove(address)
+    if os.path.exists(get_service_token_path(address)):
+        os.remove(get_service_token_path(address))
+
+def parse_service_args(argv):
+    parser = argparse.ArgumentParser(prog="easyops-service")
+    parser.add_argument("--easyops-service", action='store_true')
+    parser.add_argument("--address", default=SERVICE_DEFAULT_ADDRESS)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--max-jobs", type=int, default=50)
+    parser.add_argument("--max-memory", type=int, default=0, help="Recycle workers above this resident memory in MB")
+    parser.add_argument("--journal", default=None, help="Journal of finished files")
+    parser.add_argument("--resume", action='store_true', help="Skip files the journal lists as done")
+    return parser.parse_args(argv)
+
 # Register and Unregister Classes
 classes = [
+    EasyOpsPipelineStep,
     EasyUtilsProperties,
     EasyUtilsPanel,
     EasyOpsPanel,
     OBJECT_OT_easy_auto_rename,
     OBJECT_OT_easy_smart_uv_unwrap,
+    OBJECT_OT_easy_normalize_texel_density,
     OBJECT_OT_easy_shade_smooth,
     OBJECT_OT_easy_remove_doubles,
     OBJECT_OT_easy_bevel,
     OBJECT_OT_easy_boolean_difference,
     OBJECT_OT_easy_boolean_union,
     OBJECT_OT_easy_boolean_intersect,
+    OBJECT_OT_easy_boolean_union_bulk,
+    OBJECT_OT_easy_cluster_join,
+    OBJECT_OT_easy_cluster_split,
+    OBJECT_OT_easy_weld_seams,
     OBJECT_OT_easy_smart_decimate,
+    OBJECT_OT_easy_generate_lods,
     OBJECT_OT_easy_sharpen_edges,
     OBJECT_OT_easy_clean_geometry,
     OBJECT_OT_easy_smart_apply,
+    OBJECT_OT_easy_freeze,
+    OBJECT_OT_easy_unfreeze,
+    OBJECT_OT_easy_clear_geometry_cache,
     OBJECT_OT_easy_ssharpen,
+    OBJECT_OT_easy_weighted_normals,
+    OBJECT_OT_easy_revert_batch,
+    OBJECT_OT_easy_clear_journal,
+    EASYOPS_UL_pipeline_steps,
+    OBJECT_OT_easy_pipeline_add_step,
+    OBJECT_OT_easy_pipeline_remove_step,
+    OBJECT_OT_easy_pipeline_move_step,
+    OBJECT_OT_easy_pipeline_save_preset,
+    OBJECT_OT_easy_pipeline_load_preset,
+    OBJECT_OT_easy_run_pipeline,
+    EasyOpsPipelinePanel,
+    OBJECT_OT_easy_profile_modifiers,
+    OBJECT_OT_easy_profiler_select,
+    OBJECT_OT_easy_profiler_disable,
+    EasyOpsProfilerPanel,
 ]
 
 def register():
     for cls in classes:
         bpy.utils.register_class(cls)
     bpy.types.Scene.easy_utils_props = bpy.props.PointerProperty(type=EasyUtilsProperties)
+    bpy.app.handlers.depsgraph_update_post.append(easyops_depsgraph_update_post)
+    bpy.app.handlers.load_post.append(easyops_load_post)
+    bpy.app.handlers.save_pre.append(easyops_save_pre)
+    bpy.app.handlers.save_post.append(easyops_save_post)
 
 def unregister():
+    if easyops_depsgraph_update_post in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(easyops_depsgraph_update_post)
+    if easyops_load_post in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(easyops_load_post)
+    if bpy.app.timers.is_registered(sync_multi_modifier_fields):
+        bpy.app.timers.unregister(sync_multi_modifier_fields)
+    if easyops_save_pre in bpy.app.handlers.save_pre:
+        bpy.app.handlers.save_pre.remove(easyops_save_pre)
+    if easyops_save_post in bpy.app.handlers.save_post:
+        bpy.app.handlers.save_post.remove(easyops_save_post)
     for cls in classes:
         bpy.utils.unregister_class(cls)
     del bpy.types.Scene.easy_utils_props
 
 if __name__ == "__main__":
-    register()
+    # Background workers and the worker service run this file with: blender -b --python easy_utils_easyops.py -- <mode> ...
+    if "--easyops-uv-worker" in sys.argv:
+        job_dir, shard = sys.argv[sys.argv.index("--easyops-uv-worker") + 1:][:2]
+        run_uv_worker(job_dir, int(shard))
+    elif "--easyops-chunk-worker" in sys.argv:
+        job_dir, shard = sys.argv[sys.argv.index("--easyops-chunk-worker") + 1:][:2]
+        run_chunk_worker(job_dir, int(shard))
+    elif "--easyops-service-worker" in sys.argv:
+        run_service_worker()
+    elif "--easyops-service" in sys.argv:
+        args = parse_service_args(sys.argv[sys.argv.index("--") + 1:])
+        run_service(args.address, args.workers, args.max_jobs, args.max_memory, args.journal, args.resume)
+    else:
+        register()